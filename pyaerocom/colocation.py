@@ -30,6 +30,7 @@ from pyaerocom.helpers import (
 )
 from pyaerocom.time_resampler import TimeResampler
 from pyaerocom.tstype import TsType
+from pyaerocom.units_helpers import get_unit_conversion_fac
 from pyaerocom.variable import Variable
 
 logger = logging.getLogger(__name__)
@@ -573,6 +574,186 @@ def _colocate_site_data_helper_timecol(
     return pd.concat([obs_ts, grid_ts], axis=1, keys=["ref", "data"])
 
 
+def _check_batch_colocation(col_tst, resample_how, colocate_time, use_climatology_ref):
+    """
+    Check if all stations can be colocated at once
+
+    The batched colocation (:func:`_colocate_site_data_batch`) resamples
+    all stations on a common time axis. This yields the same results as
+    the per-station loop, as long as the output frequency is anchored (i.e.
+    has no multiplication factor) and all aggregators return NaN for empty
+    periods (which is not the case e.g. for sum).
+
+    Parameters
+    ----------
+    col_tst : TsType
+        colocation frequency
+    resample_how : str or dict, optional
+        aggregators used for resampling
+    colocate_time : bool
+        if True, the batched colocation is not available
+    use_climatology_ref : bool
+        if True, the batched colocation is not available
+
+    Returns
+    -------
+    bool
+        True if batched colocation can be used, else False
+    """
+    if colocate_time or use_climatology_ref or col_tst.mulfac != 1:
+        return False
+    if resample_how is None:
+        hows = [TimeResampler.DEFAULT_HOW]
+    elif isinstance(resample_how, str):
+        hows = [resample_how]
+    elif isinstance(resample_how, dict) and all(
+        isinstance(x, dict) for x in resample_how.values()
+    ):
+        hows = [how for x in resample_how.values() for how in x.values()]
+    else:
+        return False
+    return all(how in TimeResampler.AGGRS_UNIT_PRESERVE for how in hows)
+
+
+def _resample_stations_batch(
+    stats, var_name, ts_type, time_idx, resample_how, min_num_obs, conv_fac=1
+):
+    """
+    Resample timeseries of one variable in multiple StationData objects
+
+    Batched counterpart of :func:`StationData.resample_time`. Stations are
+    grouped by the frequency of their data and each group is resampled as
+    one (time x station) :class:`pandas.DataFrame`.
+
+    Parameters
+    ----------
+    stats : list
+        list of :class:`StationData` objects
+    var_name : str
+        variable to be resampled
+    ts_type : str
+        output frequency
+    time_idx : DatetimeIndex
+        output time index
+    resample_how : str or dict
+        aggregators used for resampling
+    min_num_obs : int or dict, optional
+        minimum number of observations for resampling of time
+    conv_fac : float
+        unit conversion factor applied before resampling
+
+    Returns
+    -------
+    ndarray
+        resampled data (time x station)
+    ndarray
+        boolean mask specifying which stations could be resampled
+    """
+    arr = np.full((len(time_idx), len(stats)), np.nan)
+    valid = np.ones(len(stats), dtype=bool)
+
+    groups = {}
+    for i, stat in enumerate(stats):
+        try:
+            from_ts_type = stat.get_var_ts_type(var_name)
+        except (MetaDataError, TemporalResolutionError):
+            from_ts_type = None
+            logger.warning(
+                f"Failed to access current temporal resolution of {var_name} data "
+                f"in StationData {stat.station_name}. "
+                f"No resampling constraints will be applied"
+            )
+        ts = stat.to_timeseries(var_name)
+        if ts.index.is_unique:
+            key = from_ts_type
+        else:  # cannot be aligned with other stations
+            key = (from_ts_type, i)
+        if not key in groups:
+            groups[key] = (from_ts_type, [], [])
+        groups[key][1].append(i)
+        groups[key][2].append(ts)
+
+    resampler = TimeResampler()
+    for from_ts_type, idx, timeseries in groups.values():
+        df = pd.concat(timeseries, axis=1, keys=range(len(idx)))
+        if conv_fac != 1:
+            df *= conv_fac
+        try:
+            df = resampler.resample(
+                to_ts_type=ts_type,
+                input_data=df,
+                from_ts_type=from_ts_type,
+                how=resample_how,
+                min_num_obs=min_num_obs,
+            )
+        except TemporalResolutionError as e:
+            for i in idx:
+                logger.warning(
+                    f"{var_name} data from site {stats[i].station_name} will "
+                    f"not be added to ColocatedData. Reason: {e}"
+                )
+            valid[idx] = False
+            continue
+        arr[:, idx] = df.reindex(time_idx).values
+    return arr, valid
+
+
+def _colocate_site_data_batch(
+    grid_stat_data,
+    obs_stat_data,
+    var,
+    var_ref,
+    ts_type,
+    time_idx,
+    resample_how,
+    min_num_obs,
+    grid_conv_fac=1,
+):
+    """
+    Colocate timeseries of all input stations at once
+
+    Batched counterpart of :func:`_colocate_site_data_helper`, used in
+    :func:`colocate_gridded_ungridded` if possible (cf.
+    :func:`_check_batch_colocation`).
+
+    Parameters
+    ----------
+    grid_stat_data : list
+        model timeseries for each station (:class:`StationData` objects)
+    obs_stat_data : list
+        corresponding observation timeseries (:class:`StationData` objects)
+    var : str
+        variable to be used from `grid_stat_data`
+    var_ref : str
+        variable to be used from `obs_stat_data`
+    ts_type : str
+        output frequency
+    time_idx : DatetimeIndex
+        output time index
+    resample_how : str or dict
+        aggregators used for resampling
+    min_num_obs : int or dict, optional
+        minimum number of observations for resampling of time
+    grid_conv_fac : float
+        unit conversion factor applied to model data
+
+    Returns
+    -------
+    ndarray
+        colocated data with shape (2, time, station), where first index
+        of first dimension is obs and second is model
+    """
+    arr = np.full((2, len(time_idx), len(obs_stat_data)), np.nan)
+    arr[0], obs_ok = _resample_stations_batch(
+        obs_stat_data, var_ref, ts_type, time_idx, resample_how, min_num_obs
+    )
+    arr[1], grid_ok = _resample_stations_batch(
+        grid_stat_data, var, ts_type, time_idx, resample_how, min_num_obs, grid_conv_fac
+    )
+    arr[:, :, ~(obs_ok & grid_ok)] = np.nan
+    return arr
+
+
 def colocate_gridded_ungridded(
     data,
     data_ref,
@@ -589,6 +770,8 @@ def colocate_gridded_ungridded(
     colocate_time=False,
     use_climatology_ref=False,
     resample_how=None,
+    batch_colocate=True,
+    chunksize=None,
     **kwargs,
 ):
     """Colocate gridded with ungridded data (low level method)
@@ -656,9 +839,20 @@ def colocate_gridded_ungridded(
         Default is "mean". Can also be a nested dictionary, e.g.
         resample_how={'daily': {'hourly' : 'max'}} would use the maximum value
         to aggregate from hourly to daily, rather than the mean.
+    batch_colocate : bool
+        if True, all stations are resampled and colocated at once, rather
+        than one after another. Only applies if supported by the input
+        settings (cf. :func:`_check_batch_colocation`), else the per-station
+        colocation is used. Defaults to True.
+    chunksize : int, optional
+        number of stations that are converted, extracted from the gridded
+        data and colocated at a time (cf.
+        :func:`UngriddedData.iter_station_data`). Limits peak memory usage
+        for large station networks. If None, all stations are processed at
+        once.
     **kwargs
         additional keyword args (passed to
-        :func:`UngriddedData.to_station_data_all`)
+        :func:`UngriddedData.iter_station_data`)
 
     Returns
     -------
@@ -749,34 +943,27 @@ def colocate_gridded_ungridded(
     data_ref = data_ref.filter_by_meta(latitude=lat_range, longitude=lon_range)
 
     # get timeseries from all stations in provided time resolution
-    # (time resampling is done below in main loop)
-    all_stats = data_ref.to_station_data_all(
-        vars_to_convert=var_ref, start=obs_start, stop=obs_stop, by_station_name=True, **kwargs
+    # (time resampling is done below in main loop). Stations are converted
+    # and colocated in chunks of size chunksize (all at once if None).
+    chunks = data_ref.iter_station_data(
+        vars_to_convert=var_ref,
+        start=obs_start,
+        stop=obs_stop,
+        by_station_name=True,
+        chunksize=chunksize,
+        **kwargs,
     )
 
-    obs_stat_data = all_stats["stats"]
-    ungridded_lons = all_stats["longitude"]
-    ungridded_lats = all_stats["latitude"]
-
-    if len(obs_stat_data) == 0:
-        raise VarNotAvailableError(
-            f"Variable {var_ref} is not available in specified time interval ({start}-{stop})"
-        )
-
-    grid_stat_data = data.to_time_series(longitude=ungridded_lons, latitude=ungridded_lats)
-
     pd_freq = col_tst.to_pandas_freq()
     time_idx = make_datetime_index(start, stop, pd_freq)
 
     time_num = len(time_idx)
-    stat_num = len(obs_stat_data)
-
-    arr = np.full((2, time_num, stat_num), np.nan)
 
-    lons = [np.nan] * stat_num
-    lats = [np.nan] * stat_num
-    alts = [np.nan] * stat_num
-    station_names = [""] * stat_num
+    arrs = []
+    lons = []
+    lats = []
+    alts = []
+    station_names = []
 
     data_ref_unit = None
     ts_type_src_ref = None
@@ -785,104 +972,150 @@ def colocate_gridded_ungridded(
     else:
         data_unit = None
 
-    # loop over all stations and append to colocated data object
-    for i, obs_stat in enumerate(obs_stat_data):
-        # Add coordinates to arrays required for xarray.DataArray below
-        lons[i] = obs_stat.longitude
-        lats[i] = obs_stat.latitude
-        alts[i] = obs_stat.altitude
-        station_names[i] = obs_stat.station_name
-
-        # ToDo: consider removing to keep ts_type_src_ref (this was probably
-        # introduced for EBAS were the original data frequency is not constant
-        # but can vary from site to site)
-        if ts_type_src_ref is None:
-            ts_type_src_ref = obs_stat["ts_type_src"]
-        elif obs_stat["ts_type_src"] != ts_type_src_ref:
-            spl = ts_type_src_ref.split(";")
-            if not obs_stat["ts_type_src"] in spl:
-                spl.append(obs_stat["ts_type_src"])
-            ts_type_src_ref = ";".join(spl)
-
-        if data_ref_unit is None:
-            try:
-                data_ref_unit = obs_stat["var_info"][var_ref]["units"]
-            except KeyError as e:  # variable information or unit is not defined
-                logger.exception(repr(e))
-        try:
-            unit = obs_stat["var_info"][var_ref]["units"]
-        except Exception:
-            unit = None
-        if not unit == data_ref_unit:
-            raise ValueError(
-                f"Cannot perform colocation. "
-                f"Ungridded data object contains different units ({var_ref})"
-            )
-        # get observations (Note: the index of the observation time series
-        # is already in the specified frequency format, and thus, does not
-        # need to be updated, for details (or if errors occur), cf.
-        # UngriddedData.to_station_data, where the conversion happens)
-
-        # get model station data
-        grid_stat = grid_stat_data[i]
-        if harmonise_units:
-            grid_unit = grid_stat.get_unit(var)
-            obs_unit = obs_stat.get_unit(var_ref)
-            if not grid_unit == obs_unit:
-                grid_stat.convert_unit(var, obs_unit)
-            if data_unit is None:
-                data_unit = obs_unit
+    use_batch = batch_colocate and _check_batch_colocation(
+        col_tst, resample_how, colocate_time, use_climatology_ref
+    )
+    grid_conv_fac = 1
 
-        try:
-            if colocate_time:
-                _df = _colocate_site_data_helper_timecol(
-                    stat_data=grid_stat,
-                    stat_data_ref=obs_stat,
-                    var=var,
-                    var_ref=var_ref,
-                    ts_type=col_freq,
-                    resample_how=resample_how,
-                    min_num_obs=min_num_obs,
-                    use_climatology_ref=use_climatology_ref,
-                )
-            else:
-                _df = _colocate_site_data_helper(
-                    stat_data=grid_stat,
-                    stat_data_ref=obs_stat,
-                    var=var,
-                    var_ref=var_ref,
-                    ts_type=col_freq,
-                    resample_how=resample_how,
-                    min_num_obs=min_num_obs,
-                    use_climatology_ref=use_climatology_ref,
+    for chunk in chunks:
+        obs_stat_data = chunk["stats"]
+        if len(obs_stat_data) == 0:
+            continue
+        is_first_chunk = len(arrs) == 0
+
+        grid_stat_data = data.to_time_series(
+            longitude=chunk["longitude"], latitude=chunk["latitude"]
+        )
+
+        arr = np.full((2, time_num, len(obs_stat_data)), np.nan)
+
+        # loop over all stations and append to colocated data object
+        for i, obs_stat in enumerate(obs_stat_data):
+            # Add coordinates to arrays required for xarray.DataArray below
+            lons.append(obs_stat.longitude)
+            lats.append(obs_stat.latitude)
+            alts.append(obs_stat.altitude)
+            station_names.append(obs_stat.station_name)
+
+            # ToDo: consider removing to keep ts_type_src_ref (this was probably
+            # introduced for EBAS were the original data frequency is not constant
+            # but can vary from site to site)
+            if ts_type_src_ref is None:
+                ts_type_src_ref = obs_stat["ts_type_src"]
+            elif obs_stat["ts_type_src"] != ts_type_src_ref:
+                spl = ts_type_src_ref.split(";")
+                if not obs_stat["ts_type_src"] in spl:
+                    spl.append(obs_stat["ts_type_src"])
+                ts_type_src_ref = ";".join(spl)
+
+            if data_ref_unit is None:
+                try:
+                    data_ref_unit = obs_stat["var_info"][var_ref]["units"]
+                except KeyError as e:  # variable information or unit is not defined
+                    logger.exception(repr(e))
+            try:
+                unit = obs_stat["var_info"][var_ref]["units"]
+            except Exception:
+                unit = None
+            if not unit == data_ref_unit:
+                raise ValueError(
+                    f"Cannot perform colocation. "
+                    f"Ungridded data object contains different units ({var_ref})"
                 )
+            # get observations (Note: the index of the observation time series
+            # is already in the specified frequency format, and thus, does not
+            # need to be updated, for details (or if errors occur), cf.
+            # UngriddedData.to_station_data, where the conversion happens)
+
+            # get model station data
+            grid_stat = grid_stat_data[i]
+            if harmonise_units:
+                grid_unit = grid_stat.get_unit(var)
+                obs_unit = obs_stat.get_unit(var_ref)
+                if use_batch:
+                    # obs units are the same for all stations (checked above)
+                    if is_first_chunk and i == 0 and not grid_unit == obs_unit:
+                        grid_conv_fac = get_unit_conversion_fac(
+                            grid_unit, obs_unit, var, grid_stat.get_var_ts_type(var)
+                        )
+                elif not grid_unit == obs_unit:
+                    grid_stat.convert_unit(var, obs_unit)
+                if data_unit is None:
+                    data_unit = obs_unit
+
+            if use_batch:  # colocation is done for all stations of chunk below
+                continue
 
-            # this try/except block was introduced on 23/2/2021 as temporary fix from
-            # v0.10.0 -> v0.10.1 as a result of multi-weekly obsdata (EBAS) that
-            # can end up resulting in incorrect number of timestamps after resampling
-            # (the error was discovered using EBASMC, concpm10, 2019 and colocation
-            # frequency monthly)
             try:
-                # assign the unified timeseries data to the colocated data array
-                arr[0, :, i] = _df["ref"].values
-                arr[1, :, i] = _df["data"].values
-            except ValueError:
+                if colocate_time:
+                    _df = _colocate_site_data_helper_timecol(
+                        stat_data=grid_stat,
+                        stat_data_ref=obs_stat,
+                        var=var,
+                        var_ref=var_ref,
+                        ts_type=col_freq,
+                        resample_how=resample_how,
+                        min_num_obs=min_num_obs,
+                        use_climatology_ref=use_climatology_ref,
+                    )
+                else:
+                    _df = _colocate_site_data_helper(
+                        stat_data=grid_stat,
+                        stat_data_ref=obs_stat,
+                        var=var,
+                        var_ref=var_ref,
+                        ts_type=col_freq,
+                        resample_how=resample_how,
+                        min_num_obs=min_num_obs,
+                        use_climatology_ref=use_climatology_ref,
+                    )
+
+                # this try/except block was introduced on 23/2/2021 as temporary fix from
+                # v0.10.0 -> v0.10.1 as a result of multi-weekly obsdata (EBAS) that
+                # can end up resulting in incorrect number of timestamps after resampling
+                # (the error was discovered using EBASMC, concpm10, 2019 and colocation
+                # frequency monthly)
                 try:
-                    mask = _df.index.intersection(time_idx)
-                    _df = _df.loc[mask]
+                    # assign the unified timeseries data to the colocated data array
                     arr[0, :, i] = _df["ref"].values
                     arr[1, :, i] = _df["data"].values
-                except ValueError as e:
-                    logger.warning(
-                        f"Failed to colocate time for station {obs_stat.station_name}. "
-                        f"This station will be skipped (error: {e})"
-                    )
-        except TemporalResolutionError as e:
-            # resolution of obsdata is too low
-            logger.warning(
-                f"{var_ref} data from site {obs_stat.station_name} will "
-                f"not be added to ColocatedData. Reason: {e}"
+                except ValueError:
+                    try:
+                        mask = _df.index.intersection(time_idx)
+                        _df = _df.loc[mask]
+                        arr[0, :, i] = _df["ref"].values
+                        arr[1, :, i] = _df["data"].values
+                    except ValueError as e:
+                        logger.warning(
+                            f"Failed to colocate time for station {obs_stat.station_name}. "
+                            f"This station will be skipped (error: {e})"
+                        )
+            except TemporalResolutionError as e:
+                # resolution of obsdata is too low
+                logger.warning(
+                    f"{var_ref} data from site {obs_stat.station_name} will "
+                    f"not be added to ColocatedData. Reason: {e}"
+                )
+        if use_batch:
+            arr = _colocate_site_data_batch(
+                grid_stat_data=grid_stat_data,
+                obs_stat_data=obs_stat_data,
+                var=var,
+                var_ref=var_ref,
+                ts_type=col_freq,
+                time_idx=time_idx,
+                resample_how=resample_how,
+                min_num_obs=min_num_obs,
+                grid_conv_fac=grid_conv_fac,
             )
+        arrs.append(arr)
+
+    if len(arrs) == 0:
+        raise VarNotAvailableError(
+            f"Variable {var_ref} is not available in specified time interval ({start}-{stop})"
+        )
+    arr = arrs[0] if len(arrs) == 1 else np.concatenate(arrs, axis=2)
+
     try:
         revision = data_ref.data_revision[dataset_ref]
     except Exception:
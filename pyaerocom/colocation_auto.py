@@ -5,7 +5,9 @@ import glob
 import logging
 import os
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from io import StringIO
 from pathlib import Path
 
 import pandas as pd
@@ -262,6 +264,12 @@ class ColocationSetup(BrowseDict):
         than output colocation frequency (e.g. monthly), then the datasets are
         first colocated in time (e.g. on a daily basis), before the monthly
         averages are calculated. Default is False.
+    station_chunksize : int, optional
+        number of observation stations that are processed at a time when
+        colocating with ungridded observations (cf.
+        :func:`colocate_gridded_ungridded`). Reduces peak memory usage for
+        large station networks. Default is None, in which case all stations
+        are processed at once.
     reanalyse_existing : bool
         if True, always redo co-location, even if there is already an existing
         co-located NetCDF file (under the output location specified by
@@ -271,6 +279,11 @@ class ColocationSetup(BrowseDict):
     raise_exceptions : bool
         if True, Exceptions that may occur for individual variables to be
         processed, are raised, else the analysis is skipped for such cases.
+    num_workers : int
+        number of processes used to colocate the individual model / obs
+        variable combinations in :func:`Colocator.run`. Default is 1, in which
+        case all combinations are processed one after another. Note that all
+        setup attributes need to be picklable if more than one worker is used.
     keep_data : bool
         if True, then all colocated data objects computed when running
         :func:`run` will be stored in :attr:`data`. Defaults to True.
@@ -382,10 +395,12 @@ class ColocationSetup(BrowseDict):
         self.harmonise_units = False
         self.regrid_res_deg = None
         self.colocate_time = False
+        self.station_chunksize = None
 
         self.reanalyse_existing = True
         self.raise_exceptions = False
         self.keep_data = True
+        self.num_workers = 1
 
         self.add_meta = {}
         self.update(**kwargs)
@@ -506,6 +521,19 @@ class Colocator(ColocationSetup):
         5: "NOT OK: Colocation failed",
     }
 
+    #: runtime attributes that are not passed on to worker processes
+    #: (cf. :func:`_get_worker_setup`)
+    RUNTIME_ATTRS = [
+        "_log",
+        "logging",
+        "_loaded_model_data",
+        "data",
+        "_processing_status",
+        "files_written",
+        "_model_reader",
+        "_obs_reader",
+    ]
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -788,23 +816,27 @@ class Colocator(ColocationSetup):
                 raise
             vars_to_process = {}
         self._print_coloc_info(vars_to_process)
-        for mod_var, obs_var in vars_to_process.items():
-            try:
-                coldata = self._run_helper(mod_var, obs_var)
+        if self.num_workers > 1 and len(vars_to_process) > 1:
+            results = self._run_parallel(vars_to_process)
+        else:
+            results = self._run_sequential(vars_to_process)
+        for mod_var, obs_var, coldata, error in results:
+            if error is None:
                 if not mod_var in data_out:
                     data_out[mod_var] = {}
                 data_out[mod_var][obs_var] = coldata
                 self._processing_status.append([mod_var, obs_var, 1])
-            except Exception:
-                msg = f"Failed to perform analysis: {traceback.format_exc()}\n"
+            else:
+                msg = f"Failed to perform analysis: {error}\n"
                 logger.warning(msg)
                 self._processing_status.append([mod_var, obs_var, 5])
                 self._write_log(msg)
                 if self.raise_exceptions:
+                    results.close()
                     self._print_processing_status()
                     self._write_log("ABORTED: raise_exceptions is True\n")
                     self._close_log()
-                    raise ColocationError(traceback.format_exc())
+                    raise ColocationError(error)
         self._write_log("Colocation finished")
         self._close_log()
         self._print_processing_status()
@@ -812,6 +844,81 @@ class Colocator(ColocationSetup):
             self.data = data_out
         return data_out
 
+    def _run_sequential(self, vars_to_process):
+        """
+        Colocate input variable combinations one after another
+
+        Parameters
+        ----------
+        vars_to_process : dict
+            model / obs variable combinations to be colocated.
+
+        Yields
+        ------
+        tuple
+            model variable, obs variable, colocated data object (None if
+            colocation failed) and traceback string (None if successful).
+        """
+        for mod_var, obs_var in vars_to_process.items():
+            try:
+                coldata = self._run_helper(mod_var, obs_var)
+            except Exception:
+                yield mod_var, obs_var, None, traceback.format_exc()
+            else:
+                yield mod_var, obs_var, coldata, None
+
+    def _run_parallel(self, vars_to_process):
+        """
+        Colocate input variable combinations using a process pool
+
+        Each combination is colocated in a new instance of this class
+        (cf. :func:`_run_helper_worker`), created from the current setup. Log
+        messages and files written in the workers are added to this object.
+
+        Parameters
+        ----------
+        vars_to_process : dict
+            model / obs variable combinations to be colocated.
+
+        Yields
+        ------
+        tuple
+            model variable, obs variable, colocated data object (None if
+            colocation failed) and traceback string (None if successful).
+        """
+        setup = self._get_worker_setup()
+        num_workers = min(self.num_workers, len(vars_to_process))
+        with ProcessPoolExecutor(max_workers=num_workers) as pool:
+            futures = {
+                pool.submit(_run_helper_worker, setup, mod_var, obs_var): (mod_var, obs_var)
+                for mod_var, obs_var in vars_to_process.items()
+            }
+            try:
+                # results are processed in input order to keep the log consistent
+                for future, (mod_var, obs_var) in futures.items():
+                    try:
+                        coldata, files_written, log, error = future.result()
+                    except Exception:  # e.g. setup could not be pickled
+                        coldata, files_written, log = None, [], ""
+                        error = traceback.format_exc()
+                    self.files_written.extend(files_written)
+                    self._write_log(log)
+                    yield mod_var, obs_var, coldata, error
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def _get_worker_setup(self):
+        """
+        Setup of this object used to create instances in worker processes
+
+        Returns
+        -------
+        dict
+            all attributes of this object, except for :attr:`RUNTIME_ATTRS`.
+        """
+        return {key: val for key, val in self.items() if not key in self.RUNTIME_ATTRS}
+
     def get_nc_files_in_coldatadir(self):
         """
         Get list of NetCDF files in colocated data directory
@@ -1384,7 +1491,10 @@ class Colocator(ColocationSetup):
         if self.obs_is_ungridded:
             ts_type = self._get_colocation_ts_type(model_data.ts_type)
             args.update(
-                ts_type=ts_type, var_ref=obs_var, use_climatology_ref=self.obs_use_climatology
+                ts_type=ts_type,
+                var_ref=obs_var,
+                use_climatology_ref=self.obs_use_climatology,
+                chunksize=self.station_chunksize,
             )
         else:
             ts_type = self._get_colocation_ts_type(model_data.ts_type, obs_data.ts_type)
@@ -1470,3 +1580,39 @@ class Colocator(ColocationSetup):
         if self._log is not None:
             self._log.close()
             self._log = None
+
+
+def _run_helper_worker(setup, model_var, obs_var):
+    """
+    Colocate one model / obs variable combination in a worker process
+
+    Used in :func:`Colocator._run_parallel`.
+
+    Parameters
+    ----------
+    setup : dict
+        colocation setup (cf. :func:`Colocator._get_worker_setup`)
+    model_var : str
+        model variable
+    obs_var : str
+        obs variable
+
+    Returns
+    -------
+    ColocatedData
+        colocated data object (None if colocation failed)
+    list
+        files written
+    str
+        log messages
+    str
+        traceback string if colocation failed, else None
+    """
+    col = Colocator(**setup)
+    col._log = StringIO()
+    try:
+        coldata = col._run_helper(model_var, obs_var)
+        error = None
+    except Exception:
+        coldata, error = None, traceback.format_exc()
+    return coldata, col.files_written, col._log.getvalue(), error
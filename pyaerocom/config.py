@@ -92,6 +92,42 @@ class Config:
     #: access, defaults to True
     EBAS_DB_LOCAL_CACHE = True
 
+    #: boolean specifying whether indexes for the requests made by
+    #: :class:`pyaerocom.io.ReadEbas` are added to the local copy of the EBAS DB
+    #: (cf. :attr:`EBAS_DB_LOCAL_CACHE`)
+    EBAS_DB_LOCAL_INDEXES = True
+
+    #: boolean specifying whether :class:`UngriddedData` objects use the
+    #: columnar storage backend (one typed array per data column, cf.
+    #: :class:`pyaerocom.ungridded_columnar.ColumnarArray`) by default.
+    #: This reduces memory consumption, at the expense of storing data values
+    #: in single precision
+    UNGRIDDED_COLUMNAR_STORAGE = False
+
+    #: number of processes used by reading classes of ungridded data to
+    #: parse data files in parallel (cf.
+    #: :func:`pyaerocom.io.readungriddedbase.ReadUngriddedBase.iter_read_files`).
+    #: If 1, files are read one after another
+    OBS_READ_NUM_WORKERS = 1
+
+    #: number of workers used to load and check the files of gridded data in
+    #: parallel (cf. :func:`pyaerocom.io.iris_io.load_cubes_custom`). If 1,
+    #: files are loaded one after another
+    GRID_READ_NUM_WORKERS = 1
+
+    #: boolean specifying whether gridded data files are loaded in a process
+    #: pool rather than a thread pool (only relevant if
+    #: :attr:`GRID_READ_NUM_WORKERS` is larger than 1). Ignored for iris
+    #: versions older than 3.5, which always use a process pool
+    GRID_READ_USE_PROCESSES = False
+
+    #: boolean specifying whether regridders used in
+    #: :func:`pyaerocom.griddeddata.GriddedData.regrid` (e.g. area weights) are
+    #: also stored in the cache directory (cf. :attr:`CACHEDIR`) and reused
+    #: across sessions (cf. :func:`pyaerocom.regridder_cache.get_regridder`).
+    #: They are always cached in memory
+    REGRID_CACHE_TO_DISK = False
+
     #: Lowest possible year in data
     MIN_YEAR = 0
     #: Highest possible year in data
@@ -24,6 +24,7 @@ from pyaerocom.exceptions import (
     VariableNotFoundError,
 )
 from pyaerocom.helpers import (
+    can_resample_time_ndarray,
     cftime_to_datetime64,
     check_coord_circular,
     copy_coords_cube,
@@ -36,12 +37,15 @@ from pyaerocom.helpers import (
     isnumeric,
     isrange,
     make_dummy_cube_latlon,
+    resample_time_ndarray,
     str_to_iris,
     to_pandas_timestamp,
 )
 from pyaerocom.helpers_landsea_masks import load_region_mask_iris
 from pyaerocom.mathutils import estimate_value_range, exponent
 from pyaerocom.region import Region
+from pyaerocom.regridder_cache import get_regridder
+from pyaerocom.station_sampler import get_station_sampler
 from pyaerocom.stationdata import StationData
 from pyaerocom.time_config import IRIS_AGGREGATORS, TS_TYPE_TO_NUMPY_FREQ
 from pyaerocom.time_resampler import TimeResampler
@@ -1099,7 +1103,9 @@ class GriddedData:
             coordinates (e.g. lon / lat) at which time series is supposed to be
             retrieved
         scheme : str or iris interpolator object
-            interpolation scheme (for details, see :func:`interpolate`)
+            interpolation scheme (for details, see :func:`interpolate`). For
+            2D fields, schemes "nearest" and "linear" are computed in NumPy
+            (cf. :mod:`pyaerocom.station_sampler`) unless `use_iris` is True.
         vert_scheme : str
             string specifying how to treat vertical coordinates. This is only
             relevant for data that contains vertical levels. It will be ignored
@@ -1199,10 +1205,28 @@ class GriddedData:
                 lon = vals
         if lat is None or lon is None:
             raise ValueError("Please provide latitude and longitude coords")
-        subset = extract_latlon_dataarray(arr, lat, lon, method=scheme, new_index_name="latlon")
-
-        lat_id = subset.attrs["lat_dimname"]
-        lon_id = subset.attrs["lon_dimname"]
+        if scheme in ("nearest", "linear"):
+            # index tables only depend on grid and station coordinates and
+            # are reused (e.g. for other variables of the same model)
+            sampler = get_station_sampler(
+                self.latitude.points,
+                self.longitude.points,
+                lat,
+                lon,
+                scheme=scheme,
+                lon_circular=scheme == "linear" and self.check_lon_circular(),
+            )
+            data_np = sampler.sample(arr.data)
+            lats = sampler.latitude
+            lons = sampler.longitude
+        else:
+            subset = extract_latlon_dataarray(
+                arr, lat, lon, method=scheme, new_index_name="latlon"
+            )
+            subset = subset.compute()
+            data_np = subset.data
+            lats = subset[subset.attrs["lat_dimname"]].data
+            lons = subset[subset.attrs["lon_dimname"]].data
         var = self.var_name
         times = self.time_stamps()
 
@@ -1218,11 +1242,7 @@ class GriddedData:
                     meta_glob[meta_key] = meta_val
 
         result = []
-        subset = subset.compute()
-        data_np = subset.data
-        lats = subset[lat_id].data
-        lons = subset[lon_id].data
-        for sidx in range(subset.shape[-1]):
+        for sidx in range(data_np.shape[-1]):
 
             data = StationData(
                 latitude=lats[sidx],
@@ -1683,6 +1703,71 @@ class GriddedData:
         data.check_dimcoords_tseries()
         return data
 
+    def _resample_time_numpy(self, to_ts_type, how, min_num_obs):
+        """Resample time dimension directly on the underlying data array
+
+        Alternative to :func:`_resample_time_xarray` that applies the
+        (hierarchical) resampling steps using
+        :func:`pyaerocom.helpers.resample_time_ndarray` and creates the output
+        cube from the resampled array, without converting to / from
+        :class:`xarray.DataArray`.
+
+        Raises
+        ------
+        NotImplementedError
+            if resampling is not supported for this object or input (e.g.
+            lazy data, weekly resolution, percentiles or non-standard
+            calendars)
+        """
+        cube = self.cube
+        if cube.has_lazy_data():
+            # the xarray based resampling keeps the data lazy (dask)
+            raise NotImplementedError("Lazy data is not supported")
+        tcoord = cube.coord("time")
+        tunit = tcoord.units
+        if not tunit.calendar in ("standard", "gregorian", "proleptic_gregorian"):
+            raise NotImplementedError(f"Calendar {tunit.calendar} is not supported")
+        rs = TimeResampler()
+        steps = rs.gen_resample_steps(
+            to_ts_type, from_ts_type=self.ts_type, how=how, min_num_obs=min_num_obs
+        )
+        for freq, _, rshow in steps:
+            if not can_resample_time_ndarray(freq, rshow):
+                raise NotImplementedError(f"Resampling to {freq} using {rshow} is not supported")
+        times = np.asarray(tunit.num2pydate(tcoord.points), dtype="datetime64[ns]")
+        if np.any(np.diff(times) < np.timedelta64(0)):
+            raise NotImplementedError("Time stamps are not sorted")
+
+        tdim = cube.coord_dims(tcoord)[0]
+        arr = cube.data
+        for freq, mno, rshow in steps:
+            arr, times = resample_time_ndarray(
+                arr, times, freq, how=rshow, min_num_obs=mno, axis=tdim
+            )
+
+        time = tcoord.copy(
+            points=tunit.date2num(times.astype("datetime64[us]").astype(object)), bounds=None
+        )
+        dim_coords = [(time, tdim)]
+        dim_coords.extend(
+            (coord.copy(), cube.coord_dims(coord))
+            for coord in cube.dim_coords
+            if cube.coord_dims(coord) != (tdim,)
+        )
+        aux_coords = [
+            (coord.copy(), cube.coord_dims(coord))
+            for coord in cube.aux_coords
+            if not tdim in cube.coord_dims(coord)
+        ]
+        cube_out = iris.cube.Cube(
+            np.ma.masked_invalid(arr),
+            dim_coords_and_dims=dim_coords,
+            aux_coords_and_dims=aux_coords,
+            **cube.metadata._asdict(),
+        )
+        data = GriddedData(cube_out, check_unit=False, convert_unit_on_init=False, **self.metadata)
+        return self._update_resampled_time(data, to_ts_type, how, rs)
+
     def _resample_time_xarray(self, to_ts_type, how, min_num_obs):
 
         arr = xr.DataArray.from_iris(self.cube)
@@ -1701,6 +1786,10 @@ class GriddedData:
         data = GriddedData(
             arr_out.to_iris(), check_unit=False, convert_unit_on_init=False, **self.metadata
         )
+        return self._update_resampled_time(data, to_ts_type, how, rs)
+
+    def _update_resampled_time(self, data, to_ts_type, how, rs):
+        """Update metadata and units of data resampled from this object"""
         data.metadata["ts_type"] = to_ts_type
         data.metadata.update(rs.last_setup)
         # in case of these aggregators, the data unit can be kept
@@ -1746,7 +1835,9 @@ class GriddedData:
             to require at least 6 hours per day and 7 days per month.
         use_iris : bool
             option to use resampling scheme from iris library rather than
-            xarray.
+            xarray. If False, resampling is done directly on the data array
+            where possible (cf. :func:`pyaerocom.helpers.resample_time_ndarray`),
+            else (e.g. for lazy data) using xarray.
 
         Returns
         -------
@@ -1764,6 +1855,10 @@ class GriddedData:
         if not self.has_time_dim:
             raise DataDimensionError(f"Require time dimension in GriddedData: {self.short_str()}")
         if not use_iris:
+            try:
+                return self._resample_time_numpy(to_ts_type, how, min_num_obs)
+            except NotImplementedError as e:
+                logger.info(f"Cannot resample time using numpy ({e}), using xarray instead")
             try:
                 data = self._resample_time_xarray(to_ts_type, how, min_num_obs)
             except NotImplementedError as e:
@@ -2227,6 +2322,12 @@ class GriddedData:
     ):
         """Regrid this grid to grid resolution of other grid
 
+        Note
+        ----
+        Regridders (e.g. area weights) are cached and reused for the same
+        scheme, source and target grid (cf.
+        :func:`pyaerocom.regridder_cache.get_regridder`).
+
         Parameters
         ----------
         other : GriddedData or Cube, optional
@@ -2283,7 +2384,9 @@ class GriddedData:
         other._check_lonlat_bounds()
         other.check_lon_circular()
 
-        data_rg = self.grid.regrid(other.grid, scheme)
+        # regridders (e.g. area weights) are reused for the same grids
+        regridder = get_regridder(scheme, self.grid, other.grid)
+        data_rg = regridder(self.grid)
 
         suppl = dict(**self.metadata)
         suppl["regridded"] = True
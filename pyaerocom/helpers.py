@@ -32,6 +32,7 @@ from pyaerocom.time_config import (
     PANDAS_RESAMPLE_OFFSETS,
     TS_TYPE_DATETIME_CONV,
     TS_TYPE_SECS,
+    TS_TYPE_TO_NUMPY_FREQ,
     TS_TYPE_TO_PANDAS_FREQ,
     day_units,
     hr_units,
@@ -47,6 +48,12 @@ logger = logging.getLogger(__name__)
 
 NUM_KEYS_META = ["longitude", "latitude", "altitude"]
 
+#: Aggregators supported by :func:`resample_time_ndarray`
+NDARRAY_RESAMPLE_HOWS = ("mean", "sum", "min", "max")
+
+#: Temporal resolutions supported by :func:`resample_time_ndarray`
+NDARRAY_RESAMPLE_TS_TYPES = ("minutely", "hourly", "daily", "monthly", "yearly")
+
 STR_TO_IRIS = dict(
     count=iris.analysis.COUNT,
     gmean=iris.analysis.GMEAN,
@@ -1061,8 +1068,9 @@ def resample_timeseries(ts, freq, how=None, min_num_obs=None):
 
     Parameters
     ----------
-    ts : Series
-        time series instance
+    ts : Series or DataFrame
+        time series instance (if DataFrame, each column is resampled
+        individually)
     freq : str
         new temporal resolution (can be pandas freq. string, or pyaerocom
         ts_type)
@@ -1079,7 +1087,7 @@ def resample_timeseries(ts, freq, how=None, min_num_obs=None):
 
     Returns
     -------
-    Series
+    Series or DataFrame
         resampled time series object
     """
     if how is None:
@@ -1095,9 +1103,12 @@ def resample_timeseries(ts, freq, how=None, min_num_obs=None):
     if min_num_obs is not None:
         numobs = resampler.count()
         # df = resampler.agg([how, 'count'])
-        invalid = numobs < min_num_obs
+        invalid = np.asarray(numobs < min_num_obs)
         if np.any(invalid):
-            data.values[invalid] = np.nan
+            if isinstance(data, pd.DataFrame):
+                data = data.mask(invalid)
+            else:
+                data.values[invalid] = np.nan
     if loffset is not None:
         data.index = data.index + pd.Timedelta(loffset)
     return data
@@ -1170,6 +1181,132 @@ def resample_time_dataarray(arr, freq, how=None, min_num_obs=None):
     return arr
 
 
+def can_resample_time_ndarray(freq, how):
+    """Check if resampling is supported by :func:`resample_time_ndarray`
+
+    Parameters
+    ----------
+    freq : str
+        new temporal resolution (can be pandas freq. string, or pyaerocom
+        ts_type)
+    how : str
+        how to aggregate (e.g. mean, median)
+
+    Returns
+    -------
+    bool
+        True, if resampling is supported, else False
+    """
+    if not how in NDARRAY_RESAMPLE_HOWS:
+        return False
+    try:
+        to = TsType(freq)
+    except Exception:
+        return False
+    return to.mulfac == 1 and to.base in NDARRAY_RESAMPLE_TS_TYPES
+
+
+def resample_time_ndarray(data, times, freq, how=None, min_num_obs=None, axis=0):
+    """Resample the time dimension of a :class:`numpy.ndarray`
+
+    Alternative to :func:`resample_time_dataarray` that reduces the time
+    dimension period by period (which requires the time stamps to be sorted),
+    without creating a :class:`xarray.DataArray` and without copying the
+    whole input array. The output time stamps are the same as in
+    :func:`resample_time_dataarray`, i.e. all periods between the first and
+    last time stamp are returned (NaN if there is no data in a period).
+
+    Note
+    ----
+    Only non-composite frequencies up to yearly (cf.
+    :attr:`NDARRAY_RESAMPLE_TS_TYPES`) and aggregators in
+    :attr:`NDARRAY_RESAMPLE_HOWS` are supported.
+
+    Parameters
+    ----------
+    data : ndarray
+        data array to be resampled, invalid values may be NaN or masked
+    times : ndarray
+        sorted time stamps (datetime64) of `data` along `axis`
+    freq : str
+        new temporal resolution (can be pandas freq. string, or pyaerocom
+        ts_type)
+    how : str
+        how to aggregate (e.g. mean, sum)
+    min_num_obs : int, optional
+        minimum number of observations required per period (when downsampling).
+        E.g. if input is in daily resolution and freq is monthly and
+        min_num_obs is 10, then all months that have less than 10 days of data
+        are set to nan.
+    axis : int
+        time axis of `data`
+
+    Returns
+    -------
+    ndarray
+        resampled data (invalid values are NaN)
+    ndarray
+        time stamps (datetime64[ns]) of resampled data
+
+    Raises
+    ------
+    NotImplementedError
+        if input frequency or aggregator is not supported
+    """
+    if how is None:
+        how = "mean"
+    if not can_resample_time_ndarray(freq, how):
+        raise NotImplementedError(
+            f"Resampling to {freq} using {how} is not available for numpy arrays"
+        )
+    to = TsType(freq)
+    unit = TS_TYPE_TO_NUMPY_FREQ[to.base]
+    _, loffset = _get_pandas_freq_and_loffset(to.to_pandas_freq())
+
+    periods = np.asarray(times, dtype="datetime64[ns]").astype(f"datetime64[{unit}]")
+    idx = (periods - periods[0]).astype(int)
+    if np.any(np.diff(idx) < 0):
+        raise ValueError("Time stamps need to be sorted for resampling")
+    num = idx[-1] + 1
+    # time stamps of each period are contiguous, index bounds along time axis
+    bounds = np.searchsorted(idx, np.arange(num + 1))
+
+    mask = np.ma.getmask(data)
+    data = np.ma.getdata(data)
+    dtype = data.dtype if np.issubdtype(data.dtype, np.floating) else float
+    shape = list(data.shape)
+    shape[axis] = num
+    out = np.full(shape, np.nan, dtype=dtype)
+    where = [slice(None)] * data.ndim
+    for i in range(num):
+        start, stop = bounds[i], bounds[i + 1]
+        if start == stop:  # no time stamps in period
+            continue
+        where[axis] = slice(start, stop)
+        vals = data[tuple(where)]
+        valid = ~np.isnan(vals)
+        if mask is not np.ma.nomask:
+            valid &= ~mask[tuple(where)]
+        numobs = valid.sum(axis=axis)
+        if how in ("min", "max"):
+            fun = np.fmin if how == "min" else np.fmax
+            result = fun.reduce(np.where(valid, vals, np.nan), axis=axis)
+        else:
+            result = np.where(valid, vals, 0).sum(axis=axis, dtype=np.float64)
+            if how == "mean":
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    result /= numobs
+        if min_num_obs is not None:
+            result = np.where(numobs < min_num_obs, np.nan, result)
+        where[axis] = i
+        out[tuple(where)] = result
+
+    times_out = (periods[0] + np.arange(num)).astype("datetime64[ns]")
+    if loffset is not None:
+        times_out = times_out + pd.Timedelta(loffset).to_timedelta64()
+    return out, times_out
+
+
 def same_meta_dict(meta1, meta2, ignore_keys=["PI"], num_keys=NUM_KEYS_META, num_rtol=1e-2):
     """Compare meta dictionaries
 
@@ -1,17 +1,60 @@
 """
 Caching class for reading and writing of ungridded data Cache objects
 """
+import copy
+import datetime
 import glob
+import hashlib
+import json
 import logging
 import os
 import pickle
+import uuid
+
+import numpy as np
+import pandas as pd
 
 from pyaerocom import const
 from pyaerocom.exceptions import CacheReadError, CacheWriteError
+from pyaerocom.ungridded_columnar import ColumnarArray
 from pyaerocom.ungriddeddata import UngriddedData
 
 logger = logging.getLogger(__name__)
 
+#: length of random token in file names of data arrays of a cache file
+_TOKEN_LEN = 12
+
+
+def _canonical_constraints(val):
+    """Convert reading constraints into JSON serialisable representation
+
+    Raises
+    ------
+    ValueError
+        if input contains values that do not have a stable representation
+    """
+    if val is None or isinstance(val, (str, bool, int, float)):
+        return val
+    elif isinstance(val, np.generic):
+        return _canonical_constraints(val.item())
+    elif isinstance(val, (list, tuple, np.ndarray)):
+        return [_canonical_constraints(x) for x in val]
+    elif isinstance(val, (set, frozenset)):
+        return sorted((_canonical_constraints(x) for x in val), key=repr)
+    elif isinstance(val, dict):
+        return {str(key): _canonical_constraints(x) for key, x in val.items()}
+    elif isinstance(val, (datetime.date, np.datetime64)):
+        return str(pd.Timestamp(val))
+    raise ValueError(f"Cannot derive cache key from reading constraint of type {type(val)}")
+
+
+class _ArrayRef:
+    """Placeholder for a data array that is stored in a separate .npy file"""
+
+    def __init__(self, file_name):
+        self.file_name = file_name
+
+
 # TODO: Write data attribute list contains_vars in header of pickled file and
 # check if variables match the request
 class CacheHandlerUngridded:
@@ -23,6 +66,19 @@ class CacheHandlerUngridded:
 
     e.g. EBASMC_scatc550aer.pkl
 
+    If reading constraints are assigned (cf. :attr:`read_constraints`), a
+    hash of the constraints is added to the file name, i.e.
+    <data_id>_<var>_<hash>.pkl
+
+    The pickle file contains the cache header and the :class:`UngriddedData`
+    object without its data array. The data array (or, for columnar
+    storage, each allocated column) is stored next to it as raw .npy file(s)
+    and memory-mapped when the cache file is loaded, so that loading is
+    fast, only data that is accessed is read from disk and processes on the
+    same machine share the file pages. Arrays are memory-mapped in
+    copy-on-write mode, i.e. the loaded object can be modified without
+    changing the cache files.
+
     Attributes
     ----------
     reader : ReadUngriddedBase
@@ -30,9 +86,12 @@ class CacheHandlerUngridded:
     loaded_data : dict
         dictionary containing successfully loaded instances of single variable
         :class:`UngriddedData` objects (keys are variable names)
+    read_constraints : dict, optional
+        additional reading constraints (keyword arguments passed to the
+        reader) that the cached data was read with.
     """
 
-    __version__ = "1.12"
+    __version__ = "1.14"
     #: Cache file header keys that are checked (and required unchanged) when
     #: reading a cache file
     CACHE_HEAD_KEYS = [
@@ -43,15 +102,42 @@ class CacheHandlerUngridded:
         "reader_version",
         "ungridded_data_version",
         "cacher_version",
+        "read_constraints",
     ]
 
-    def __init__(self, reader=None, cache_dir=None, **kwargs):
+    def __init__(self, reader=None, cache_dir=None, read_constraints=None, **kwargs):
         self._reader = None
         if reader is not None:
             self.reader = reader
 
         self.loaded_data = {}
         self._cache_dir = cache_dir
+        self._constraints_key = None
+        self.read_constraints = read_constraints
+
+    @property
+    def read_constraints(self):
+        """Reading constraints of cached data (dict or None)"""
+        return self._read_constraints
+
+    @read_constraints.setter
+    def read_constraints(self, val):
+        if val is not None and not isinstance(val, dict):
+            raise ValueError(f"Invalid input for read_constraints, need dict, got {type(val)}")
+        elif not val:
+            key = None
+        else:
+            key = json.dumps(_canonical_constraints(val), sort_keys=True)
+        self._read_constraints = val
+        self._constraints_key = key
+        self.loaded_data = {}
+
+    @property
+    def constraints_hash(self):
+        """Hash of reading constraints used in cache file names (or None)"""
+        if self._constraints_key is None:
+            return None
+        return hashlib.sha256(self._constraints_key.encode()).hexdigest()[:16]
 
     @property
     def reader(self):
@@ -110,6 +196,8 @@ class CacheHandlerUngridded:
             file name of pickle file
         """
         name = "_".join([self.data_id, var_name])
+        if self.constraints_hash is not None:
+            name = f"{name}_{self.constraints_hash}"
         return name + ".pkl"
 
     def file_path(self, var_or_file_name, cache_dir=None):
@@ -181,6 +269,7 @@ class CacheHandlerUngridded:
         current["reader_version"] = reader_ver
         current["ungridded_data_version"] = UngriddedData.__version__
         current["cacher_version"] = self.__version__
+        current["read_constraints"] = self._constraints_key
         return current
 
     def check_and_load(self, var_or_file_name, force_use_outdated=False, cache_dir=None):
@@ -256,16 +345,28 @@ class CacheHandlerUngridded:
             in_handle.close()
             if delete_existing:  # something was wrong
                 logger.info(f"Deleting outdated cache file: {fp}")
-                os.remove(fp)
+                self._remove_cache_file(fp)
             return False
 
         # everything is okay
-        data = pickle.load(in_handle)
+        try:
+            data = pickle.load(in_handle)
+        finally:
+            in_handle.close()
         if not isinstance(data, UngriddedData):
             raise TypeError(
                 f"Unexpected data type stored in cache file, need instance of UngriddedData, "
                 f"got {type(data)}"
             )
+        try:
+            self._load_arrays(data, os.path.dirname(fp))
+        except (OSError, ValueError) as e:
+            logger.warning(
+                f"Failed to load data arrays of cache file {fp}. "
+                f"File will be removed and data reloaded. Error: {repr(e)}"
+            )
+            self._remove_cache_file(fp)
+            return False
 
         self.loaded_data[var_or_file_name] = data
         logger.info(f"Successfully loaded cache file {fp}")
@@ -275,13 +376,98 @@ class CacheHandlerUngridded:
         """
         Deletes all pickled data objects in cache directory
 
-        If not set differently, the cache directory is the pyaerocom default,
-        accessible via :attr:`pyaerocom.const.CACHEDIR`.
+        This includes their data array files (.npy), also those of cache
+        files that were not written completely. If not set differently, the
+        cache directory is the pyaerocom default, accessible via
+        :attr:`pyaerocom.const.CACHEDIR`.
 
         """
         for fp in glob.glob(f"{self.cache_dir}/*.pkl"):
-            os.remove(fp)
+            self._remove_cache_file(fp)
             logger.info(f"Deleted {fp}")
+        for fp in glob.glob(f"{self.cache_dir}/*.{'?' * _TOKEN_LEN}.*.npy"):
+            try:
+                os.remove(fp)
+            except OSError:  # e.g. removed by another process
+                continue
+            logger.info(f"Deleted {fp}")
+
+    @staticmethod
+    def _array_files(fp):
+        """Data array files (.npy) belonging to cache file"""
+        stem = os.path.splitext(fp)[0]
+        return glob.glob(f"{glob.escape(stem)}.{'?' * _TOKEN_LEN}.*.npy")
+
+    def _remove_cache_file(self, fp, keep=None):
+        """Remove cache file and its data array files
+
+        Parameters
+        ----------
+        fp : str
+            cache file path
+        keep : list, optional
+            data array files that are not supposed to be removed, if this is
+            provided, only the outdated data array files are removed and the
+            cache file itself is kept.
+        """
+        if keep is None:
+            keep = []
+            if os.path.exists(fp):
+                os.remove(fp)
+        for array_fp in self._array_files(fp):
+            if not os.path.basename(array_fp) in keep:
+                try:
+                    os.remove(array_fp)
+                except OSError:  # e.g. removed by another process
+                    pass
+
+    @staticmethod
+    def _split_arrays(data, stem):
+        """Separate data arrays from input data object
+
+        Returns
+        -------
+        UngriddedData
+            shallow copy of input data where the data arrays are replaced
+            with :class:`_ArrayRef` objects
+        dict
+            data arrays to be written (keys are file names)
+        """
+        token = uuid.uuid4().hex[:_TOKEN_LEN]
+        arrays = {}
+
+        def _ref(key, arr):
+            file_name = f"{stem}.{token}.{key}.npy"
+            arrays[file_name] = arr
+            return _ArrayRef(file_name)
+
+        obj = copy.copy(data)
+        # the metadata table is cheap to recreate from the metadata
+        obj._meta_table = None
+        if data.is_columnar:
+            columns = copy.copy(data._data)
+            columns._columns = [
+                None if col is None else _ref(f"col{i}", col)
+                for i, col in enumerate(data._data._columns)
+            ]
+            obj._data = columns
+        else:
+            obj._data = _ref("data", np.asarray(data._data))
+        return obj, arrays
+
+    @staticmethod
+    def _load_arrays(data, cache_dir):
+        """Memory-map data arrays into data object loaded from cache file"""
+
+        def _load(ref):
+            if not isinstance(ref, _ArrayRef):
+                return ref
+            return np.load(os.path.join(cache_dir, ref.file_name), mmap_mode="c")
+
+        if isinstance(data._data, ColumnarArray):
+            data._data._columns = [_load(col) for col in data._data._columns]
+        else:
+            data._data = _load(data._data)
 
     def write(self, data, var_or_file_name=None, cache_dir=None):
         """Write single-variable instance of UngriddedData to cache
@@ -336,24 +522,46 @@ class CacheHandlerUngridded:
 
         fp = self.file_path(var_or_file_name, cache_dir=cache_dir)
         logger.info(f"Writing cache file: {fp}")
-        success = True
-        # OutHandle = gzip.open(c__cache_file, 'wb') # takes too much time
-        out_handle = open(fp, "wb")
+        obj, arrays = self._split_arrays(data, os.path.basename(os.path.splitext(fp)[0]))
 
+        # all files are written to temporary files first and then moved into
+        # place (data arrays first), so that concurrent readers never see
+        # incomplete cache files
+        out_dir = os.path.dirname(fp)
+        tmp_files = []
+        success = True
         try:
-            # write cache header
-            pickle.dump(meta, out_handle, pickle.HIGHEST_PROTOCOL)
-            # write data
-            pickle.dump(data, out_handle, pickle.HIGHEST_PROTOCOL)
-
+            for file_name, arr in arrays.items():
+                tmp_fp = os.path.join(out_dir, f"{file_name}.tmp")
+                tmp_files.append(tmp_fp)
+                with open(tmp_fp, "wb") as out_handle:
+                    np.save(out_handle, arr, allow_pickle=False)
+                os.replace(tmp_fp, os.path.join(out_dir, file_name))
+
+            tmp_fp = f"{fp}.{os.getpid()}.tmp"
+            tmp_files.append(tmp_fp)
+            with open(tmp_fp, "wb") as out_handle:
+                # write cache header
+                pickle.dump(meta, out_handle, pickle.HIGHEST_PROTOCOL)
+                # write data object (without data arrays)
+                pickle.dump(obj, out_handle, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_fp, fp)
         except Exception as e:
             logger.exception(f"Failed to write cache: {repr(e)}")
             success = False
         finally:
-            out_handle.close()
-            if not success:
-                os.remove(fp)
-        logger.info(f"Wrote: {fp}")
+            for tmp_fp in tmp_files:
+                if os.path.exists(tmp_fp):
+                    os.remove(tmp_fp)
+        if success:
+            # remove data arrays of previous versions of this cache file
+            self._remove_cache_file(fp, keep=list(arrays))
+            logger.info(f"Wrote: {fp}")
+        else:
+            for file_name in arrays:
+                array_fp = os.path.join(out_dir, file_name)
+                if os.path.exists(array_fp):
+                    os.remove(array_fp)
         return fp
 
     def __str__(self):
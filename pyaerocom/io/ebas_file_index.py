@@ -1,11 +1,66 @@
 import logging
 import os
 import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+import numpy as np
 
 from pyaerocom._lowlevel_helpers import BrowseDict
 
 logger = logging.getLogger(__name__)
 
+#: Size (in bytes) of memory map used for reading EBAS sqlite database files
+MMAP_SIZE = 256 * 1024**2
+
+#: Open read-only database connections, cf. :func:`_get_connection`
+_CONNECTIONS = {}
+
+
+def _get_connection(database):
+    """Get read-only connection to sqlite database file
+
+    The connection is opened once per process and database file and is
+    reused until the file is modified (i.e. its size or modification time
+    changes).
+
+    Parameters
+    ----------
+    database : str
+        path to sqlite database file
+
+    Returns
+    -------
+    sqlite3.Connection
+        read-only connection to database
+    """
+    stat = os.stat(database)
+    key = (os.getpid(), os.path.abspath(database))
+    signature = (stat.st_size, stat.st_mtime_ns)
+    if key in _CONNECTIONS:
+        con, sig = _CONNECTIONS.pop(key)
+        if sig == signature:
+            _CONNECTIONS[key] = (con, sig)
+            return con
+        con.close()
+    # the file is not changed while it is open (otherwise a new connection is
+    # opened, see above), hence file locking can be skipped (immutable)
+    uri = f"{Path(database).absolute().as_uri()}?mode=ro&immutable=1"
+    con = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=256)
+    con.execute(f"pragma mmap_size={MMAP_SIZE}")
+    _CONNECTIONS[key] = (con, signature)
+    return con
+
+
+def _to_sql_param(value):
+    """Convert numpy scalars to Python scalars
+
+    sqlite3 cannot compare numpy scalars (e.g. numpy.int64 is bound as BLOB)
+    """
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
 
 class EbasSQLRequest(BrowseDict):
     """Low level dictionary like object for EBAS sqlite queries
@@ -97,6 +152,14 @@ class EbasSQLRequest(BrowseDict):
             return f"('{var}')"
         raise ValueError("Invalid value...")
 
+    @staticmethod
+    def _var2params(var):
+        if isinstance(var, str):
+            return (var,)
+        elif isinstance(var, (list, tuple)):
+            return tuple(var)
+        raise ValueError("Invalid value...")
+
     def make_file_query_str(self, distinct=True, **kwargs):
         """Wrapper for base method :func:`make_query_str`
 
@@ -113,12 +176,35 @@ class EbasSQLRequest(BrowseDict):
             SQL file request command for current specs
         """
         query = self.make_query_str(distinct=distinct, **kwargs)
+        return self._add_file_query_filter(query)
+
+    def make_file_query(self, distinct=True, **kwargs):
+        """Wrapper for base method :func:`make_query`
+
+        Parameters
+        ----------
+        distinct : bool
+            return unique files
+        **kwargs
+            update request attributes (e.g. ``lon_range=(30, 60)``)
+
+        Returns
+        -------
+        str
+            parameterized SQL file request command for current specs
+        tuple
+            query parameters
+        """
+        query, params = self.make_query(distinct=distinct, **kwargs)
+        return self._add_file_query_filter(query), params
+
+    @staticmethod
+    def _add_file_query_filter(query):
         # add an extsion to get only files that have no fraction variables in them
-        query = query.replace(
+        return query.replace(
             ";",
             " and not exists (select * from characteristic where var_id=variable.var_id and ct_type='Fraction');",
         )
-        return query
 
     def make_query_str(self, what=None, distinct=True, **kwargs):
         """Translate current class state into SQL query command string
@@ -138,6 +224,36 @@ class EbasSQLRequest(BrowseDict):
         str
             SQL file request command for current specs
         """
+        return self._make_query(what, distinct, False, **kwargs)[0]
+
+    def make_query(self, what=None, distinct=True, **kwargs):
+        """Translate current class state into parameterized SQL query
+
+        Same as :func:`make_query_str`, but all values of the request are
+        passed as query parameters. Hence, the query string only depends on
+        the specified constraints (and on the number of values provided for
+        each of them) which enables reuse of prepared statements.
+
+        Parameters
+        ----------
+        what : str or tuple, optional
+            what columns to retrieve (e.g. comp_name for all variables) from
+            table specified. Defaults to None, in which case "filename" is used
+        distinct : bool
+            return unique files
+        **kwargs
+            update request attributes (e.g. ``lon_range=(30, 60)``)
+
+        Returns
+        -------
+        str
+            parameterized SQL request command for current specs
+        tuple
+            query parameters
+        """
+        return self._make_query(what, distinct, True, **kwargs)
+
+    def _make_query(self, what, distinct, parameterized, **kwargs):
         self.update(**kwargs)
         if what is None:
             what = "filename"
@@ -149,57 +265,58 @@ class EbasSQLRequest(BrowseDict):
         else:
             req = f"select {what} from variable"
         req += " join station on station.station_code=variable.station_code"
-        add_cond = 0
+
+        conditions = []
+        params = []
+
+        def add_in(col, values):
+            if parameterized:
+                values = tuple(_to_sql_param(val) for val in self._var2params(values))
+                conditions.append(f"{col} in ({','.join('?' * len(values))})")
+                params.extend(values)
+            else:
+                conditions.append(f"{col} in {self._var2sql(values)}")
+
+        def add_compare(col, op, value, quoted=False):
+            if parameterized:
+                conditions.append(f"{col}{op}?")
+                params.append(str(value) if quoted else _to_sql_param(value))
+            else:
+                conditions.append(f"{col}{op}'{value}'" if quoted else f"{col}{op}{value}")
+
         # add constraints from station table
-        conv = self._var2sql
         if self.station_names is not None:
-            req += f" where station_name in {conv(self.station_names)}"
-            add_cond += 1
+            add_in("station_name", self.station_names)
         if self.altitude_range is not None:
             low, high = self.altitude_range
-            req += " and " if add_cond else " where "
-            req += f"station_altitude>{low} and station_altitude<{high}"
-            add_cond += 1
+            add_compare("station_altitude", ">", low)
+            add_compare("station_altitude", "<", high)
         if self.lon_range is not None:
             l, r = self.lon_range
-            req += " and " if add_cond else " where "
-            req += f"station_longitude>{l} and station_longitude<{r}"
-            add_cond += 1
+            add_compare("station_longitude", ">", l)
+            add_compare("station_longitude", "<", r)
         if self.lat_range is not None:
             s, n = self.lat_range
-            req += " and " if add_cond else " where "
-            req += f"station_latitude>{s} and station_latitude<{n}"
-            add_cond += 1
+            add_compare("station_latitude", ">", s)
+            add_compare("station_latitude", "<", n)
         if self.instrument_types is not None:
-            req += " and " if add_cond else " where "
-            req += f"instr_type in {conv(self.instrument_types)}"
-            add_cond += 1
+            add_in("instr_type", self.instrument_types)
         # add constraints from variable table
         if self.variables is not None:
-            req += " and " if add_cond else " where "
-            req += f"comp_name in {conv(self.variables)}"
-            add_cond += 1
+            add_in("comp_name", self.variables)
         if self.stop_date is not None:
-            req += " and " if add_cond else " where "
-            req += f"first_end < '{self.stop_date}'"
-            add_cond += 1
+            add_compare("first_end", " < ", self.stop_date, quoted=True)
         if self.start_date is not None:
-            req += " and " if add_cond else " where "
-            req += f"last_start > '{self.start_date}'"
-            add_cond += 1
+            add_compare("last_start", " > ", self.start_date, quoted=True)
         if self.matrices is not None:
-            req += " and " if add_cond else " where "
-            req += f"matrix in {conv(self.matrices)}"
-            add_cond += 1
+            add_in("matrix", self.matrices)
         if self.statistics is not None:
-            req += " and " if add_cond else " where "
-            req += f"statistics in {conv(self.statistics)}"
-            add_cond += 1
+            add_in("statistics", self.statistics)
         if self.datalevel is not None:
-            req += " and " if add_cond else " where "
-            req += f"datalevel={self.datalevel}"
-            add_cond += 1
-        return req + ";"
+            add_compare("datalevel", "=", self.datalevel)
+        if conditions:
+            req += " where " + " and ".join(conditions)
+        return req + ";", tuple(params)
 
     def __str__(self):
         head = f"Pyaerocom {type(self).__name__}"
@@ -216,6 +333,13 @@ class EbasFileIndex:
     Takes care of connection to database and execution of requests
     """
 
+    #: Indexes created by :func:`create_indexes` (name: table and columns)
+    INDEXES = {
+        "pya_variable_comp_name": "variable(comp_name, matrix, statistics, station_code)",
+        "pya_station_station_name": "station(station_name, station_code)",
+        "pya_characteristic_var_id": "characteristic(var_id, ct_type)",
+    }
+
     def __init__(self, database=None):
         self._database = database
 
@@ -230,6 +354,24 @@ class EbasFileIndex:
             )
         return db
 
+    @property
+    def con(self):
+        """Read-only connection to database (shared within process)"""
+        return _get_connection(self.database)
+
+    def create_indexes(self):
+        """Create indexes that speed up the requests made when reading data
+
+        Note
+        ----
+        This modifies the database file and is supposed to be applied to a
+        local copy of the database only.
+        """
+        with closing(sqlite3.connect(self.database)) as con:
+            with con:
+                for name, index in self.INDEXES.items():
+                    con.execute(f"create index if not exists {name} on {index}")
+
     @property
     def ALL_STATION_NAMES(self):
         """List of all available station names in database"""
@@ -287,13 +429,10 @@ class EbasFileIndex:
     def get_table_columns(self, table_name):
         """Get all columns of a table in SQLite database file"""
         req = f"select * from {table_name} where 1=0;"
-        with sqlite3.connect(self.database) as con:
-            cur = con.cursor()
-            cur.execute(req)
-            return [f[0] for f in cur.description]
+        return [f[0] for f in self.con.execute(req).description]
 
     def execute_request(self, request, file_request=False):
-        """Connect to database and retrieve data for input request
+        """Retrieve data for input request from database
 
         Parameters
         ----------
@@ -309,20 +448,18 @@ class EbasFileIndex:
             :func:`make_query_str` using argument ``what``)
 
         """
+        params = ()
         if isinstance(request, str):
             sql_str = request
         elif isinstance(request, EbasSQLRequest):
             if not file_request:
-                sql_str = request.make_query_str()
+                sql_str, params = request.make_query()
             else:
-                sql_str = request.make_file_query_str()
+                sql_str, params = request.make_file_query()
         else:
             raise ValueError(f"Unsupported request type {type(request)}")
 
-        with sqlite3.connect(self.database) as con:
-            cur = con.cursor()
-            cur.execute(sql_str)
-            return [f for f in cur.fetchall()]
+        return self.con.execute(sql_str, params).fetchall()
 
     def get_file_names(self, request):
         """Get all files that match the request specifications
@@ -0,0 +1,77 @@
+"""
+Persistent cache for parsed headers of EBAS NASA Ames files
+"""
+import logging
+import os
+
+from pyaerocom.io.sqlite_cache import SqliteCache
+
+logger = logging.getLogger(__name__)
+
+
+class EbasHeaderCache(SqliteCache):
+    """SQLite based cache for parsed headers of EBAS NASA Ames files
+
+    Stores the header information of a file (cf.
+    :func:`EbasNasaAmesFile.get_header_state`) under its absolute path,
+    together with the size and modification time of the file. Entries are
+    only returned if the file has not changed since, otherwise they are
+    overwritten when the header is parsed again (cf. :class:`SqliteCache`).
+
+    Parameters
+    ----------
+    database : str
+        path to sqlite database file (is created if it does not exist)
+    """
+
+    #: Version of cached header format. Entries with a different version
+    #: are ignored
+    __version__ = "2"
+
+    TABLE = "header"
+    KEY_COLUMN = "file"
+    CHECK_COLUMNS = (("size", "integer"), ("mtime", "integer"))
+    VALUE_COLUMN = "header"
+
+    @staticmethod
+    def _file_info(file):
+        stat = os.stat(file)
+        return os.path.abspath(file), (stat.st_size, stat.st_mtime_ns)
+
+    def get(self, file):
+        """Get cached header of file
+
+        Parameters
+        ----------
+        file : str
+            path of NASA Ames file
+
+        Returns
+        -------
+        dict or None
+            cached header information or None if the file is not in the
+            cache or has been modified since it was cached
+        """
+        try:
+            path, checks = self._file_info(file)
+        except OSError as e:
+            logger.warning(f"Failed to access EBAS header cache for {file}: {repr(e)}")
+            return None
+        return super().get(path, checks)
+
+    def put(self, file, header):
+        """Add or update cached header of file
+
+        Parameters
+        ----------
+        file : str
+            path of NASA Ames file
+        header : dict
+            header information of file
+        """
+        try:
+            path, checks = self._file_info(file)
+        except OSError as e:
+            logger.warning(f"Failed to update EBAS header cache for {file}: {repr(e)}")
+            return
+        super().put(path, header, checks)
@@ -4,6 +4,7 @@ Pyearocom module for reading and processing of EBAS NASA Ames files
 For details on the file format see `here <https://ebas-submit.nilu.no/
 Submit-Data/Getting-started>`__
 """
+import io
 import logging
 import os
 from datetime import datetime
@@ -250,6 +251,10 @@ class EbasFlagCol:
 
     """
 
+    #: flag info (valid dict) and corresponding lookup table of invalid
+    #: codes, cf. :attr:`invalid_lookup`
+    _invalid_lookup = None
+
     def __init__(self, raw_data, interpret_on_init=True):
         self.raw_data = raw_data
 
@@ -278,37 +283,39 @@ class EbasFlagCol:
             self.decode()
         return self._valid
 
+    @property
+    def invalid_lookup(self):
+        """Boolean array specifying invalid flag codes (index is flag code 0-999)"""
+        valid = self.FLAG_INFO["valid"]
+        if EbasFlagCol._invalid_lookup is None or EbasFlagCol._invalid_lookup[0] is not valid:
+            lookup = np.zeros(1000, dtype=bool)
+            for code, isvalid in valid.items():
+                if 0 <= code < 1000:
+                    lookup[code] = not isvalid
+            EbasFlagCol._invalid_lookup = (valid, lookup)
+        return EbasFlagCol._invalid_lookup[1]
+
     def decode(self):
-        """Decode raw flag column"""
-        flags = np.zeros((len(self.raw_data), 3)).astype(int)
-        mask = self.raw_data.astype(
-            bool
-        )  # rmooves all points that are 0, i.e. that contain no flag (valid measurements)
-        valid = np.ones_like(self.raw_data).astype(bool)
-        not_ok = self.raw_data[mask]
-        if len(not_ok) > 0:
-            _decoded = []
-            _valid = []
-            for flag in not_ok:
-                item = f"{flag:.9f}".split(".")[1]
-                vals = [int(item[:3]), int(item[3:6]), int(item[6:9])]
-                _invalid = False
-                for val in vals:
-                    if val == 100:
-                        _invalid = False
-                        break  # since all other flags are irrelevant if 100 is flagged
-                    elif (
-                        val in self.FLAG_INFO["valid"] and not self.FLAG_INFO["valid"][val]
-                    ):  # is invalid
-                        _invalid = True
-
-                _decoded.append(vals)
-                _valid.append(not _invalid)
-
-            flags[mask] = np.asarray(_decoded)
-            valid[mask] = _valid
-
-        self._valid = valid
+        """Decode raw flag column
+
+        Each flag value contains up to 3 flag codes in its first 9 decimal
+        places (e.g. 0.111222333 -> 111 222 333). A measurement is invalid if
+        any of its codes is an invalid flag, unless one of them is 100.
+        """
+        raw_data = np.asarray(self.raw_data, dtype=float)
+        # zeros contain no flag (valid measurements)
+        mask = (raw_data != 0) & np.isfinite(raw_data)
+        digits = np.rint(np.abs(raw_data[mask]) * 1e9).astype(np.int64) % 1000000000
+        first, rest = np.divmod(digits, 1000000)
+        flags = np.zeros((len(raw_data), 3), dtype=int)
+        flags[mask, 0] = first
+        flags[mask, 1], flags[mask, 2] = np.divmod(rest, 1000)
+
+        invalid = self.invalid_lookup[flags].any(axis=1)
+        # all other flags are irrelevant if 100 is flagged
+        invalid[(flags == 100).any(axis=1)] = False
+
+        self._valid = ~invalid
         self._decoded = flags
 
 
@@ -369,6 +376,7 @@ class EbasNasaAmesFile(NasaAmesHeader):
     ):
         super().__init__(**kwargs)
         self._data_header = []  # Header line of data block
+        self._data_offset = None  # position of data block in file
         self._data = []  # data block
 
         self.time_stamps = None
@@ -583,8 +591,25 @@ class EbasNasaAmesFile(NasaAmesHeader):
         if msgs:
             raise AttributeError(f"Quality check failed. Messages: {msgs}")
 
-    def read_header(self, nasa_ames_file, quality_check=True):
-        self.read_file(nasa_ames_file, only_head=True, quality_check=quality_check)
+    def read_header(self, nasa_ames_file, quality_check=True, header_cache=None):
+        """Read header of NASA Ames file
+
+        The data block can be read afterwards using :func:`read_data`.
+
+        Parameters
+        ----------
+        nasa_ames_file : str
+            EBAS NASA Ames file
+        quality_check : bool
+            not used, since the quality check requires the data (cf.
+            :func:`read_data`)
+        header_cache : EbasHeaderCache, optional
+            if provided, the file header is loaded from this cache, if
+            available, and is added to it, if not.
+        """
+        self.read_file(
+            nasa_ames_file, only_head=True, quality_check=quality_check, header_cache=header_cache
+        )
 
     def read_file(
         self,
@@ -594,6 +619,7 @@ class EbasNasaAmesFile(NasaAmesHeader):
         convert_timestamps=True,
         evaluate_flags=False,
         quality_check=False,
+        header_cache=None,
     ):
         """Read NASA Ames file
 
@@ -619,24 +645,96 @@ class EbasNasaAmesFile(NasaAmesHeader):
         quality_check : bool
             perform quality check after import (for details see
             :func:`_quality_check`)
+        header_cache : EbasHeaderCache, optional
+            if provided, the file header is loaded from this cache, if
+            available, and is added to it, if not.
         """
         logger.info(f"Reading NASA Ames file:\n{nasa_ames_file}")
+        self.file = nasa_ames_file
+        header = None if header_cache is None else header_cache.get(nasa_ames_file)
+        with open(nasa_ames_file) as f:
+            if header is None:
+                self._read_header_lines(f)
+                if header_cache is not None and self._data_header:
+                    header_cache.put(nasa_ames_file, self.get_header_state())
+            else:
+                self.set_header_state(header)
+                f.seek(self._data_offset)
+            if only_head:
+                return
+            data = self._read_data_block(f.read())
+        self._init_data(
+            data, replace_invalid_nan, convert_timestamps, evaluate_flags, quality_check
+        )
+
+    def read_data(
+        self,
+        replace_invalid_nan=True,
+        convert_timestamps=True,
+        evaluate_flags=False,
+        quality_check=False,
+    ):
+        """Read data block of file, the header of which was read before
+
+        Parameters
+        ----------
+        see :func:`read_file`
+        """
+        if self._data_offset is None:
+            raise NasaAmesReadError(f"Data block of file {self.file} could not be located")
+        with open(self.file) as f:
+            f.seek(self._data_offset)
+            data = self._read_data_block(f.read())
+        self._init_data(
+            data, replace_invalid_nan, convert_timestamps, evaluate_flags, quality_check
+        )
+
+    def get_header_state(self):
+        """Get all information that is read from the file header
+
+        Returns
+        -------
+        dict
+            header information, can be assigned to another instance via
+            :func:`set_header_state`
+        """
+        return dict(
+            head_fix=dict(self._head_fix),
+            var_defs=[dict(col) for col in self._var_defs],
+            meta=dict(self._meta),
+            data_header=list(self._data_header),
+            data_offset=self._data_offset,
+        )
+
+    def set_header_state(self, state):
+        """Assign header information (cf. :func:`get_header_state`)
+
+        Parameters
+        ----------
+        state : dict
+            header information
+        """
+        self._head_fix.update(state["head_fix"])
+        # skip __init__, all attributes are contained in the cached dicts
+        self._var_defs = [dict.__new__(EbasColDef) for _ in state["var_defs"]]
+        for coldef, col in zip(self._var_defs, state["var_defs"]):
+            dict.update(coldef, col)
+        self._meta = dict(state["meta"])
+        self._data_header = list(state["data_header"])
+        self._data_offset = state["data_offset"]
+
+    def _read_header_lines(self, f):
+        """Read header lines of file up to (and including) the data header
+
+        The position of the data block in the file is stored, so that the
+        data can be read later on without parsing the header again.
+        """
         lc = 0  # line counter
-        dc = 0  # data block line counter
         mc = 0  # meta block counter
         END_VAR_DEF = np.nan  # will be set (info stored in header)
-        IN_DATA = False
-        data = []
-        self.file = nasa_ames_file
-        for line in open(nasa_ames_file):
-            if IN_DATA:  # in data block (end of file)
-                try:
-                    data.append(tuple(float(x.strip()) for x in line.strip().split()))
-                    # data.append([float(x.strip()) for x in line.strip().split()])
-                except Exception as e:
-                    logger.warning(f"EbasNasaAmesFile: Failed to read data row {dc}. Reason: {e}")
-                dc += 1
-            elif lc < self._NUM_FIXLINES:  # in header section (before column definitions)
+        # f.tell is not available while iterating over a file via next()
+        for line in iter(f.readline, ""):
+            if lc < self._NUM_FIXLINES:  # in header section (before column definitions)
                 try:
                     val = self._H_FIXLINES_CONV[lc](line)
                     attr = self._H_FIXLINES_YIELD[lc]
@@ -664,7 +762,6 @@ class EbasNasaAmesFile(NasaAmesHeader):
                     self.var_defs.append(self._read_vardef_line(line))
 
                 elif lc == NUM_HEAD_LINES - 1:
-                    IN_DATA = True
                     self._data_header = h = [x.strip() for x in line.split()]
                     # append information of first two columns to variable
                     # definition array.
@@ -674,9 +771,9 @@ class EbasNasaAmesFile(NasaAmesHeader):
                     self._var_defs.insert(
                         1, EbasColDef(name=h[1], is_flag=False, is_var=False, unit=self.time_unit)
                     )
-                    if only_head:
-                        return
                     logger.debug("REACHED DATA BLOCK")
+                    self._data_offset = f.tell()
+                    return
                 elif lc >= END_VAR_DEF + 2:
                     try:
                         name, val = line.split(":")
@@ -691,8 +788,9 @@ class EbasNasaAmesFile(NasaAmesHeader):
                 mc += 1
             lc += 1
 
-        data = np.asarray(data)
-
+    def _init_data(
+        self, data, replace_invalid_nan, convert_timestamps, evaluate_flags, quality_check
+    ):
         data[:, 1:] = data[:, 1:] * np.asarray(self.mul_factors)
 
         self._data = data
@@ -716,6 +814,47 @@ class EbasNasaAmesFile(NasaAmesHeader):
         if quality_check:
             self._quality_check()
 
+    def _read_data_block(self, block):
+        """Convert data block of file into numpy array
+
+        All values are parsed at once using :func:`numpy.loadtxt`. Only if
+        that fails (i.e. if a row contains invalid values or a different
+        number of values than there are columns in :attr:`data_header`), the
+        block is parsed row by row and malformed rows are skipped.
+
+        Parameters
+        ----------
+        block : str
+            data block of file (i.e. all lines after the data header)
+
+        Returns
+        -------
+        ndarray
+            2D array with shape (number of rows, number of columns)
+        """
+        num_cols = len(self._data_header)
+        if block.strip():
+            try:
+                # raises if a value is invalid or the number of values varies
+                data = np.loadtxt(io.StringIO(block), dtype=np.float64, ndmin=2)
+            except ValueError:
+                pass
+            else:
+                if data.shape[1] == num_cols:
+                    return data
+        lines = block.splitlines()
+        data = []
+        for dc, line in enumerate(lines):
+            try:
+                row = tuple(float(x) for x in line.split())
+                if len(row) != num_cols:
+                    raise ValueError(f"expected {num_cols} values, got {len(row)}")
+            except ValueError as e:
+                logger.warning(f"EbasNasaAmesFile: Failed to read data row {dc}. Reason: {e}")
+                continue
+            data.append(row)
+        return np.asarray(data).reshape(len(data), num_cols)
+
     def _read_vardef_line(self, line_from_file):
         """Import variable definition line from NASA Ames file"""
         spl = [x.strip() for x in line_from_file.split(",")]
@@ -0,0 +1,58 @@
+"""
+Persistent cache for file information of gridded data directories
+"""
+from pyaerocom.io.sqlite_cache import SqliteCache
+
+
+class FileInfoCache(SqliteCache):
+    """SQLite based cache for file information of gridded data directories
+
+    Stores the information that :class:`ReadGridded` extracts from the
+    filenames in a data directory (cf. :func:`ReadGridded.search_all_files`)
+    under a key describing the reader setup, together with a fingerprint of
+    the directory (e.g. its modification time and number of files). Entries
+    are only returned if the fingerprint is unchanged, otherwise they are
+    overwritten when the directory is searched again (cf.
+    :class:`SqliteCache`).
+
+    Parameters
+    ----------
+    database : str
+        path to sqlite database file (is created if it does not exist)
+    """
+
+    TABLE = "file_info"
+    CHECK_COLUMNS = (("fingerprint", "text"),)
+    VALUE_COLUMN = "info"
+
+    def get(self, key, fingerprint):
+        """Get cached file information
+
+        Parameters
+        ----------
+        key : str
+            key of cache entry (e.g. data directory and reader setup)
+        fingerprint : str
+            current fingerprint of data directory
+
+        Returns
+        -------
+        dict or None
+            cached file information or None if the key is not in the cache or
+            the fingerprint has changed
+        """
+        return super().get(key, (fingerprint,))
+
+    def put(self, key, fingerprint, info):
+        """Add or update cached file information
+
+        Parameters
+        ----------
+        key : str
+            key of cache entry (e.g. data directory and reader setup)
+        fingerprint : str
+            current fingerprint of data directory
+        info : dict
+            file information
+        """
+        super().put(key, info, (fingerprint,))
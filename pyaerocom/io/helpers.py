@@ -3,6 +3,7 @@ I/O helper methods of the pyaerocom package
 """
 from __future__ import annotations
 
+import gzip
 import logging
 import os
 import shutil
@@ -25,7 +26,7 @@ logger = logging.getLogger(__name__)
 COUNTRY_CODE_FILE = "country_codes.json"
 
 
-def _check_ebas_db_local_vs_remote(loc_remote, loc_local):
+def _check_ebas_db_local_vs_remote(loc_remote, loc_local, create_indexes=False):
     """
     Check and if applicable, copy ebas_file_index.sqlite3 into cache dir
 
@@ -40,6 +41,9 @@ def _check_ebas_db_local_vs_remote(loc_remote, loc_local):
         remote location of ebas_file_index.sqlite3
     loc_local : str
         local (cached) location of ebas_file_index.sqlite3
+    create_indexes : bool
+        if True, additional indexes are created in the local copy of the
+        database (cf. :func:`EbasFileIndex.create_indexes`)
 
     Returns
     -------
@@ -58,18 +62,43 @@ def _check_ebas_db_local_vs_remote(loc_remote, loc_local):
         # fails, use remote location
         try:
             t0 = time()
-            shutil.copy2(loc_remote, loc_local)
+            # copy to temporary file first (and create indexes there), to not
+            # modify the database while it may be read by other processes
+            tmp = f"{loc_local}.{os.getpid()}.tmp"
+            shutil.copy2(loc_remote, tmp)
+            if create_indexes:
+                _create_ebas_db_indexes(tmp, loc_remote)
+            os.replace(tmp, loc_local)
             logger.info(
                 f"Copied EBAS SQL database to {loc_local}\nElapsed time: {time()-t0:.3f} s"
             )
-
             return loc_local
         except Exception as e:
             logger.warning(f"Failed to copy EBAS SQL database. Reason: {repr(e)}")
+            if os.path.exists(tmp):
+                os.remove(tmp)
             return loc_remote
     return loc_remote
 
 
+def _create_ebas_db_indexes(loc_local, loc_remote):
+    """Create indexes in (not yet used) local copy of EBAS database
+
+    The modification time of the local copy is reset to the one of the
+    remote database afterwards, so that the copy is still considered up
+    to date (cf. :func:`_check_ebas_db_local_vs_remote`).
+    """
+    from pyaerocom.io.ebas_file_index import EbasFileIndex
+
+    try:
+        EbasFileIndex(loc_local).create_indexes()
+    except Exception as e:
+        logger.warning(f"Failed to create indexes in EBAS SQL database. Reason: {repr(e)}")
+    finally:
+        stat = os.stat(loc_remote)
+        os.utime(loc_local, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
 def aerocom_savename(data_id, var_name, vert_code, year, ts_type):
     """Generate filename in AeroCom conventions
 
@@ -99,6 +128,61 @@ def get_metadata_from_filename(filename):
     return fc.get_info_from_file(filename)
 
 
+def open_text_file(filename, encoding=None):
+    """Open text file for reading, decompressing it on the fly if it is gzipped
+
+    Parameters
+    ----------
+    filename : str or Path
+        file to be opened (gzip compression is inferred from suffix .gz)
+    encoding : str, optional
+        text encoding of the file, if None, the platform default is used
+        (cf. :func:`open`)
+
+    Returns
+    -------
+    io.TextIOBase
+        file object in text mode
+    """
+    if Path(filename).suffix == ".gz":
+        return gzip.open(filename, "rt", encoding=encoding)
+    return open(filename, encoding=encoding)
+
+
+def read_text_lines(filename, encodings=(None,)):
+    """Read all lines of a (possibly gzipped) text file
+
+    The encodings are tried in the given order and the first one that
+    decodes the whole file is used. Compressed files are decompressed
+    while reading and are not copied to disk.
+
+    Parameters
+    ----------
+    filename : str or Path
+        file to be read (gzip compression is inferred from suffix .gz)
+    encodings : tuple
+        text encodings to try (None refers to the platform default)
+
+    Returns
+    -------
+    list
+        lines of file (including line endings)
+
+    Raises
+    ------
+    UnicodeDecodeError
+        if the file cannot be decoded with any of the input encodings
+    """
+    for encoding in encodings[:-1]:
+        try:
+            with open_text_file(filename, encoding) as f:
+                return f.readlines()
+        except UnicodeDecodeError:
+            continue
+    with open_text_file(filename, encodings[-1]) as f:
+        return f.readlines()
+
+
 def read_ebas_flags_file(ebas_flags_csv):
     """Reads file ebas_flags.csv
 
@@ -8,7 +8,9 @@ reading of Cubes, and some methods to perform quality checks of the data, e.g.
 """
 
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from itertools import repeat
 
 import cf_units
 import iris
@@ -29,6 +31,7 @@ import numpy as np
 
 from pyaerocom import const
 from pyaerocom.exceptions import (
+    DataExtractionError,
     FileConventionError,
     NetcdfError,
     UnresolvableTimeDefinitionError,
@@ -41,8 +44,22 @@ from pyaerocom.tstype import TsType
 
 logger = logging.getLogger(__name__)
 
-
-def load_cubes_custom(files, var_name=None, file_convention=None, perform_fmt_checks=True):
+#: loading of NetCDF files in multiple threads is only thread safe for iris
+#: 3.5 or later (cf. :func:`load_cubes_custom`)
+_IRIS_THREAD_SAFE = tuple(int(v) for v in iris.__version__.split(".")[:2]) >= (3, 5)
+
+
+def load_cubes_custom(
+    files,
+    var_name=None,
+    file_convention=None,
+    perform_fmt_checks=True,
+    num_workers=None,
+    use_processes=None,
+    lon_range=None,
+    lat_range=None,
+    levels=None,
+):
     """Load multiple NetCDF files into CubeList
 
     Note
@@ -64,29 +81,66 @@ def load_cubes_custom(files, var_name=None, file_convention=None, perform_fmt_ch
     perform_fmt_checks : bool
         if True, additional quality checks (and corrections) are (attempted to
         be) performed.
+    num_workers : int, optional
+        number of workers used to load the files concurrently. If None, use
+        :attr:`const.GRID_READ_NUM_WORKERS`. If 1, the files are loaded one
+        after another.
+    use_processes : bool, optional
+        if True, the files are loaded in a process pool, else in a thread
+        pool. If None, use :attr:`const.GRID_READ_USE_PROCESSES`. A process
+        pool is always used for iris versions older than 3.5, which cannot
+        load files in multiple threads safely.
+    lon_range : tuple, optional
+        longitude range to which the loaded cubes are cropped (cf.
+        :func:`crop_cube`)
+    lat_range : tuple, optional
+        latitude range to which the loaded cubes are cropped
+    levels : int or slice or list, optional
+        indices of vertical levels to be extracted from the loaded cubes
 
     Returns
     -------
     list
-        loaded cube instances.
+        loaded cube instances (in the order of the input files).
     list
         list containing all files from which the input variable could be
         successfully loaded.
     """
+    if num_workers is None:
+        num_workers = const.GRID_READ_NUM_WORKERS
+    if use_processes is None:
+        use_processes = const.GRID_READ_USE_PROCESSES
+    num_workers = min(num_workers, len(files))
+
+    args = (
+        files,
+        repeat(var_name),
+        repeat(file_convention),
+        repeat(perform_fmt_checks),
+        repeat(dict(lon_range=lon_range, lat_range=lat_range, levels=levels)),
+    )
+    if num_workers > 1:
+        if not use_processes and not _IRIS_THREAD_SAFE:
+            logger.warning(
+                f"Loading files in multiple threads requires iris>=3.5 (found "
+                f"{iris.__version__}), using a process pool instead"
+            )
+            use_processes = True
+        executor = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        logger.info(f"Loading {len(files)} files using {num_workers} workers")
+        with executor(max_workers=num_workers) as pool:
+            results = list(pool.map(_load_cube_custom_or_error, *args))
+    else:
+        results = map(_load_cube_custom_or_error, *args)
+
     cubes = []
     loaded_files = []
-    for i, _file in enumerate(files):
-        try:
-            cube = load_cube_custom(
-                file=_file,
-                var_name=var_name,
-                file_convention=file_convention,
-                perform_fmt_checks=perform_fmt_checks,
-            )
+    for _file, (cube, error) in zip(files, results):
+        if error is None:
             cubes.append(cube)
             loaded_files.append(_file)
-        except Exception:
-            msg = f"Failed to load {_file}. Reason: {format_exc()}"
+        else:
+            msg = f"Failed to load {_file}. Reason: {error}"
             logger.warning(msg)
 
             if const.WRITE_FILEIO_ERR_LOG:
@@ -94,7 +148,30 @@ def load_cubes_custom(files, var_name=None, file_convention=None, perform_fmt_ch
     return (cubes, loaded_files)
 
 
-def load_cube_custom(file, var_name=None, file_convention=None, perform_fmt_checks=None):
+def _load_cube_custom_or_error(file, var_name, file_convention, perform_fmt_checks, crop):
+    """Run :func:`load_cube_custom` and return the cube or the formatted error"""
+    try:
+        cube = load_cube_custom(
+            file=file,
+            var_name=var_name,
+            file_convention=file_convention,
+            perform_fmt_checks=perform_fmt_checks,
+            **crop,
+        )
+    except Exception:
+        return None, format_exc()
+    return cube, None
+
+
+def load_cube_custom(
+    file,
+    var_name=None,
+    file_convention=None,
+    perform_fmt_checks=None,
+    lon_range=None,
+    lat_range=None,
+    levels=None,
+):
     """Load netcdf file as iris.Cube
 
     Parameters
@@ -112,6 +189,12 @@ def load_cube_custom(file, var_name=None, file_convention=None, perform_fmt_chec
     perform_fmt_checks : bool
         if True, additional quality checks (and corrections) are (attempted to
         be) performed.
+    lon_range : tuple, optional
+        longitude range to which the cube is cropped (cf. :func:`crop_cube`)
+    lat_range : tuple, optional
+        latitude range to which the cube is cropped
+    levels : int or slice or list, optional
+        indices of vertical levels to be extracted
 
     Returns
     -------
@@ -143,6 +226,60 @@ def load_cube_custom(file, var_name=None, file_convention=None, perform_fmt_chec
         raise NetcdfError(f"Variable {var_name} not available in file {file}")
     if perform_fmt_checks:
         cube = _cube_quality_check(cube, file, file_convention)
+    return crop_cube(cube, lon_range, lat_range, levels)
+
+
+def crop_cube(cube, lon_range=None, lat_range=None, levels=None):
+    """Crop cube in longitude, latitude and / or vertical dimension
+
+    Note
+    ----
+    Cropping does not load the data of the cube. If the cube is still
+    lazy (e.g. right after loading from file) only the selected part of the
+    data is read from disk when it is accessed.
+
+    Parameters
+    ----------
+    cube : iris.cube.Cube
+        input cube
+    lon_range : tuple, optional
+        2-element tuple containing longitude range for cropping (cf.
+        :func:`iris.cube.Cube.intersection`). If None, the longitude axis
+        remains unchanged.
+    lat_range : tuple, optional
+        2-element tuple containing latitude range for cropping. If None,
+        the latitude axis remains unchanged.
+    levels : int or slice or list, optional
+        indices of vertical levels to be extracted. If int, the vertical
+        dimension is removed. If None, all levels are kept.
+
+    Returns
+    -------
+    iris.cube.Cube
+        cropped cube
+
+    Raises
+    ------
+    DataExtractionError
+        if levels are specified but the cube has no vertical dimension
+    """
+    ranges = {}
+    if lon_range is not None:
+        ranges["longitude"] = lon_range
+    if lat_range is not None:
+        ranges["latitude"] = lat_range
+    if ranges:
+        cube = cube.intersection(**ranges)
+    if levels is not None:
+        vert_coords = cube.coords(axis="Z", dim_coords=True)
+        if len(vert_coords) != 1:
+            raise DataExtractionError(
+                f"Cannot extract levels {levels}, failed to identify vertical "
+                f"dimension of {cube.name()}"
+            )
+        index = [slice(None)] * cube.ndim
+        index[cube.coord_dims(vert_coords[0])[0]] = levels
+        cube = cube[tuple(index)]
     return cube
 
 
@@ -170,49 +170,15 @@ class ReadAeronetSdaV3(ReadAeronetBase):
                         f"Variable {var} not available in file {os.path.basename(filename)}"
                     )
 
-            for line in in_file:
-                # process line
-                dummy_arr = line.split(self.COL_DELIM)
-
-                # copy the meta data (array of type string)
-                for var in self.META_NAMES_FILE:
-                    val = dummy_arr[col_index[var]]
-                    try:
-                        # e.g. lon, lat, altitude
-                        val = float(val)
-                    except Exception:
-                        pass
-                    data_out[var].append(val)
-
-                # This uses the numpy datestring64 functions that e.g. also support Months as a time step for timedelta
-                # Build a proper ISO 8601 UTC date string
-
-                day, month, year = dummy_arr[col_index["date"]].split(":")
-                datestring = "-".join([year, month, day])
-                datestring = "T".join([datestring, dummy_arr[col_index["time"]]])
-                # NOTE JGLISS: parsing timezone offset was removed on 22/2/19
-                # since it is deprecated in recent numpy versions, for details
-                # see https://www.numpy.org/devdocs/reference/arrays.datetime.html#changes-with-numpy-1-11
-                # datestring = '+'.join([datestring, '00:00'])
-
-                data_out["dtime"].append(np.datetime64(datestring))
-
-                # copy the data fields
-                for var, idx in vars_available.items():
-                    val = np.float_(dummy_arr[idx])
-                    if val == self.NAN_VAL:
-                        val = np.nan
-                    data_out[var].append(val)
-
-        # convert all lists to numpy arrays
-        data_out["dtime"] = np.asarray(data_out["dtime"])
+            block = self._read_data_block(in_file.readlines(), vars_available, filename)
 
+        data_out["dtime"] = block["dtime"]
         for item in self.META_NAMES_FILE:
-            data_out[item] = np.asarray(data_out[item])
+            data_out[item] = block[item]
 
         for var in vars_to_read:
             if var in vars_available:
-                array = np.asarray(data_out[var])
+                array = block[var]
             else:
                 array = np.zeros(len(data_out["dtime"])) * np.nan
             data_out[var] = array
@@ -1,9 +1,5 @@
-import gzip
 import logging
 import os
-import pathlib
-import shutil
-import tempfile
 
 import numpy as np
 import pandas as pd
@@ -11,6 +7,7 @@ import pandas as pd
 from pyaerocom import const
 from pyaerocom.aux_var_helpers import calc_ang4487aer, calc_od550aer, calc_od550lt1ang
 from pyaerocom.exceptions import AeronetReadError
+from pyaerocom.io.helpers import read_text_lines
 from pyaerocom.io.readaeronetbase import ReadAeronetBase
 from pyaerocom.stationdata import StationData
 
@@ -140,27 +137,12 @@ class ReadAeronetSunV3(ReadAeronetBase):
 
         # Iterate over the lines of the file
         self.logger.info(f"Reading file {filename}")
-        # enable alternative reading of .gz files here to save space on the file system
-        suffix = pathlib.Path(filename).suffix
-        tmp_name = filename
-        if suffix == ".gz":
-            f_out = tempfile.NamedTemporaryFile(delete=False)
-            with gzip.open(filename, "r") as f_in:
-                shutil.copyfileobj(f_in, f_out)
-            filename = f_out.name
-            f_out.close()
-
+        # .gz files are decompressed while reading to save space on the file system
         try:
-            with open(filename, "rt") as in_file:
-                lines = in_file.readlines()
-        except UnicodeDecodeError:
-            with open(filename, "rt", encoding="ISO-8859-1") as in_file:
-                lines = in_file.readlines()
-        except OSError:
+            lines = read_text_lines(filename, encodings=(None, "ISO-8859-1"))
+        except (OSError, EOFError):
             # faulty gzip file, but also the gzip class raises some exceptions
-            if suffix == ".gz":
-                os.remove(f_out.name)
-            raise AeronetReadError(f"gzip error in file {tmp_name}")
+            raise AeronetReadError(f"gzip error in file {filename}")
 
         _lines_ignored = []
 
@@ -204,63 +186,15 @@ class ReadAeronetSunV3(ReadAeronetBase):
                 self.logger.warning(
                     f"Variable {var} not available in file {os.path.basename(filename)}"
                 )
-        pl = None
-
-        for i, line in enumerate(lines[line_idx:]):
-            # process line
-            dummy_arr = line.split(self.COL_DELIM)
-
-            if pl is not None and len(dummy_arr) != len(pl):
-                self.logger.warning(f"Data line {i} in {filename} is corrupt, skipping...")
-                continue
-            # copy the meta data (array of type string)
-            for var in self.META_NAMES_FILE:
-                try:
-                    val = dummy_arr[col_index[var]]
-                except IndexError as e:
-                    self.logger.warning(repr(e))
-
-                try:
-                    # e.g. lon, lat, altitude
-                    val = float(val)
-                except Exception:
-                    pass
-                data_out[var].append(val)
-
-            # This uses the numpy datestring64 functions that e.g. also
-            # support Months as a time step for timedelta
-            # Build a proper ISO 8601 UTC date string
-            day, month, year = dummy_arr[col_index["date"]].split(":")
-            datestring = "-".join([year, month, day])
-            datestring = "T".join([datestring, dummy_arr[col_index["time"]]])
-            # NOTE JGLISS: parsing timezone offset was removed on 22/2/19
-            # since it is deprecated in recent numpy versions, for details
-            # see https://www.numpy.org/devdocs/reference/arrays.datetime.html#changes-with-numpy-1-11
-            # datestring = '+'.join([datestring, '00:00'])
-
-            data_out["dtime"].append(np.datetime64(datestring))
-
-            for var, idx in vars_available.items():
-                val = np.float_(dummy_arr[idx])
-                if val == self.NAN_VAL:
-                    val = np.nan
-                data_out[var].append(val)
-
-            pl = dummy_arr
-
-        # remove the temp file in case the input file was a gz file
-        if suffix == ".gz":
-            os.remove(f_out.name)
-
-        # convert all lists to numpy arrays
-        data_out["dtime"] = np.asarray(data_out["dtime"])
+        block = self._read_data_block(lines[line_idx:], vars_available, filename)
 
+        data_out["dtime"] = block["dtime"]
         for item in self.META_NAMES_FILE:
-            data_out[item] = np.asarray(data_out[item])
+            data_out[item] = block[item]
 
         for var in vars_to_read:
             if var in vars_available:
-                array = np.asarray(data_out[var])
+                array = block[var]
             else:
                 array = np.zeros(len(data_out["dtime"])) * np.nan
             data_out[var] = array
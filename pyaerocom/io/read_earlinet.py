@@ -461,23 +461,18 @@ class ReadEarlinet(ReadUngriddedBase):
         meta_idx = data_obj.meta_idx
 
         # last_station_id = ''
-        num_files = len(files)
-
-        disp_each = int(num_files * 0.1)
-        if disp_each < 1:
-            disp_each = 1
+        results = self.iter_read_files(
+            files,
+            desc=type(self).__name__,
+            vars_to_retrieve=vars_to_retrieve,
+            read_err=read_err,
+            remove_outliers=remove_outliers,
+        )
 
         VAR_IDX = -1
-        for i, _file in enumerate(files):
-            if i % disp_each == 0:
-                print(f"Reading file {i + 1} of {num_files} ({type(self).__name__})")
+        for _file, result in results:
             try:
-                stat = self.read_file(
-                    _file,
-                    vars_to_retrieve=vars_to_retrieve,
-                    read_err=read_err,
-                    remove_outliers=remove_outliers,
-                )
+                stat = result.get()
                 if not any([var in stat.vars_available for var in vars_to_retrieve]):
                     self.logger.info(
                         f"Station {stat.station_name} contains none of the desired variables. Skipping station..."
@@ -5,7 +5,6 @@ import re
 
 import numpy as np
 from geonum.atmosphere import T0_STD, p0
-from tqdm import tqdm
 
 from pyaerocom import const
 from pyaerocom._lowlevel_helpers import BrowseDict
@@ -31,6 +30,7 @@ from pyaerocom.exceptions import (
     UnitConversionError,
 )
 from pyaerocom.io.ebas_file_index import EbasFileIndex, EbasSQLRequest
+from pyaerocom.io.ebas_header_cache import EbasHeaderCache
 from pyaerocom.io.ebas_nasa_ames import EbasNasaAmesFile
 from pyaerocom.io.ebas_varinfo import EbasVarInfo
 from pyaerocom.io.helpers import _check_ebas_db_local_vs_remote
@@ -192,6 +192,10 @@ class ReadEbas(ReadUngriddedBase):
     #: Name of sqlite database file
     SQL_DB_NAME = "ebas_file_index.sqlite3"
 
+    #: Name of sqlite database file in :attr:`pyaerocom.const.CACHEDIR` that
+    #: is used to cache the headers of the NASA Ames files
+    HEADER_CACHE_DB_NAME = "ebas_header_cache.sqlite3"
+
     #: List of all datasets supported by this interface
     SUPPORTED_DATASETS = [const.EBAS_MULTICOLUMN_NAME]
 
@@ -308,6 +312,7 @@ class ReadEbas(ReadUngriddedBase):
 
         #: SQL database interface class used to retrieve file paths for vars
         self._file_index = None
+        self._header_cache = None
         self.sql_requests = []
 
         #: original file lists retrieved for each variable individually using
@@ -357,6 +362,17 @@ class ReadEbas(ReadUngriddedBase):
             self._file_index = EbasFileIndex(self.sqlite_database_file)
         return self._file_index
 
+    @property
+    def header_cache(self):
+        """Persistent cache of NASA Ames file headers (None if caching is inactive)"""
+        cachedir = const.CACHEDIR
+        if not const.CACHING or cachedir is None:
+            return None
+        db = os.path.join(cachedir, self.HEADER_CACHE_DB_NAME)
+        if self._header_cache is None or self._header_cache.database != db:
+            self._header_cache = EbasHeaderCache(db)
+        return self._header_cache
+
     @property
     def FILE_REQUEST_OPTS(self):
         """List of options for file retrieval"""
@@ -390,7 +406,9 @@ class ReadEbas(ReadUngriddedBase):
         loc_remote = os.path.join(self.data_dir, dbname)
         if self.data_id in self.CACHE_SQLITE_FILE and const.EBAS_DB_LOCAL_CACHE:
             loc_local = os.path.join(const.CACHEDIR, dbname)
-            return _check_ebas_db_local_vs_remote(loc_remote, loc_local)
+            return _check_ebas_db_local_vs_remote(
+                loc_remote, loc_local, create_indexes=const.EBAS_DB_LOCAL_INDEXES
+            )
 
         return loc_remote
 
@@ -866,7 +884,10 @@ class ReadEbas(ReadUngriddedBase):
 
         if len(result_col) > 1:
             comp = ebas_var_info["component"]
-            startstop = f"{file.time_stamps[0]} - {file.time_stamps[-1]}"
+            if file.time_stamps is None:  # only header was read so far
+                startstop = f"{file.ref_date} - ?"
+            else:
+                startstop = f"{file.time_stamps[0]} - {file.time_stamps[-1]}"
             msg = (
                 f"\n\nFATAL: could not resolve unique data column for "
                 f"{var} (EBAS varname: {comp})\nData period: {startstop}), "
@@ -1310,10 +1331,12 @@ class ReadEbas(ReadUngriddedBase):
         else:
             vars_to_read, vars_to_compute = _vars_to_read, _vars_to_compute
 
-        file = EbasNasaAmesFile(filename)
+        file = EbasNasaAmesFile()
+        file.read_header(filename, header_cache=self.header_cache)
 
         # find columns in NASA Ames file for variables that are to be read
         var_cols = self.find_var_cols(vars_to_read=vars_to_read, loaded_nasa_ames=file)
+        file.read_data(quality_check=True)
         # create empty data object (is dictionary with extended functionality)
         data_out = StationData()
 
@@ -1720,12 +1743,10 @@ class ReadEbas(ReadUngriddedBase):
         # (is used for attr. var_idx in UngriddedData object)
         var_count_glob = -1
         logger.info(f"Reading EBAS data from {self.file_dir}")
-        num_files = len(files)
-        for i in tqdm(range(num_files)):
-            _file = files[i]
-            contains = files_contain[i]
+        file_kwargs = [dict(vars_to_retrieve=contains) for contains in files_contain]
+        for _file, result in self.iter_read_files(files, file_kwargs):
             try:
-                station_data = self.read_file(_file, vars_to_retrieve=contains)
+                station_data = result.get()
 
             except (
                 NotInFileError,
@@ -1828,5 +1849,5 @@ class ReadEbas(ReadUngriddedBase):
 
         num_failed = len(self.files_failed)
         if num_failed > 0:
-            logger.warning(f"{num_failed} out of {num_files} could not be read...")
+            logger.warning(f"{num_failed} out of {len(files)} could not be read...")
         return data_obj
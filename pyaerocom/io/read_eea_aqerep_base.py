@@ -1,37 +1,32 @@
 """
 Interface for reading EEA AqERep files (formerly known as Airbase data).
 """
-import gzip
+import fnmatch
 import logging
 import os
-import pathlib
-import shutil
-import tempfile
 
 import cf_units
 import numpy as np
 import pandas as pd
-from tqdm import tqdm
 
 from pyaerocom.exceptions import EEAv2FileError, TemporalResolutionError
-from pyaerocom.io.helpers import get_country_name_from_iso
+from pyaerocom.io.helpers import get_country_name_from_iso, open_text_file, read_text_lines
 from pyaerocom.io.readungriddedbase import ReadUngriddedBase
 from pyaerocom.stationdata import StationData
 from pyaerocom.ungriddeddata import UngriddedData
 
 logger = logging.getLogger(__name__)
 
+#: metadata files that have been read in this session (cf.
+#: :func:`ReadEEAAQEREPBase._read_metadata_file`)
+_METADATA_CACHE = {}
+
 
 class ReadEEAAQEREPBase(ReadUngriddedBase):
     """Class for reading EEA AQErep data
 
     Extended class derived from  low-level base class
     :class:`ReadUngriddedBase` that contains some more functionality.
-
-    Note
-    ----
-    Currently only single variable reading into an :class:`UngriddedData`
-    object is supported.
     """
 
     #: Mask for identifying datafiles
@@ -94,6 +89,9 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
         concpm25="**/??_6001_*_timeseries.csv*",
     )
 
+    #: file mask matching the data files of all variables
+    FILE_MASK_ALL = "**/??_*_timeseries.csv*"
+
     # conversion factor between concX and vmrX
     CONV_FACTOR = {}
     CONV_FACTOR["vmro3"] = np.float_(
@@ -196,14 +194,15 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
     def read_file(self, filename, var_name, vars_as_series=False):
         """Read a single EEA file
 
-        Note that there's only a single variable in the file
+        Note that there's only a single pollutant in the file, which may be
+        retrieved as several variables (e.g. conco3 and vmro3).
 
         Parameters
         ----------
         filename : str
             Absolute path to filename to read.
-        var_name : str
-            Name of variable in file.
+        var_name : str or list
+            Name of variable(s) in file.
         vars_as_series : bool
             If True, the data columns of all variables in the result dictionary
             are converted into pandas Series objects.
@@ -214,11 +213,13 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
             Dict-like object containing the results.
 
         """
-        if not var_name in self.PROVIDES_VARIABLES:
-            raise ValueError(f"Invalid input variable {var_name}")
-
-        # there's only one variable in the file
-        aerocom_var_name = var_name
+        if isinstance(var_name, str):
+            var_name = [var_name]
+        else:
+            var_name = list(var_name)
+        for var in var_name:
+            if not var in self.PROVIDES_VARIABLES:
+                raise ValueError(f"Invalid input variable {var}")
 
         # Iterate over the lines of the file
         self.logger.info(f"Reading file {filename}")
@@ -241,35 +242,15 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
         time_indexes = [13, 14]
 
         # read the file
-        # enable alternative reading of .gz files here to save space on the file system
-        suffix = pathlib.Path(filename).suffix
-        if suffix == ".gz":
-            f_out = tempfile.NamedTemporaryFile(delete=False)
-            with gzip.open(filename, "r") as f_in:
-                shutil.copyfileobj(f_in, f_out)
-            read_filename = f_out.name
-            f_out.close()
-        else:
-            read_filename = filename
-
+        # .gz files are decompressed while reading to save space on the file system
         # input files can be either UTF-8 or UTF-16 encoded
         # try both
         # files are max 3MB in size, so no big deal terms of RAM usage
         try:
-            with open(read_filename) as f:
-                lines = f.readlines()
-        except UnicodeDecodeError:
-            with open(read_filename, encoding="UTF-16") as f:
-                lines = f.readlines()
-        except:
-            if suffix == ".gz":
-                os.remove(f_out.name)
+            lines = read_text_lines(filename, encodings=(None, "UTF-16"))
+        except (OSError, EOFError, UnicodeError):
             raise EEAv2FileError(f"Found corrupt file {filename}. consider deleteing it")
 
-        # remove the temp file in case the input file was a gz file
-        if suffix == ".gz":
-            os.remove(f_out.name)
-
         header = lines[0].lower().rstrip().split(file_delimiter)
         # create output dict
         if len(header) < max_file_index_to_keep:
@@ -327,19 +308,23 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
 
             lineidx += 1
 
-        unit_in_file = data_dict["unitofmeasurement"]
-        # adjust the unit and apply conversion factor in case we read a variable noted in self.AUX_REQUIRES
-        if var_name in self.AUX_REQUIRES:
-            unit_in_file = self.CONV_UNIT[var_name]
-            data_dict[self.VAR_NAMES_FILE[var_name]] = (
-                data_dict[self.VAR_NAMES_FILE[var_name]] * self.CONV_FACTOR[var_name]
-            )
-        try:
-            unit = self.VAR_UNITS_FILE[unit_in_file]
-        except KeyError:
-            # this will raise an Exception if cf_units cannot handle. In
-            # which case the unit should be added in VAR_UNITS_FILE
-            unit = str(cf_units.Unit(unit_in_file))
+        var_data = {}
+        var_units = {}
+        for var in var_name:
+            values = data_dict[self.VAR_NAMES_FILE[var]][:lineidx]
+            unit_in_file = data_dict["unitofmeasurement"]
+            # adjust the unit and apply conversion factor in case we read a variable noted in self.AUX_REQUIRES
+            if var in self.AUX_REQUIRES:
+                unit_in_file = self.CONV_UNIT[var]
+                values = values * self.CONV_FACTOR[var]
+            try:
+                unit = self.VAR_UNITS_FILE[unit_in_file]
+            except KeyError:
+                # this will raise an Exception if cf_units cannot handle. In
+                # which case the unit should be added in VAR_UNITS_FILE
+                unit = str(cf_units.Unit(unit_in_file))
+            var_data[var] = values
+            var_units[var] = unit
 
         # Empty data object (a dictionary with extended functionality)
         data_out = StationData()
@@ -361,18 +346,19 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
 
         data_out.ts_type = tstype
         # ToDo: check "variables" entry, it should not be needed anymore in UngriddedData
-        data_out["variables"] = [aerocom_var_name]
-        data_out["var_info"][aerocom_var_name] = {}
-        data_out["var_info"][aerocom_var_name]["units"] = unit
+        data_out["variables"] = var_name
+        for var in var_name:
+            data_out["var_info"][var] = {}
+            data_out["var_info"][var]["units"] = var_units[var]
         # TsType is
         # data_out['var_info'][aerocom_var_name]['ts_type'] = self.TS_TYPE
 
+        file_var_names = [self.VAR_NAMES_FILE[var] for var in var_name]
         for key, value in data_dict.items():
-            # adjust the variable name to aerocom standard
-            if key != self.VAR_NAMES_FILE[aerocom_var_name]:
+            if key not in file_var_names:
                 data_out[key] = value[:lineidx]
-            else:
-                data_out[aerocom_var_name] = value[:lineidx]
+        # adjust the variable names to aerocom standard
+        data_out.update(var_data)
 
         # just assume hourly data for now
         time_diff = np.timedelta64(30, "m")
@@ -380,15 +366,17 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
         # convert data vectors to pandas.Series (if attribute
         # vars_as_series=True)
         if vars_as_series:
-            data_out[aerocom_var_name] = pd.Series(
-                data_out[aerocom_var_name], index=data_out["dtime"]
-            )
+            for var in var_name:
+                data_out[var] = pd.Series(data_out[var], index=data_out["dtime"])
 
         return data_out
 
     def _read_metadata_file(self, filename=None):
         """Read EEA metadata file
 
+        The file is only read once per session, subsequent calls return the
+        cached result unless the file has been modified in the meantime.
+
         Parameters
         ----------
         filename : str
@@ -407,18 +395,14 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
             # test also for a gzipped file...
         if not os.path.isfile(filename):
             filename = filename + ".gz"
+        stat = os.stat(filename)
+        cache_key = (os.path.abspath(filename), stat.st_size, stat.st_mtime_ns)
+        if cache_key in _METADATA_CACHE:
+            return _METADATA_CACHE[cache_key]
         self.logger.warning(f"Reading file {filename}")
 
         struct_data = {}
-        suffix = pathlib.Path(filename).suffix
-        if suffix == ".gz":
-            f_out = tempfile.NamedTemporaryFile(delete=False)
-            with gzip.open(filename, "r") as f_in:
-                shutil.copyfileobj(f_in, f_out)
-            filename = f_out.name
-            f_in.close()
-
-        with open(filename) as f:
+        with open_text_file(filename) as f:
             # read header...
             # Countrycode Timezone Namespace   AirQualityNetwork AirQualityStation AirQualityStationEoICode   AirQualityStationNatCode   SamplingPoint  SamplingProces Sample   AirPollutantCode  ObservationDateBegin ObservationDateEnd   Projection  Longitude   Latitude Altitude MeasurementType   AirQualityStationType   AirQualityStationArea   EquivalenceDemonstrated MeasurementEquipment InletHeight BuildingDistance  KerbDistance
             header = f.readline().lower().rstrip().split()
@@ -438,29 +422,20 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
                     bad_line_no += 1
                     bad_line_arr.append(line)
                     continue
-                temp_dict = {}
-                for idx, key in enumerate(header):
-                    if header[idx] != self.VAR_CODE_NAME:
-                        # data_dict[header[idx]] = rows[idx]
-                        temp_dict[header[idx]] = rows[idx]
-                    else:
-                        # extract the EEA var code from the URL noted in the data file
-                        # data_dict[header[idx]] = rows[idx].split('/')[-1]
-                        temp_dict[header[idx]] = rows[idx].split("/")[-1]
+                temp_dict = dict(zip(header, rows))
+                # extract the EEA var code from the URL noted in the data file
+                temp_dict[self.VAR_CODE_NAME] = temp_dict[self.VAR_CODE_NAME].split("/")[-1]
 
                 meta_key = f"{temp_dict['airqualitystation']}__{temp_dict['airpollutantcode']}"
                 if meta_key not in struct_data:
-                    struct_data[meta_key] = temp_dict.copy()
-                else:
-                    pass
+                    struct_data[meta_key] = temp_dict
                 lineidx += 1
 
         self.logger.info(f"Reading file {filename} done")
-        # remove the temp file in case the input file was a gz file
-        if suffix == ".gz":
-            f_out.close()
-            os.remove(f_out.name)
-
+        # drop outdated versions of this file
+        for key in [key for key in _METADATA_CACHE if key[0] == cache_key[0]]:
+            del _METADATA_CACHE[key]
+        _METADATA_CACHE[cache_key] = struct_data
         return struct_data
 
     def get_file_list(self, pattern=None):
@@ -506,6 +481,36 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
         self.files = files
         return files
 
+    def _assign_vars_to_files(self, files, file_masks):
+        """Find variables to be read from each file
+
+        Parameters
+        ----------
+        files : list
+            list of files
+        file_masks : dict
+            file masks of variables to be read
+
+        Returns
+        -------
+        list
+            files that contain at least one of the variables
+        list
+            keyword args for :func:`read_file` (one per file)
+        """
+        if len(set(file_masks.values())) == 1:
+            # all variables are in the same files
+            return files, [dict(var_name=list(file_masks))] * len(files)
+        name_masks = {var: os.path.basename(mask) for var, mask in file_masks.items()}
+        files_out, file_kwargs = [], []
+        for _file in files:
+            fname = os.path.basename(_file)
+            var_name = [var for var, mask in name_masks.items() if fnmatch.fnmatch(fname, mask)]
+            if len(var_name) > 0:
+                files_out.append(_file)
+                file_kwargs.append(dict(var_name=var_name))
+        return files_out, file_kwargs
+
     def get_station_coords(self, meta_key):
         """
         get a station's coordinates
@@ -533,7 +538,9 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
             all variables in :attr:`PROVIDES_VARIABLES` are loaded.
         files : :obj:`list`, optional
             List of files to be read. If None, then the file list used is the
-            returned from :func:`get_file_list`.
+            returned from :func:`get_file_list`. If the variables are stored
+            in different files, each file is assigned to the variables whose
+            file mask (cf. :attr:`FILE_MASKS`) it matches.
         first_file : :obj:`int`, optional
             Index of the first file in :obj:'file' to be read. If None, the
             very first file in the list is used.
@@ -555,15 +562,17 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
         elif isinstance(vars_to_retrieve, str):
             vars_to_retrieve = [vars_to_retrieve]
 
-        if len(vars_to_retrieve) > 1:
-            raise NotImplementedError("So far, only one variable can be read at a time...")
-        var_name = vars_to_retrieve[0]
+        for var in vars_to_retrieve:
+            if not var in self.PROVIDES_VARIABLES:
+                raise ValueError(f"Invalid input variable {var}")
+        file_masks = {var: self.FILE_MASKS[var] for var in vars_to_retrieve}
         logger.info("Reading EEA data")
         if files is None:
-            if len(self.files) == 0:
-                logger.info("Retrieving file list")
-                files = self.get_file_list(self.FILE_MASKS[var_name])
-            files = self.files
+            logger.info("Retrieving file list")
+            if len(set(file_masks.values())) == 1:
+                files = self.get_file_list(file_masks[vars_to_retrieve[0]])
+            else:
+                files = self.get_file_list(self.FILE_MASK_ALL)
 
         if first_file is None:
             first_file = 0
@@ -574,6 +583,7 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
             metadatafile = os.path.join(self.data_dir, self.DEFAULT_METADATA_FILE)
 
         files = files[first_file:last_file]
+        files, file_kwargs = self._assign_vars_to_files(files, file_masks)
 
         data_obj = UngriddedData()
         meta_key = 0.0
@@ -591,10 +601,10 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
         _country_dict = get_country_name_from_iso()
         logger.info("Reading files...")
 
-        for i in tqdm(range(len(files))):
-            _file = files[i]
+        var_indices = {var: var_idx for var_idx, var in enumerate(vars_to_retrieve)}
+        for _file, result in self.iter_read_files(files, file_kwargs):
             try:
-                station_data = self.read_file(_file, var_name=var_name)
+                station_data = result.get()
             except EEAv2FileError:
                 self.logger.warning(f"file {_file} is corrupt! consider deleting it")
                 continue
@@ -644,13 +654,15 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
 
             # List with indices of this station for each variable
             num_times = len(station_data["dtime"])
+            station_vars = list(station_data.var_info)
+            totnum = num_times * len(station_vars)
 
             # Check whether the size of the data object needs to be extended
-            if (idx + num_times) >= data_obj._ROWNO:
+            if (idx + totnum) >= data_obj._ROWNO:
                 # if totnum < data_obj._CHUNKSIZE, then the latter is used
-                data_obj.add_chunk(num_times)
+                data_obj.add_chunk(totnum)
 
-            for var_idx, var in enumerate(list(station_data.var_info)):
+            for i, var in enumerate(station_vars):
                 # set invalid data to np.nan according to
                 # https://dd.eionet.europa.eu/vocabulary/aq/observationvalidity/view
                 # data flagged as below the detection limit (values 2 and 3)
@@ -658,7 +670,8 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
                 station_data[var][station_data["validity"] < 1] = np.nan
 
                 values = station_data[var]
-                start = idx + var_idx * num_times
+                var_idx = var_indices[var]
+                start = idx + i * num_times
                 stop = start + num_times
 
                 data_obj._data[start:stop, data_obj._METADATAKEYINDEX] = meta_key
@@ -670,7 +683,7 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
                 if not var in data_obj.var_idx:
                     data_obj.var_idx[var] = var_idx
 
-            idx += num_times
+            idx += totnum
             meta_key = meta_key + 1.0
 
         # Shorten data_obj._data to the right number of points
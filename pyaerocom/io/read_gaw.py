@@ -304,8 +304,8 @@ class ReadGAW(ReadUngriddedBase):
         metadata = data_obj.metadata
         meta_idx = data_obj.meta_idx
 
-        for i, _file in enumerate(files):
-            station_data = self.read_file(_file, vars_to_retrieve=vars_to_retrieve)
+        for _file, result in self.iter_read_files(files, vars_to_retrieve=vars_to_retrieve):
+            station_data = result.get()
 
             # only the variables in the file
             num_vars = len(station_data.var_info.keys())
@@ -579,17 +579,19 @@ class ReadGhost(ReadUngriddedBase):
         meta_idx = data_obj.meta_idx
         var_count_glob = -1
         rename = self.var_names_data_inv
-        from tqdm import tqdm
+        file_kwargs = []
+        for _file in files:
+            var_to_read = self.get_meta_filename(_file)["var_name"]
+            file_kwargs.append(dict(var_to_read=var_to_read, var_to_write=rename[var_to_read]))
 
-        for i in tqdm(range(len(files))):
-            _file = files[i]
+        for _file, result in self.iter_read_files(files, file_kwargs, **kwargs):
             metafile = self.get_meta_filename(_file)
             var_to_read = metafile["var_name"]
             begin = metafile["start"]
             end = metafile["stop"]
 
             var_read = rename[var_to_read]
-            stats = self.read_file(_file, var_to_read=var_to_read, var_to_write=var_read, **kwargs)
+            stats = result.get()
 
             stats, added = self.compute_additional_vars(stats, vars_to_compute)
             if len(stats) == 0:
@@ -1,7 +1,8 @@
+import io
 import logging
 
 import numpy as np
-from tqdm import tqdm
+import pandas as pd
 
 from pyaerocom import const
 from pyaerocom.exceptions import (
@@ -200,6 +201,125 @@ class ReadAeronetBase(ReadUngriddedBase):
         self._last_col_order = cols
         return col_index
 
+    @staticmethod
+    def _meta_col_to_array(values):
+        """Convert metadata column into numerical array, if possible
+
+        Equivalent to converting each value individually via :func:`float`
+        (values that cannot be converted are kept as they are) and creating
+        an array from the resulting list. Only unique values are converted.
+        """
+        codes, uniques = pd.factorize(values)
+        uniques = np.asarray(uniques, dtype=object)
+        try:
+            return uniques.astype(float)[codes]
+        except ValueError:
+            pass
+        num = pd.to_numeric(uniques, errors="coerce")
+        is_num = ~np.isnan(num)
+        if not is_num.any():
+            return uniques.astype(str)[codes]
+        converted = np.where(is_num, num.astype(object), uniques)
+        return np.asarray(converted[codes].tolist())
+
+    @staticmethod
+    def _dtime_from_date_time(dates, times):
+        """Convert date (dd:mm:yyyy) and time (hh:mm:ss) columns into datetime64"""
+        date_codes, date_uniques = pd.factorize(dates)
+        time_codes, time_uniques = pd.factorize(times)
+        try:
+            days = pd.to_datetime(date_uniques, format="%d:%m:%Y").values
+            clock = pd.to_datetime(time_uniques, format="%H:%M:%S")
+            offsets = (clock - clock.normalize()).values
+        except ValueError:
+            dtime = []
+            for date, time in zip(dates, times):
+                day, month, year = date.split(":")
+                dtime.append(np.datetime64(f"{year}-{month}-{day}T{time}"))
+            return np.asarray(dtime)
+        return (days[date_codes] + offsets[time_codes]).astype("datetime64[s]")
+
+    def _read_data_block(self, lines, vars_available, filename, strip_lines=False):
+        """Parse data block of file into numpy arrays
+
+        Fast equivalent of splitting each line at :attr:`COL_DELIM` and
+        converting the values of the data and metadata columns one by one.
+        The required columns (cf. :attr:`col_index`) are parsed at once
+        using the C parser of :func:`pandas.read_csv`. Lines that have a
+        different number of columns than the first line are skipped (a
+        warning with the number of skipped lines is logged).
+
+        Parameters
+        ----------
+        lines : list
+            lines of data block (including line endings)
+        vars_available : dict
+            variables to be read (keys) and corresponding column indices
+        filename : str
+            name of file (for logging)
+        strip_lines : bool
+            if False, the line ending is considered part of the last column
+            (which is relevant, if that column contains string metadata)
+
+        Returns
+        -------
+        dict
+            arrays for each metadata key in :attr:`META_NAMES_FILE`, for each
+            variable in `vars_available` and for the time stamps (key dtime)
+        """
+        col_index = self.col_index
+        out = {}
+        delim = self.COL_DELIM
+        # corrupt lines are detected upfront, since on_bad_lines of
+        # pandas.read_csv ignores short lines and, with usecols, also long ones
+        counts = np.fromiter((line.count(delim) for line in lines), int, len(lines))
+        valid = counts == counts[0] if len(lines) else counts.astype(bool)
+        corrupt = np.flatnonzero(~valid)
+        if len(corrupt) > 0:
+            self.logger.warning(
+                f"Skipping {len(corrupt)} of {len(lines)} data lines in {filename} that "
+                f"have a different number of columns than the first line "
+                f"(line numbers in data block: {corrupt.tolist()})"
+            )
+        if not valid.any():
+            out["dtime"] = np.asarray([])
+            for key in list(self.META_NAMES_FILE) + list(vars_available):
+                out[key] = np.asarray([])
+            return out
+        if not valid.all():
+            lines = [line for line, ok in zip(lines, valid) if ok]
+
+        meta_cols = {key: col_index[key] for key in self.META_NAMES_FILE}
+        usecols = sorted(set(meta_cols.values()) | set(vars_available.values()))
+        dtype = {col: str for col in meta_cols.values()}
+        dtype.update({col: np.float64 for col in vars_available.values()})
+        table = pd.read_csv(
+            io.StringIO("".join(lines)),
+            sep=delim,
+            header=None,
+            usecols=usecols,
+            dtype=dtype,
+            na_filter=False,
+            skip_blank_lines=False,
+            float_precision="round_trip",
+        )
+        last_col = counts[valid][0]
+        for key, col in meta_cols.items():
+            values = table[col].values
+            if col == last_col and not strip_lines:
+                endings = np.asarray([line[len(line.rstrip("\r\n")) :] for line in lines])
+                values = (values.astype(str).astype(object) + endings).astype(object)
+            out[key] = self._meta_col_to_array(values)
+
+        out["dtime"] = self._dtime_from_date_time(
+            table[meta_cols["date"]].values, table[meta_cols["time"]].values
+        )
+        for var, col in vars_available.items():
+            values = table[col].values
+            values[values == self.NAN_VAL] = np.nan
+            out[var] = values
+        return out
+
     def _check_alternative_colnames(self, val, mapping):
         if val in self.META_NAMES_FILE_ALT:
             alt_names = self.META_NAMES_FILE_ALT[val]
@@ -365,13 +485,11 @@ class ReadAeronetBase(ReadUngriddedBase):
         meta_idx = data_obj.meta_idx
 
         num_vars = len(vars_to_retrieve)
-        num_files = len(files)
         logger.info("Reading AERONET data")
         skipped = 0
-        for i in tqdm(range(num_files)):
-            _file = files[i]
+        for _file, result in self.iter_read_files(files, vars_to_retrieve=vars_to_retrieve):
             try:
-                station_data = self.read_file(_file, vars_to_retrieve=vars_to_retrieve)
+                station_data = result.get()
             except AeronetReadError as e:
                 self.logger.warning(f"\n{repr(e)}.")
                 skipped += 1
@@ -1,4 +1,5 @@
 import fnmatch
+import json
 import logging
 import os
 import warnings
@@ -10,7 +11,7 @@ import numpy as np
 import pandas as pd
 import xarray as xr
 
-from pyaerocom import const
+from pyaerocom import __version__, const
 from pyaerocom._concprcp_units_helpers import compute_concprcp_from_pr_and_wetdep
 from pyaerocom.exceptions import (
     DataCoverageError,
@@ -32,6 +33,7 @@ from pyaerocom.io.aux_read_cubes import (
     multiply_cubes,
     subtract_cubes,
 )
+from pyaerocom.io.file_info_cache import FileInfoCache
 from pyaerocom.io.fileconventions import FileConventionRead
 from pyaerocom.io.helpers import add_file_to_log
 from pyaerocom.io.iris_io import concatenate_iris_cubes, load_cubes_custom
@@ -169,6 +171,10 @@ class ReadGridded:
 
     VERT_ALT = {"Surface": "ModelLevel"}
 
+    #: Name of database file (in :attr:`const.CACHEDIR`) used to cache the
+    #: file information of data directories (cf. :func:`search_all_files`)
+    FILE_INFO_CACHE_DB_NAME = "gridded_file_info.sqlite3"
+
     def __init__(self, data_id=None, data_dir=None, file_convention="aerocom3"):
 
         self._data_dir = None
@@ -184,6 +190,7 @@ class ReadGridded:
         self.file_convention = FileConventionRead(file_convention)
 
         self.file_info = None
+        self._file_info_cache = None
 
         #: List of unique Aerocom variable names that were identified from
         #: the filenames in the data directory
@@ -298,6 +305,17 @@ class ReadGridded:
         """File type of data files"""
         return const.GRID_IO.FILE_TYPE
 
+    @property
+    def file_info_cache(self):
+        """Persistent cache of :attr:`file_info` (None if caching is inactive)"""
+        cachedir = const.CACHEDIR
+        if not const.CACHING or cachedir is None:
+            return None
+        db = os.path.join(cachedir, self.FILE_INFO_CACHE_DB_NAME)
+        if self._file_info_cache is None or self._file_info_cache.database != db:
+            self._file_info_cache = FileInfoCache(db)
+        return self._file_info_cache
+
     @property
     def TS_TYPES(self):
         """List with valid filename encryptions specifying temporal resolution
@@ -802,6 +820,43 @@ class ReadGridded:
             self.ignore_vert_code = True
         return df
 
+    def _file_info_cache_key(self, update_file_convention):
+        """Key of file info of current data directory and reader setup in cache"""
+        return json.dumps(
+            [
+                os.path.abspath(self.data_dir),
+                self.data_id,
+                self.file_type,
+                update_file_convention,
+                self.file_convention.to_dict(),
+                const.MIN_YEAR,
+                const.MAX_YEAR,
+                __version__,
+            ]
+        )
+
+    def _file_info_fingerprint(self, files):
+        """Fingerprint of data directory, changes if files are added or removed"""
+        return f"{os.stat(self.data_dir).st_mtime_ns}_{len(files)}"
+
+    def _get_file_info_state(self):
+        return dict(
+            file_info=self.file_info,
+            vars_2d=self._vars_2d,
+            vars_3d=self._vars_3d,
+            data_id=self.data_id,
+            file_convention=self.file_convention.to_dict(),
+            ignore_vert_code=self.ignore_vert_code,
+        )
+
+    def _set_file_info_state(self, state):
+        self.file_info = state["file_info"]
+        self._vars_2d = state["vars_2d"]
+        self._vars_3d = state["vars_3d"]
+        self.data_id = state["data_id"]
+        self.file_convention.from_dict(state["file_convention"])
+        self.ignore_vert_code = state["ignore_vert_code"]
+
     def search_all_files(self, update_file_convention=True):
         """Search all valid model files for this model
 
@@ -815,6 +870,10 @@ class ReadGridded:
         the data directory are not mixed but all correspond to either of the
         conventions defined in
 
+        The results are cached in :attr:`file_info_cache` and reused as long
+        as no files are added to or removed from the data directory (i.e. its
+        modification time and the number of files are unchanged).
+
         Parameters
         ----------
         update_file_convention : bool
@@ -838,6 +897,17 @@ class ReadGridded:
             )
             return
 
+        cache = self.file_info_cache
+        if cache is not None:
+            cache_key = self._file_info_cache_key(update_file_convention)
+            fingerprint = self._file_info_fingerprint(files)
+            state = cache.get(cache_key, fingerprint)
+            if state is not None:
+                self._set_file_info_state(state)
+                if len(self.file_info) == 0:
+                    raise DataCoverageError(f"No valid files could be found for {self.data_id}")
+                return
+
         if update_file_convention:
             # Check if the found file has a naming according the aerocom conventions
             # and set the convention for all files (maybe this need to be
@@ -852,6 +922,8 @@ class ReadGridded:
         result = self._evaluate_fileinfo(files)
         df = self._fileinfo_to_dataframe(result)
         self.file_info = df
+        if cache is not None:
+            cache.put(cache_key, fingerprint, self._get_file_info_state())
 
         if len(df) == 0:
             raise DataCoverageError(f"No valid files could be found for {self.data_id}")
@@ -1626,7 +1698,11 @@ class ReadGridded:
             if this is set, the `var_name` attribute of the output
             `GriddedData` object will be updated accordingly.
         **kwargs
-            additional keyword args parsed to :func:`_load_var`
+            additional keyword args parsed to :func:`_load_var`, e.g.
+            ``lon_range``, ``lat_range`` or ``levels``, which are applied
+            to each file on load (cf. :func:`_load_files`). The returned data
+            is not loaded into memory (i.e. it remains dask-backed) until it is
+            accessed.
 
         Returns
         -------
@@ -1996,9 +2072,21 @@ class ReadGridded:
                 self.logger.warning(repr(e))
         return tuple(data)
 
-    def _load_files(self, files, var_name, perform_fmt_checks=None):
+    def _load_files(
+        self,
+        files,
+        var_name,
+        perform_fmt_checks=None,
+        lon_range=None,
+        lat_range=None,
+        levels=None,
+    ):
         """Load list of files containing variable to read into Cube instances
 
+        Cropping in longitude, latitude and vertical dimension is applied to
+        each file on load, so that only the selected part of the data is read
+        from disk when it is accessed.
+
         Parameters
         ----------
         files : list
@@ -2008,6 +2096,13 @@ class ReadGridded:
         perform_fmt_checks : bool
             if True, the loaded data is checked for consistency with
             AeroCom default requirements.
+        lon_range : tuple, optional
+            longitude range for cropping (cf.
+            :func:`pyaerocom.io.iris_io.crop_cube`)
+        lat_range : tuple, optional
+            latitude range for cropping
+        levels : int or slice or list, optional
+            indices of vertical levels to be extracted
 
         Returns
         -------
@@ -2021,6 +2116,9 @@ class ReadGridded:
             var_name=var_name,
             file_convention=self.file_convention,
             perform_fmt_checks=perform_fmt_checks,
+            lon_range=lon_range,
+            lat_range=lat_range,
+            levels=levels,
         )
 
         if len(loaded_files) == 0:
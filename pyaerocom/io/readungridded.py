@@ -350,13 +350,13 @@ class ReadUngridded:
             e.g. using `data_var1 & data_var2`.
         **kwargs
             Additional input options for reading of data, which are applied
-            WHILE the data is read. If any such additional options are
-            provided that are applied during the reading, then automatic
-            caching of the output `UngriddedData` object will be deactivated.
-            Thus, it is recommended to handle data filtering via `filter_post`
-            argument whenever possible, which will result in better performance
-            as the unconstrained original data is read in and cached, and then
-            the filtering is applied.
+            WHILE the data is read. The output `UngriddedData` object is
+            cached separately for each set of such reading constraints (cf.
+            :attr:`CacheHandlerUngridded.read_constraints`), if they cannot
+            be converted into a stable cache key, automatic caching is
+            deactivated. Note that filtering via `filter_post` allows to
+            reuse one cached object of the unconstrained data for different
+            filters.
 
         Returns
         --------
@@ -364,11 +364,6 @@ class ReadUngridded:
             data object
         """
         _caching = None
-        if len(kwargs) > 0:
-            _caching = const.CACHING
-            const.CACHING = False
-
-            logger.info("Received additional reading constraints, ignoring caching")
 
         reader = self.get_lowlevel_reader(data_id)
 
@@ -387,7 +382,13 @@ class ReadUngridded:
                 f"None of the input variables ({vars_to_retrieve}) is "
                 f"supported by {data_id} interface"
             )
-        cache = CacheHandlerUngridded(reader)
+        try:
+            cache = CacheHandlerUngridded(reader, read_constraints=kwargs)
+        except ValueError as e:
+            _caching = const.CACHING
+            const.CACHING = False
+            logger.info(f"Cannot derive cache key from reading constraints, ignoring caching: {e}")
+            cache = CacheHandlerUngridded(reader)
         if not self.ignore_cache:
             # initate cache handler
             for var in vars_available:
@@ -519,13 +520,13 @@ class ReadUngridded:
             e.g. using `data_var1 & data_var2`.
         **kwargs
             Additional input options for reading of data, which are applied
-            WHILE the data is read. If any such additional options are
-            provided that are applied during the reading, then automatic
-            caching of the output `UngriddedData` object will be deactivated.
-            Thus, it is recommended to handle data filtering via `filter_post`
-            argument whenever possible, which will result in better performance
-            as the unconstrained original data is read in and cached, and then
-            the filtering is applied.
+            WHILE the data is read. The output `UngriddedData` object is
+            cached separately for each set of such reading constraints (cf.
+            :attr:`CacheHandlerUngridded.read_constraints`), if they cannot
+            be converted into a stable cache key, automatic caching is
+            deactivated. Note that filtering via `filter_post` allows to
+            reuse one cached object of the unconstrained data for different
+            filters.
 
         Returns
         --------
@@ -625,13 +626,13 @@ class ReadUngridded:
             e.g. using `data_var1 & data_var2`.
         **kwargs
             Additional input options for reading of data, which are applied
-            WHILE the data is read. If any such additional options are
-            provided that are applied during the reading, then automatic
-            caching of the output `UngriddedData` object will be deactivated.
-            Thus, it is recommended to handle data filtering via `filter_post`
-            argument whenever possible, which will result in better performance
-            as the unconstrained original data is read in and cached, and then
-            the filtering is applied.
+            WHILE the data is read. The output `UngriddedData` object is
+            cached separately for each set of such reading constraints (cf.
+            :attr:`CacheHandlerUngridded.read_constraints`), if they cannot
+            be converted into a stable cache key, automatic caching is
+            deactivated. Note that filtering via `filter_post` allows to
+            reuse one cached object of the unconstrained data for different
+            filters.
 
         Example
         -------
@@ -1,11 +1,14 @@
 import abc
+import copy
 import glob
 import logging
 import os
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from fnmatch import fnmatch
 
 import numpy as np
+from tqdm import tqdm
 
 from pyaerocom import const
 from pyaerocom._lowlevel_helpers import list_to_shortstr
@@ -15,6 +18,41 @@ from pyaerocom.io.helpers import get_obsnetwork_dir
 
 logger = logging.getLogger(__name__)
 
+#: reader instance used in worker processes of :func:`ReadUngriddedBase.iter_read_files`
+_WORKER_READER = None
+
+
+def _init_read_worker(reader):
+    global _WORKER_READER
+    _WORKER_READER = reader
+
+
+def _read_file_worker(filename, kwargs):
+    try:
+        return FileReadResult(_WORKER_READER.read_file(filename, **kwargs))
+    except Exception as e:
+        return FileReadResult(error=e)
+
+
+class FileReadResult:
+    """Output of :func:`ReadUngriddedBase.read_file` for one file
+
+    Exceptions that occurred while reading the file are raised on
+    :func:`get`, so that they can be handled by the caller as if
+    :func:`ReadUngriddedBase.read_file` was called directly.
+    """
+
+    def __init__(self, value=None, error=None):
+        self.value = value
+        self.error = error
+
+    def get(self):
+        """Output of read_file (raises exception if reading failed)"""
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
 # TODO: Proposal: include attribute ts_type that is by default undefined but
 # may be set to either of the defined
 class ReadUngriddedBase(abc.ABC):
@@ -52,6 +90,11 @@ class ReadUngriddedBase(abc.ABC):
 
     _FILEMASK = "*.*"
 
+    #: number of processes used to read the data files in :func:`read` (cf.
+    #: :func:`iter_read_files`). If None, then
+    #: :attr:`pyaerocom.const.OBS_READ_NUM_WORKERS` is used.
+    num_workers = None
+
     def __str__(self):
         return (
             f"Dataset name: {self.data_id}\n"
@@ -603,6 +646,69 @@ class ReadUngriddedBase(abc.ABC):
         self.files = files
         return files
 
+    def iter_read_files(self, files, file_kwargs=None, desc=None, **kwargs):
+        """Iterate over output of :func:`read_file` for a list of files
+
+        If more than one worker is used (cf. :attr:`num_workers`), the files
+        are read in a process pool, else one after another. In either case,
+        the results are returned in the order of the input files.
+
+        Parameters
+        ----------
+        files : list
+            files to be read
+        file_kwargs : list, optional
+            list of dictionaries with file specific keyword args for
+            :func:`read_file` (one per file), these are combined with
+            `**kwargs`.
+        desc : str, optional
+            description shown in progress bar
+        **kwargs
+            keyword args passed to :func:`read_file` for each file
+
+        Yields
+        ------
+        str
+            file path
+        FileReadResult
+            result of :func:`read_file` for that file, use
+            :func:`FileReadResult.get` to access the output (raises the
+            exception that occurred while reading, if applicable).
+        """
+        if file_kwargs is None:
+            file_kwargs = [{}] * len(files)
+        elif len(file_kwargs) != len(files):
+            raise ValueError("file_kwargs need to be specified for each input file")
+        file_kwargs = [{**kwargs, **kws} for kws in file_kwargs]
+
+        num_workers = self.num_workers
+        if num_workers is None:
+            num_workers = const.OBS_READ_NUM_WORKERS
+        num_workers = min(num_workers, len(files))
+
+        if num_workers > 1:
+            results = self._iter_read_files_pool(files, file_kwargs, num_workers)
+        else:
+            results = self._iter_read_files_sequential(files, file_kwargs)
+        yield from zip(files, tqdm(results, total=len(files), desc=desc))
+
+    def _iter_read_files_sequential(self, files, file_kwargs):
+        for _file, kwargs in zip(files, file_kwargs):
+            try:
+                yield FileReadResult(self.read_file(_file, **kwargs))
+            except Exception as e:
+                yield FileReadResult(error=e)
+
+    def _iter_read_files_pool(self, files, file_kwargs, num_workers):
+        reader = copy.copy(self)
+        reader.data = None  # do not send previously loaded data to workers
+        chunksize = max(1, len(files) // (num_workers * 8))
+        logger.info(f"Reading {len(files)} files using {num_workers} processes")
+        with ProcessPoolExecutor(
+            max_workers=num_workers, initializer=_init_read_worker, initargs=(reader,)
+        ) as pool:
+            yield from pool.map(_read_file_worker, files, file_kwargs, chunksize=chunksize)
+
     def read_station(self, station_id_filename, **kwargs):
         """Read data from a single station into :class:`UngriddedData`
 
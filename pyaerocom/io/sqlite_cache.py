@@ -0,0 +1,146 @@
+"""
+Persistent key/value cache based on a SQLite database
+"""
+import logging
+import os
+import pickle
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+
+class SqliteCache:
+    """SQLite based cache for picklable objects
+
+    Base class for caches that store one object per key in a database
+    table, together with additional check values (e.g. the modification
+    time of a file). Entries are only returned if the check values and the
+    version (:attr:`__version__`) are unchanged, otherwise they are
+    overwritten when the object is computed again. The database may be
+    shared between processes.
+
+    The table layout is specified by the class attributes :attr:`TABLE`,
+    :attr:`KEY_COLUMN`, :attr:`CHECK_COLUMNS` and :attr:`VALUE_COLUMN`.
+
+    Note
+    ----
+    Database connections are opened per process (cf. :attr:`con`), so that
+    the cache can be used in forked worker processes. Errors when accessing
+    the database (e.g. if it is locked by another process for longer than
+    :attr:`TIMEOUT`) are logged and treated as cache misses.
+
+    Parameters
+    ----------
+    database : str
+        path to sqlite database file (is created if it does not exist)
+    """
+
+    #: Version of cached objects. Entries with a different version are
+    #: ignored
+    __version__ = "1"
+
+    #: Seconds to wait for a lock on the database
+    TIMEOUT = 30
+
+    #: Name of database table
+    TABLE = "cache"
+
+    #: Name of primary key column
+    KEY_COLUMN = "key"
+
+    #: Names and types of columns that need to match for an entry to be valid
+    CHECK_COLUMNS = ()
+
+    #: Name of column containing the pickled objects
+    VALUE_COLUMN = "value"
+
+    def __init__(self, database):
+        self.database = database
+        self._cons = {}
+
+    def __getstate__(self):
+        # sqlite connections cannot be pickled (e.g. when sending objects
+        # to worker processes), reconnect on demand
+        state = self.__dict__.copy()
+        state["_cons"] = {}
+        return state
+
+    @property
+    def con(self):
+        """Connection to database (table is created if it does not exist)
+
+        The connection is opened once per process, since sqlite connections
+        must not be used in processes forked after they were opened.
+        """
+        pid = os.getpid()
+        if not pid in self._cons:
+            con = sqlite3.connect(self.database, timeout=self.TIMEOUT)
+            # this is a cache, no need to wait for data to be flushed to disk
+            con.execute("pragma journal_mode=wal")
+            con.execute("pragma synchronous=normal")
+            columns = [f"{self.KEY_COLUMN} text primary key"]
+            columns.extend(f"{name} {dtype}" for name, dtype in self.CHECK_COLUMNS)
+            columns.extend(["version text", f"{self.VALUE_COLUMN} blob"])
+            with con:
+                con.execute(f"create table if not exists {self.TABLE} ({', '.join(columns)})")
+            self._cons[pid] = con
+        return self._cons[pid]
+
+    def get(self, key, checks=()):
+        """Get cached object
+
+        Parameters
+        ----------
+        key : str
+            key of cache entry
+        checks : tuple
+            current values of :attr:`CHECK_COLUMNS`
+
+        Returns
+        -------
+        object or None
+            cached object or None if the key is not in the cache or the check
+            values or version have changed
+        """
+        conditions = " and ".join(
+            f"{name}=?" for name in [self.KEY_COLUMN, *dict(self.CHECK_COLUMNS), "version"]
+        )
+        try:
+            row = self.con.execute(
+                f"select {self.VALUE_COLUMN} from {self.TABLE} where {conditions}",
+                (key, *checks, self.__version__),
+            ).fetchone()
+            if row is None:
+                return None
+            return pickle.loads(row[0])
+        except (sqlite3.Error, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            logger.warning(f"Failed to access {type(self).__name__} for {key}: {repr(e)}")
+            return None
+
+    def put(self, key, value, checks=()):
+        """Add or update cached object
+
+        Parameters
+        ----------
+        key : str
+            key of cache entry
+        value
+            object to be cached (needs to be picklable)
+        checks : tuple
+            current values of :attr:`CHECK_COLUMNS`
+        """
+        placeholders = ", ".join("?" * (len(self.CHECK_COLUMNS) + 3))
+        try:
+            with self.con as con:
+                con.execute(
+                    f"insert or replace into {self.TABLE} values ({placeholders})",
+                    (key, *checks, self.__version__, pickle.dumps(value)),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to update {type(self).__name__} for {key}: {repr(e)}")
+
+    def close(self):
+        """Close connection to database (of current process)"""
+        con = self._cons.pop(os.getpid(), None)
+        if con is not None:
+            con.close()
@@ -0,0 +1,142 @@
+"""
+Cache for regridders (e.g. area weights) used by :func:`GriddedData.regrid`
+"""
+import hashlib
+import logging
+import os
+import pickle
+from collections import OrderedDict
+
+import iris.analysis
+import numpy as np
+
+from pyaerocom import const
+
+logger = logging.getLogger(__name__)
+
+#: Version of cached regridders. Regridders with a different version are
+#: ignored
+__version__ = "1"
+
+#: maximum number of regridders kept in memory by :func:`get_regridder`
+MAX_CACHED_REGRIDDERS = 16
+
+#: name of subdirectory in :attr:`const.CACHEDIR` where regridders are stored
+#: (cf. :attr:`const.REGRID_CACHE_TO_DISK`)
+CACHE_SUBDIR = "regridders"
+
+#: regridding schemes whose regridders are cached (other schemes are not
+#: cached since they may not be identifiable via their representation)
+CACHEABLE_SCHEMES = (iris.analysis.AreaWeighted, iris.analysis.Linear, iris.analysis.Nearest)
+
+_REGRIDDERS = OrderedDict()
+
+
+def _grid_fingerprint(cube):
+    """Fingerprint of horizontal grid of cube (all that iris compares)"""
+    sha = hashlib.sha1()
+    for axis in ("X", "Y"):
+        coord = cube.coord(axis=axis, dim_coords=True)
+        meta = (
+            coord.standard_name,
+            coord.long_name,
+            coord.var_name,
+            str(coord.units),
+            repr(coord.coord_system),
+            sorted(coord.attributes.items()),
+            coord.circular,
+        )
+        sha.update(repr(meta).encode())
+        for vals in (coord.points, coord.bounds):
+            if vals is not None:
+                sha.update(f"{vals.dtype}{vals.shape}".encode())
+                sha.update(np.ascontiguousarray(vals).tobytes())
+    return sha.hexdigest()
+
+
+def _cache_file(key):
+    if not (const.REGRID_CACHE_TO_DISK and const.CACHING):
+        return None
+    cachedir = const.CACHEDIR
+    if cachedir is None:
+        return None
+    return os.path.join(cachedir, CACHE_SUBDIR, f"{key}.pkl")
+
+
+def _load_regridder(key):
+    file = _cache_file(key)
+    if file is None or not os.path.exists(file):
+        return None
+    try:
+        with open(file, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+        logger.warning(f"Failed to load cached regridder {file}: {repr(e)}")
+        return None
+
+
+def _save_regridder(key, regridder):
+    file = _cache_file(key)
+    if file is None:
+        return
+    tmp = f"{file}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(file), exist_ok=True)
+        with open(tmp, "wb") as f:
+            pickle.dump(regridder, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, file)
+    except (OSError, pickle.PicklingError) as e:
+        logger.warning(f"Failed to write regridder to cache file {file}: {repr(e)}")
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def get_regridder(scheme, src_cube, target_cube):
+    """Get (cached) regridder from source to target grid
+
+    Regridders (which hold e.g. the area weights) depend only on the
+    regridding scheme and the horizontal source and target grids. They are
+    therefore cached by scheme and grid fingerprints (up to
+    :attr:`MAX_CACHED_REGRIDDERS`) and reused, e.g. for other variables,
+    years or experiments of a model. If :attr:`const.REGRID_CACHE_TO_DISK`
+    is True (and caching is active, cf. :attr:`const.CACHING`), regridders
+    are also stored in :attr:`const.CACHEDIR` and reused across sessions.
+
+    Parameters
+    ----------
+    scheme
+        iris regridding scheme (e.g. :class:`iris.analysis.AreaWeighted`),
+        only schemes in :attr:`CACHEABLE_SCHEMES` are cached
+    src_cube : iris.cube.Cube
+        cube defining source grid
+    target_cube : iris.cube.Cube
+        cube defining target grid
+
+    Returns
+    -------
+    callable
+        regridder that can be applied to cubes on the source grid (cf.
+        :func:`iris.cube.Cube.regrid`)
+    """
+    if not isinstance(scheme, CACHEABLE_SCHEMES):
+        return scheme.regridder(src_cube, target_cube)
+    key = hashlib.sha1(
+        repr(
+            (
+                __version__,
+                repr(scheme),
+                _grid_fingerprint(src_cube),
+                _grid_fingerprint(target_cube),
+            )
+        ).encode()
+    ).hexdigest()
+    regridder = _REGRIDDERS.pop(key, None)
+    if regridder is None:
+        regridder = _load_regridder(key)
+    if regridder is None:
+        regridder = scheme.regridder(src_cube, target_cube)
+        _save_regridder(key, regridder)
+    _REGRIDDERS[key] = regridder
+    while len(_REGRIDDERS) > MAX_CACHED_REGRIDDERS:
+        _REGRIDDERS.popitem(last=False)
+    return regridder
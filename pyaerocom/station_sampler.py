@@ -0,0 +1,284 @@
+"""
+Sampling of gridded data at station coordinates (nearest grid point or
+bilinear interpolation)
+"""
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from pyaerocom.exceptions import DataCoverageError
+
+#: maximum number of samplers kept in the cache of :func:`get_station_sampler`
+MAX_CACHED_SAMPLERS = 32
+
+_SAMPLERS = OrderedDict()
+
+
+class StationSampler:
+    """Index tables for nearest grid point sampling at station coordinates
+
+    The nearest grid points are determined in the same way as in
+    :func:`xarray.DataArray.sel` (with ``method="nearest"``). Stations that
+    are outside of the grid domain are ignored.
+
+    Parameters
+    ----------
+    grid_lat : array
+        latitude coordinates of grid (must be monotonic)
+    grid_lon : array
+        longitude coordinates of grid (must be monotonic)
+    lat : array or similar
+        latitude coordinates of stations
+    lon : array or similar
+        longitude coordinates of stations
+
+    Attributes
+    ----------
+    lat_idx : ndarray
+        latitude index of nearest grid point of each station within domain
+    lon_idx : ndarray
+        longitude index of nearest grid point of each station within domain
+    latitude : ndarray
+        latitude of nearest grid point of each station within domain
+    longitude : ndarray
+        longitude of nearest grid point of each station within domain
+
+    Raises
+    ------
+    DataCoverageError
+        if none of the stations is within the grid domain
+    """
+
+    def __init__(self, grid_lat, grid_lon, lat, lon):
+        grid_lat = np.asarray(grid_lat)
+        grid_lon = np.asarray(grid_lon)
+        lat = np.asarray(lat, dtype=float)
+        lon = np.asarray(lon, dtype=float)
+
+        in_domain = (
+            (lat >= grid_lat.min())
+            & (lat <= grid_lat.max())
+            & (lon >= grid_lon.min())
+            & (lon <= grid_lon.max())
+        )
+        if not in_domain.any():
+            raise DataCoverageError("Coordinates not found in dataarray")
+
+        self.lat_idx = pd.Index(grid_lat).get_indexer(lat[in_domain], method="nearest")
+        self.lon_idx = pd.Index(grid_lon).get_indexer(lon[in_domain], method="nearest")
+        self.latitude = grid_lat[self.lat_idx]
+        self.longitude = grid_lon[self.lon_idx]
+
+    def __len__(self):
+        return len(self.lat_idx)
+
+    def sample(self, data):
+        """Extract data at nearest grid points of stations
+
+        Parameters
+        ----------
+        data : ndarray or dask.array.Array
+            data array with latitude and longitude as last two dimensions
+            (e.g. time, latitude, longitude)
+
+        Returns
+        -------
+        ndarray
+            data at stations, the last dimension is the station dimension
+            (e.g. time, station)
+        """
+        return _take(data, self.lat_idx, self.lon_idx)
+
+
+class BilinearStationSampler:
+    """Index tables and weights for bilinear interpolation at station coordinates
+
+    Stores the indices of the 4 surrounding grid points of each station and
+    the corresponding interpolation weights. Like in
+    :class:`StationSampler`, stations that are outside of the grid domain
+    are ignored, unless the longitude coordinate is circular, in which case
+    longitudes are wrapped and stations between the last and first grid
+    longitude are interpolated across the dateline.
+
+    Parameters
+    ----------
+    grid_lat : array
+        latitude coordinates of grid (must be monotonic)
+    grid_lon : array
+        longitude coordinates of grid (must be monotonic)
+    lat : array or similar
+        latitude coordinates of stations
+    lon : array or similar
+        longitude coordinates of stations
+    lon_circular : bool
+        if True, the longitude coordinate of the grid is circular (cf.
+        :func:`GriddedData.check_lon_circular`)
+
+    Attributes
+    ----------
+    lat_idx : ndarray
+        latitude indices of the 4 corners (shape 4 x number of stations)
+    lon_idx : ndarray
+        longitude indices of the 4 corners (shape 4 x number of stations)
+    weights : ndarray
+        interpolation weights of the 4 corners (shape 4 x number of stations)
+    latitude : ndarray
+        latitude of each station within domain
+    longitude : ndarray
+        longitude of each station within domain
+
+    Raises
+    ------
+    DataCoverageError
+        if none of the stations is within the grid domain
+    """
+
+    def __init__(self, grid_lat, grid_lon, lat, lon, lon_circular=False):
+        grid_lat = np.asarray(grid_lat, dtype=float)
+        grid_lon = np.asarray(grid_lon, dtype=float)
+        lat = np.asarray(lat, dtype=float)
+        lon = np.asarray(lon, dtype=float)
+
+        in_domain = (lat >= grid_lat.min()) & (lat <= grid_lat.max())
+        if not lon_circular:
+            in_domain &= (lon >= grid_lon.min()) & (lon <= grid_lon.max())
+        if not in_domain.any():
+            raise DataCoverageError("Coordinates not found in dataarray")
+        self.latitude = lat[in_domain]
+        self.longitude = lon[in_domain]
+
+        lat0, lat1, wlat = _linear_weights(grid_lat, self.latitude)
+        lon0, lon1, wlon = _linear_weights(grid_lon, self.longitude, lon_circular)
+        self.lat_idx = np.stack([lat0, lat0, lat1, lat1])
+        self.lon_idx = np.stack([lon0, lon1, lon0, lon1])
+        self.weights = np.stack(
+            [(1 - wlat) * (1 - wlon), (1 - wlat) * wlon, wlat * (1 - wlon), wlat * wlon]
+        )
+
+    def __len__(self):
+        return self.weights.shape[-1]
+
+    def sample(self, data):
+        """Interpolate data at station coordinates
+
+        Invalid values (masked or NaN) at any of the surrounding grid points
+        that contribute to the interpolated value (i.e. with non-zero
+        weight) result in an invalid value at the station.
+
+        Parameters
+        ----------
+        data : ndarray or dask.array.Array
+            data array with latitude and longitude as last two dimensions
+            (e.g. time, latitude, longitude)
+
+        Returns
+        -------
+        ndarray
+            data at stations, the last dimension is the station dimension
+            (e.g. time, station). A masked array is returned if the input
+            data is masked.
+        """
+        vals = _take(data, self.lat_idx.ravel(), self.lon_idx.ravel())
+        vals = vals.reshape(vals.shape[:-1] + self.weights.shape)
+        contributes = self.weights > 0
+        mask = None
+        if np.ma.isMaskedArray(vals):
+            mask = (np.ma.getmaskarray(vals) & contributes).any(axis=-2)
+            vals = vals.filled(0)
+        # ignore invalid values at corners without weight
+        vals = np.where(contributes, vals, 0)
+        result = (vals * self.weights).sum(axis=-2)
+        if mask is not None:
+            return np.ma.masked_array(result, mask)
+        return result
+
+
+def _take(data, lat_idx, lon_idx):
+    if isinstance(data, np.ndarray):
+        return data[..., lat_idx, lon_idx]
+    # lazy data: only load grid rows and columns that contain stations
+    lat_idx, lat_inv = np.unique(lat_idx, return_inverse=True)
+    lon_idx, lon_inv = np.unique(lon_idx, return_inverse=True)
+    data = data[..., lat_idx, :][..., lon_idx].compute()
+    return data[..., lat_inv, lon_inv]
+
+
+def _linear_weights(grid, vals, circular=False):
+    """Indices of neighbouring grid points and weight of upper neighbour"""
+    num = len(grid)
+    if num == 1:
+        idx = np.zeros(len(vals), dtype=int)
+        return idx, idx, np.zeros(len(vals))
+    descending = grid[0] > grid[-1]
+    if descending:
+        grid = grid[::-1]
+    if circular:
+        vals = grid[0] + (vals - grid[0]) % 360
+        grid = np.append(grid, grid[0] + 360)
+        idx0 = np.clip(np.searchsorted(grid, vals, side="right") - 1, 0, num - 1)
+    else:
+        idx0 = np.clip(np.searchsorted(grid, vals, side="right") - 1, 0, num - 2)
+    idx1 = idx0 + 1
+    weights = (vals - grid[idx0]) / (grid[idx1] - grid[idx0])
+    idx1 = idx1 % num
+    if descending:
+        idx0, idx1 = num - 1 - idx0, num - 1 - idx1
+    return idx0, idx1, weights
+
+
+def _hash_coords(*coords):
+    sha = hashlib.sha1()
+    for vals in coords:
+        vals = np.ascontiguousarray(vals, dtype=np.float64)
+        sha.update(str(vals.shape).encode())
+        sha.update(vals.tobytes())
+    return sha.hexdigest()
+
+
+def get_station_sampler(grid_lat, grid_lon, lat, lon, scheme="nearest", lon_circular=False):
+    """Get (cached) station sampler for grid and station coordinates
+
+    Samplers are cached by grid and station coordinates (up to
+    :attr:`MAX_CACHED_SAMPLERS`) so that they can be reused, e.g. for
+    different variables of the same model that are colocated with the same
+    stations.
+
+    Parameters
+    ----------
+    grid_lat : array
+        latitude coordinates of grid
+    grid_lon : array
+        longitude coordinates of grid
+    lat : array or similar
+        latitude coordinates of stations
+    lon : array or similar
+        longitude coordinates of stations
+    scheme : str
+        sampling scheme, choose from "nearest" (:class:`StationSampler`) or
+        "linear" (:class:`BilinearStationSampler`)
+    lon_circular : bool
+        if True, the longitude coordinate of the grid is circular (only
+        relevant for scheme "linear")
+
+    Returns
+    -------
+    StationSampler or BilinearStationSampler
+        sampler for input coordinates
+    """
+    if scheme == "nearest":
+        lon_circular = False
+    elif scheme != "linear":
+        raise ValueError(f"Invalid sampling scheme {scheme}, choose from nearest or linear")
+    key = (scheme, lon_circular, _hash_coords(grid_lat, grid_lon), _hash_coords(lat, lon))
+    sampler = _SAMPLERS.pop(key, None)
+    if sampler is None:
+        if scheme == "nearest":
+            sampler = StationSampler(grid_lat, grid_lon, lat, lon)
+        else:
+            sampler = BilinearStationSampler(grid_lat, grid_lon, lat, lon, lon_circular)
+    _SAMPLERS[key] = sampler
+    while len(_SAMPLERS) > MAX_CACHED_SAMPLERS:
+        _SAMPLERS.popitem(last=False)
+    return sampler
@@ -17,7 +17,8 @@ class TimeResampler:
     """Object that can be use to resample timeseries data
 
     It supports hierarchical resampling of :class:`xarray.DataArray` objects
-    and :class:`pandas.Series` objects.
+    and :class:`pandas.Series` objects (or :class:`pandas.DataFrame` objects,
+    in which case all columns are resampled at once).
 
     Hierarchical means, that resampling constraints can be applied for each
     level, that is, if hourly data is to be resampled to monthly, it may be
@@ -54,14 +55,14 @@ class TimeResampler:
 
     @input_data.setter
     def input_data(self, val):
-        if not isinstance(val, (pd.Series, xarr.DataArray)):
-            raise ValueError("Invalid input: need Series or DataArray")
+        if not isinstance(val, (pd.Series, pd.DataFrame, xarr.DataArray)):
+            raise ValueError("Invalid input: need Series, DataFrame or DataArray")
         self._input_data = val
 
     @property
     def fun(self):
         """Resamplig method (depends on input data type)"""
-        if isinstance(self.input_data, pd.Series):
+        if isinstance(self.input_data, (pd.Series, pd.DataFrame)):
             return resample_timeseries
         return resample_time_dataarray
 
@@ -139,40 +140,39 @@ class TimeResampler:
             idx.append(last_entry)
         return idx
 
-    def resample(
-        self, to_ts_type, input_data=None, from_ts_type=None, how=None, min_num_obs=None, **kwargs
-    ):
-        """Resample input data
+    def gen_resample_steps(self, to_ts_type, from_ts_type=None, how=None, min_num_obs=None):
+        """Generate resampling steps for input resolutions and constraints
+
+        Note
+        ----
+        This updates :attr:`last_setup` and :attr:`last_units_preserved`.
 
         Parameters
         ----------
         to_ts_type : str or TsType
             output resolution
-        input_data : pandas.Series or xarray.DataArray
-            data to be resampled
         from_ts_type : str or TsType, optional
             current temporal resolution of data
-        how : str
+        how : str or dict
             string specifying how the data is to be aggregated, default is mean
         min_num_obs : dict or int, optinal
             integer or nested dictionary specifying minimum number of
-            observations required to resample from higher to lower frequency.
-            For instance, if `input_data` is hourly and `to_ts_type` is
-            monthly, you may specify something like::
-
-                min_num_obs =
-                    {'monthly'  :   {'daily'  : 7},
-                     'daily'    :   {'hourly' : 6}}
-
-            to require at least 6 hours per day and 7 days per month.
-
-        **kwargs
-           additional input arguments passed to resampling method
+            observations required to resample from higher to lower frequency
+            (for details see :func:`resample`).
 
         Returns
         -------
-        pandas.Series or xarray.DataArray
-            resampled data object
+        list
+            list of 3-element tuples for each resampling step, containing
+
+            - pandas frequency to which the current is converted
+            - minimum number of not-NaN values required for that step (or None)
+            - aggregator to be used (e.g. mean, median, ...)
+
+        Raises
+        ------
+        TemporalResolutionError
+            if output resolution is higher than current resolution
         """
         if how is None:
             how = "mean"
@@ -195,16 +195,10 @@ class TimeResampler:
         elif isinstance(from_ts_type, str):
             from_ts_type = TsType(from_ts_type)
 
-        if input_data is not None:
-            self.input_data = input_data
-        if self.input_data is None:
-            raise ValueError("Please provide data (Series or DataArray)")
-
         self.last_setup = dict(min_num_obs=min_num_obs, how=how)
 
         if from_ts_type is None:  # native == unknown
-            freq = to_ts_type.to_pandas_freq()
-            data_out = self.fun(self.input_data, freq=freq, how=how, **kwargs)
+            return [(to_ts_type.to_pandas_freq(), None, how)]
         elif to_ts_type > from_ts_type:
             raise TemporalResolutionError(
                 f"Cannot resample time-series from {from_ts_type} to {to_ts_type}"
@@ -215,31 +209,67 @@ class TimeResampler:
                 f"Resampling will be applied anyways which will introduce NaN values "
                 f"at missing time stamps"
             )
-
-            freq = to_ts_type.to_pandas_freq()
             self._last_units_preserved = True
-            data_out = self.fun(self.input_data, freq=freq, how="mean", **kwargs)
+            return [(to_ts_type.to_pandas_freq(), None, "mean")]
 
         elif min_num_obs is None:
-            freq = to_ts_type.to_pandas_freq()
             if not isinstance(how, str):
                 raise ValueError(
                     f"Temporal resampling without constraints can only use string type "
                     f"argument how (e.g. how=mean). Got {how}"
                 )
+            return [(to_ts_type.to_pandas_freq(), None, how)]
 
-            data_out = self.fun(self.input_data, freq=freq, how=how, **kwargs)
+        _idx = self._gen_idx(from_ts_type, to_ts_type, min_num_obs, how)
+        steps = [(TsType(to).to_pandas_freq(), mno, rshow) for to, mno, rshow in _idx]
+        if all([rshow in self.AGGRS_UNIT_PRESERVE for _, _, rshow in steps]):
+            self._last_units_preserved = True
         else:
-            _idx = self._gen_idx(from_ts_type, to_ts_type, min_num_obs, how)
-            data_out = self.input_data
-            aggrs = []
-            for to_ts_type, mno, rshow in _idx:
-                freq = TsType(to_ts_type).to_pandas_freq()
-                data_out = self.fun(data_out, freq=freq, how=rshow, min_num_obs=mno, **kwargs)
-                aggrs.append(rshow)
-
-            if all([x in self.AGGRS_UNIT_PRESERVE for x in aggrs]):
-                self._last_units_preserved = True
-            else:
-                self._last_units_preserved = False
+            self._last_units_preserved = False
+        return steps
+
+    def resample(
+        self, to_ts_type, input_data=None, from_ts_type=None, how=None, min_num_obs=None, **kwargs
+    ):
+        """Resample input data
+
+        Parameters
+        ----------
+        to_ts_type : str or TsType
+            output resolution
+        input_data : pandas.Series or pandas.DataFrame or xarray.DataArray
+            data to be resampled
+        from_ts_type : str or TsType, optional
+            current temporal resolution of data
+        how : str
+            string specifying how the data is to be aggregated, default is mean
+        min_num_obs : dict or int, optinal
+            integer or nested dictionary specifying minimum number of
+            observations required to resample from higher to lower frequency.
+            For instance, if `input_data` is hourly and `to_ts_type` is
+            monthly, you may specify something like::
+
+                min_num_obs =
+                    {'monthly'  :   {'daily'  : 7},
+                     'daily'    :   {'hourly' : 6}}
+
+            to require at least 6 hours per day and 7 days per month.
+
+        **kwargs
+           additional input arguments passed to resampling method
+
+        Returns
+        -------
+        pandas.Series or pandas.DataFrame or xarray.DataArray
+            resampled data object
+        """
+        if input_data is not None:
+            self.input_data = input_data
+        if self.input_data is None:
+            raise ValueError("Please provide data (Series, DataFrame or DataArray)")
+
+        steps = self.gen_resample_steps(to_ts_type, from_ts_type, how, min_num_obs)
+        data_out = self.input_data
+        for freq, mno, rshow in steps:
+            data_out = self.fun(data_out, freq=freq, how=rshow, min_num_obs=mno, **kwargs)
         return data_out
@@ -6,7 +6,7 @@ def browse_database(*args, **kwargs):
 
 def clear_cache():
     """
-    Delete all *.pkl files in cache directory
+    Delete all cache files (*.pkl and associated .npy data files) in cache directory
     """
     from pyaerocom.io.cachehandler_ungridded import CacheHandlerUngridded
 
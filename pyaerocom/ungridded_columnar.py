@@ -0,0 +1,331 @@
+"""
+Columnar (struct-of-arrays) storage backend for :class:`UngriddedData`
+"""
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+#: storage data types of the default columns of :class:`UngriddedData`,
+#: columns that are not listed here (e.g. additional index columns) are
+#: stored as float64
+COLUMN_DTYPES = dict(
+    meta=np.int32,
+    time=np.int64,
+    stoptime=np.int64,
+    latitude=np.float64,
+    longitude=np.float64,
+    altitude=np.float64,
+    varidx=np.int32,
+    data=np.float32,
+    dataerr=np.float32,
+    dataaltitude=np.float32,
+    dataflag=np.uint8,
+    trash=np.float32,
+)
+
+#: values used to encode missing data (NaN) in integer columns. The int64
+#: fill value corresponds to NaT in datetime64 arrays.
+FILL_VALUES = {
+    np.dtype(np.int32): np.iinfo(np.int32).min,
+    np.dtype(np.int64): np.iinfo(np.int64).min,
+    np.dtype(np.uint8): np.iinfo(np.uint8).max,
+}
+
+
+class ColumnarArray:
+    """2D float array interface on top of one typed array per column
+
+    Drop-in replacement for the float64 data matrix of :class:`UngriddedData`
+    (attr. ``_data``). Each column is stored in a separate, contiguous numpy
+    array with a data type suitable for its content (cf.
+    :attr:`COLUMN_DTYPES`), e.g. integer metadata and variable indices,
+    int64 timestamps and float32 data values. Columns are only allocated
+    once valid (non-NaN) data is written into them, so that unused columns
+    (e.g. stop time, errors, trash) do not occupy memory.
+
+    Indexing follows the numpy semantics used for the dense data matrix:
+
+    - ``arr[rows, col]`` returns the column as float64 array, where missing
+      values in integer columns are decoded as NaN.
+    - ``arr[rows]`` or ``arr[rows, :]`` returns a new :class:`ColumnarArray`
+      containing the selected rows.
+    - ``arr[rows, col] = values`` and ``arr[rows] = values`` (2D array or
+      :class:`ColumnarArray`) write data, NaNs are encoded via
+      :attr:`FILL_VALUES` in integer columns.
+
+    Any other access (and functions that require a numpy array, such as
+    :func:`numpy.isnan`) will convert the data into a dense float64 array.
+
+    Note
+    ----
+    Data values are stored in single precision (float32).
+
+    Parameters
+    ----------
+    num_rows : int
+        number of rows
+    index : dict
+        column index mapping (column names are keys, column numbers are
+        values), cf. :attr:`UngriddedData.index`
+    """
+
+    ndim = 2
+    dtype = np.dtype(np.float64)
+
+    def __init__(self, num_rows, index):
+        self._num_rows = int(num_rows)
+        self._dtypes = [np.dtype(np.float64)] * len(index)
+        for name, col in index.items():
+            if name in COLUMN_DTYPES:
+                self._dtypes[col] = np.dtype(COLUMN_DTYPES[name])
+        self._index = index
+        self._columns = [None] * len(index)
+
+    @staticmethod
+    def from_array(arr, index):
+        """Create new instance from dense 2D data array
+
+        Parameters
+        ----------
+        arr : ndarray
+            2D array with shape (rows, columns)
+        index : dict
+            column index mapping
+
+        Returns
+        -------
+        ColumnarArray
+        """
+        arr = np.asarray(arr)
+        if arr.ndim != 2 or arr.shape[1] != len(index):
+            raise ValueError(
+                f"Invalid input shape {arr.shape}, need 2D array with {len(index)} columns"
+            )
+        new = ColumnarArray(len(arr), index)
+        for col in range(len(index)):
+            new._set_column(col, slice(None), arr[:, col])
+        return new
+
+    @staticmethod
+    def concatenate(arrays):
+        """Concatenate multiple arrays along the row dimension
+
+        Parameters
+        ----------
+        arrays : list
+            list of :class:`ColumnarArray` objects and / or dense 2D arrays,
+            the first entry needs to be a :class:`ColumnarArray`
+
+        Returns
+        -------
+        ColumnarArray
+        """
+        first = arrays[0]
+        arrays = [
+            a if isinstance(a, ColumnarArray) else ColumnarArray.from_array(a, first._index)
+            for a in arrays
+        ]
+        new = ColumnarArray(sum(len(a) for a in arrays), first._index)
+        for col, dtype in enumerate(new._dtypes):
+            if all(a._columns[col] is None for a in arrays):
+                continue
+            new._columns[col] = np.concatenate([a._get_raw(col) for a in arrays]).astype(
+                dtype, copy=False
+            )
+        return new
+
+    @property
+    def shape(self):
+        """Shape of the array (rows, columns)"""
+        return (self._num_rows, len(self._columns))
+
+    @property
+    def size(self):
+        """Total number of entries"""
+        return self._num_rows * len(self._columns)
+
+    @property
+    def nbytes(self):
+        """Number of bytes allocated by all columns"""
+        return sum(c.nbytes for c in self._columns if c is not None)
+
+    @property
+    def dtypes(self):
+        """Storage data types of the individual columns"""
+        return list(self._dtypes)
+
+    def __len__(self):
+        return self._num_rows
+
+    def __repr__(self):
+        return f"ColumnarArray(shape={self.shape}, nbytes={self.nbytes})"
+
+    def __array__(self, dtype=None, copy=None):
+        arr = np.full(self.shape, np.nan)
+        for col, data in enumerate(self._columns):
+            if data is not None:
+                arr[:, col] = self._decode(col, data)
+        if dtype is not None:
+            return arr.astype(dtype)
+        return arr
+
+    def copy(self):
+        """Make a copy of this array"""
+        new = ColumnarArray(self._num_rows, self._index)
+        new._columns = [None if c is None else c.copy() for c in self._columns]
+        return new
+
+    def take(self, indices, axis=0):
+        """Select rows, analogous to :func:`numpy.ndarray.take` with axis=0
+
+        Parameters
+        ----------
+        indices : array-like
+            indices of rows to be selected
+        axis : int
+            only 0 (i.e. rows) is supported
+
+        Returns
+        -------
+        ColumnarArray
+        """
+        if axis != 0:
+            raise ValueError("ColumnarArray.take only supports axis=0")
+        indices = np.asarray(indices)
+        new = ColumnarArray(len(indices), self._index)
+        new._columns = [None if c is None else c.take(indices) for c in self._columns]
+        return new
+
+    def column(self, col):
+        """Raw (encoded) data of one column
+
+        Parameters
+        ----------
+        col : int
+            column number
+
+        Returns
+        -------
+        ndarray
+            1D array in storage data type of column. Missing values in
+            integer columns are encoded using :attr:`FILL_VALUES`.
+        """
+        return self._get_raw(col)
+
+    def _get_raw(self, col):
+        data = self._columns[col]
+        if data is None:
+            dtype = self._dtypes[col]
+            return np.full(self._num_rows, FILL_VALUES.get(dtype, np.nan), dtype=dtype)
+        return data
+
+    def _num_selected(self, rows):
+        return np.broadcast_to(False, (self._num_rows,))[rows].shape
+
+    def _decode(self, col, data):
+        dtype = self._dtypes[col]
+        if dtype.kind == "f":
+            return data.astype(np.float64, copy=False)
+        out = data.astype(np.float64)
+        out[data == FILL_VALUES[dtype]] = np.nan
+        return out
+
+    def _encode(self, col, values):
+        dtype = self._dtypes[col]
+        values = np.asarray(values)
+        if values.dtype.kind == "M":
+            # same as assignment of datetime64 values to float array
+            values = values.astype(np.int64)
+            values = np.where(values == FILL_VALUES[np.dtype(np.int64)], np.nan, values)
+        if dtype.kind == "f" or values.dtype.kind in "iub":
+            return values.astype(dtype, copy=False)
+        values = values.astype(np.float64, copy=False)
+        return np.where(np.isnan(values), FILL_VALUES[dtype], np.rint(values)).astype(dtype)
+
+    def _is_missing(self, col, encoded):
+        dtype = self._dtypes[col]
+        if dtype.kind == "f":
+            return np.isnan(encoded).all()
+        return (encoded == FILL_VALUES[dtype]).all()
+
+    def _get_column(self, col, rows):
+        data = self._columns[col]
+        if data is None:
+            return np.full(self._num_selected(rows), np.nan)
+        return self._decode(col, data[rows])
+
+    def _set_column(self, col, rows, values):
+        encoded = self._encode(col, values)
+        if self._is_missing(col, encoded):
+            if self._columns[col] is None:
+                return
+            elif isinstance(rows, slice) and rows == slice(None):
+                # free memory
+                self._columns[col] = None
+                return
+        if self._columns[col] is None:
+            self._columns[col] = self._get_raw(col)
+        self._columns[col][rows] = encoded
+
+    @staticmethod
+    def _split_key(key):
+        if isinstance(key, tuple) and len(key) == 2:
+            return key
+        return key, slice(None)
+
+    @staticmethod
+    def _is_full_slice(key):
+        return isinstance(key, slice) and key == slice(None)
+
+    def __getitem__(self, key):
+        rows, col = self._split_key(key)
+        if isinstance(rows, (int, np.integer)):
+            # single row, return scalar or 1D array
+            if rows < 0:
+                rows += self._num_rows
+            row = np.asarray(
+                [self._get_column(i, slice(rows, rows + 1))[0] for i in range(len(self._columns))]
+            )
+            return row[col]
+        elif isinstance(col, (int, np.integer)):
+            if col < 0:
+                col += len(self._columns)
+            return self._get_column(col, rows)
+        elif self._is_full_slice(col):
+            num = self._num_selected(rows)[0]
+            new = ColumnarArray(num, self._index)
+            new._columns = [None if c is None else c[rows] for c in self._columns]
+            return new
+        return np.asarray(self)[key]
+
+    def __setitem__(self, key, value):
+        rows, col = self._split_key(key)
+        if isinstance(col, (int, np.integer)):
+            if col < 0:
+                col += len(self._columns)
+            self._set_column(col, rows, value)
+            return
+        elif not self._is_full_slice(col):
+            raise IndexError(f"Unsupported column index {col} for ColumnarArray")
+        if isinstance(value, ColumnarArray):
+            for i in range(len(self._columns)):
+                if value._columns[i] is None:
+                    self._set_column(i, rows, np.nan)
+                elif value._dtypes[i] == self._dtypes[i]:
+                    if self._columns[i] is None:
+                        self._columns[i] = self._get_raw(i)
+                    self._columns[i][rows] = value._columns[i]
+                else:
+                    self._set_column(i, rows, value._decode(i, value._columns[i]))
+            return
+        value = np.asarray(value)
+        if value.ndim < 2:
+            for i in range(len(self._columns)):
+                self._set_column(i, rows, value if value.ndim == 0 else value[i])
+            return
+        for i in range(len(self._columns)):
+            self._set_column(i, rows, value[:, i])
@@ -0,0 +1,236 @@
+"""
+Columnar view of the metadata blocks in :class:`UngriddedData`
+"""
+from __future__ import annotations
+
+import fnmatch
+from numbers import Number
+
+import numpy as np
+import pandas as pd
+
+
+class MetaColumn:
+    """One metadata key of all metadata blocks, in vectorisable form
+
+    Parameters
+    ----------
+    values : list
+        values of the metadata key for each metadata block, blocks that do
+        not contain the key are represented by :attr:`MetaTable.MISSING`
+    """
+
+    def __init__(self, values):
+        self.values = np.empty(len(values), dtype=object)
+        for i, val in enumerate(values):  # avoids broadcasting of list values
+            self.values[i] = val
+        #: mask specifying blocks that contain this key
+        self.has_key = np.fromiter((v is not MetaTable.MISSING for v in values), bool, len(values))
+        #: mask specifying blocks with string values
+        self.is_str = np.fromiter((isinstance(v, str) for v in values), bool, len(values))
+        #: mask specifying blocks with numerical values
+        self.is_num = np.fromiter((isinstance(v, Number) for v in values), bool, len(values))
+
+        strings = np.where(self.is_str, self.values, None)
+        #: integer codes of string values (-1 if value is not a string) and
+        #: corresponding unique strings
+        self.codes, self.uniques = pd.factorize(strings)
+
+        #: numerical values (NaN if value is not numeric)
+        self.num = np.full(len(values), np.nan)
+        if self.is_num.any():
+            self.num[self.is_num] = [float(v) for v in self.values[self.is_num]]
+
+    def isin_str(self, strings):
+        """Mask of blocks that have one of the input strings as value"""
+        codes = np.flatnonzero(pd.Index(self.uniques).isin(list(strings)))
+        return np.isin(self.codes, codes)
+
+    def match_wildcards(self, patterns):
+        """Mask of blocks with string values matching any of the input patterns"""
+        uniques = list(self.uniques)
+        matches = set()
+        for pattern in patterns:
+            matches.update(fnmatch.filter(uniques, pattern))
+        return self.isin_str(matches)
+
+
+class MetaTable:
+    """Lazily built columnar table of the metadata of :class:`UngriddedData`
+
+    Columns (one per metadata key, see :class:`MetaColumn`) are created on
+    first access and cached, so that metadata filters can be evaluated as
+    vectorised masks instead of looping over all metadata blocks.
+
+    Note
+    ----
+    The table is tied to the metadata dictionary it was created from and
+    needs to be recreated if any of the metadata blocks changes (cf.
+    :func:`is_valid`).
+
+    Parameters
+    ----------
+    metadata : dict
+        metadata dictionary (cf. :attr:`UngriddedData.metadata`)
+    """
+
+    #: placeholder for keys that are not available in a metadata block
+    MISSING = object()
+
+    def __init__(self, metadata):
+        self.metadata = metadata
+        self.meta_idx = list(metadata)
+        self._columns = {}
+
+    def __len__(self):
+        return len(self.meta_idx)
+
+    def is_valid(self, metadata):
+        """Check if this table (still) represents input metadata dict
+
+        Note
+        ----
+        Only replacement of the metadata dict and addition or removal of
+        metadata blocks are detected, in place modifications of metadata
+        blocks are not (cf. :func:`UngriddedData._reset_meta_cache`).
+        """
+        return metadata is self.metadata and len(metadata) == len(self)
+
+    def column(self, key):
+        """Get column for metadata key
+
+        Parameters
+        ----------
+        key : str
+            metadata key
+
+        Returns
+        -------
+        MetaColumn
+        """
+        if not key in self._columns:
+            missing = self.MISSING
+            self._columns[key] = MetaColumn(
+                [meta.get(key, missing) for meta in self.metadata.values()]
+            )
+        return self._columns[key]
+
+    def find_matches(self, negate, str_f, list_f, range_f, val_f):
+        """Find metadata blocks matching input filters
+
+        Vectorised equivalent of :func:`UngriddedData._check_filter_match`,
+        for a description of the input filters see
+        :func:`UngriddedData._init_meta_filters`.
+
+        Returns
+        -------
+        ndarray
+            boolean mask specifying matching metadata blocks
+        """
+        mask = np.ones(len(self), dtype=bool)
+        for key, filterval in str_f.items():
+            col = self.column(key)
+            match = col.isin_str([filterval])
+            if "*" in filterval:
+                match |= col.match_wildcards([filterval])
+            mask &= col.has_key & (match != (key in negate))
+
+        for key, filterval in list_f.items():
+            col = self.column(key)
+            neg = key in negate
+            strings = [x for x in filterval if isinstance(x, str)]
+            wildcards = [x for x in strings if "*" in x]
+            match = col.isin_str(strings) | col.match_wildcards(wildcards)
+            ok = match != neg
+            # non-string values only fail if they match and the key is negated
+            other = np.flatnonzero(col.has_key & ~col.is_str)
+            for i in other:
+                ok[i] = not (neg and self._list_match(col.values[i], filterval))
+            mask &= col.has_key & ok
+
+        for key, (low, high) in range_f.items():
+            col = self.column(key)
+            with np.errstate(invalid="ignore"):
+                match = (col.num >= low) & (col.num <= high)
+            mask &= col.has_key & (match != (key in negate))
+
+        for key, filterval in val_f.items():
+            col = self.column(key)
+            match = col.is_num & (col.num == filterval)
+            mask &= col.has_key & (match != (key in negate))
+        return mask
+
+    @staticmethod
+    def _list_match(val, filterval):
+        try:
+            return bool(val == filterval) or val in filterval
+        except (TypeError, ValueError):
+            return False
+
+
+class StationIndex(dict):
+    """Mapping of station names to metadata indices of :class:`UngriddedData`
+
+    Dictionary with station names as keys and lists of all metadata indices
+    belonging to that station as values. Like :class:`MetaTable`, the index
+    is tied to the metadata dictionary it was created from (cf.
+    :func:`is_valid`), it can be extended via :func:`add` when new metadata
+    blocks are added.
+
+    Parameters
+    ----------
+    metadata : dict
+        metadata dictionary (cf. :attr:`UngriddedData.metadata`)
+    """
+
+    def __init__(self, metadata):
+        super().__init__()
+        self.metadata = metadata
+        self._num = 0
+        for meta_idx, meta in metadata.items():
+            self.add(meta_idx, meta)
+
+    def add(self, meta_idx, meta):
+        """Register metadata block
+
+        Parameters
+        ----------
+        meta_idx : float
+            metadata index
+        meta : dict
+            metadata block
+        """
+        self.setdefault(meta.get("station_name"), []).append(meta_idx)
+        self._num += 1
+
+    def is_valid(self, metadata):
+        """Check if this index (still) represents input metadata dict
+
+        Note
+        ----
+        Like in :func:`MetaTable.is_valid`, in place modifications of
+        metadata blocks are not detected.
+        """
+        return metadata is self.metadata and len(metadata) == self._num
+
+    def find(self, station_name):
+        """Metadata indices of input station name (empty list if not found)"""
+        return list(self.get(station_name, []))
+
+    def find_wildcards(self, pattern):
+        """Metadata indices of all station names matching wildcard pattern
+
+        Parameters
+        ----------
+        pattern : str
+            station name or wildcard pattern (cf. :mod:`fnmatch`)
+
+        Returns
+        -------
+        list
+            sorted list of matching metadata indices
+        """
+        if not any(char in pattern for char in "*?["):
+            return self.find(pattern)
+        names = fnmatch.filter([name for name in self if isinstance(name, str)], pattern)
+        return sorted(meta_idx for name in names for meta_idx in self[name])
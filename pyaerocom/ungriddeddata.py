@@ -33,6 +33,8 @@ from pyaerocom.mathutils import in_range
 from pyaerocom.metastandards import STANDARD_META_KEYS
 from pyaerocom.region import Region
 from pyaerocom.stationdata import StationData
+from pyaerocom.ungridded_columnar import ColumnarArray
+from pyaerocom.ungridded_metatable import MetaTable, StationIndex
 from pyaerocom.units_helpers import get_unit_conversion_fac
 
 logger = logging.getLogger(__name__)
@@ -95,11 +97,17 @@ class UngriddedData:
         inital number of total datapoints (number of rows in 2D dataarray)
     add_cols : :obj:`list`, optional
         list of additional index column names of 2D datarray.
+    columnar : :obj:`bool`, optional
+        if True, the data is stored in one typed array per column (cf.
+        :class:`ColumnarArray`) rather than in a single float64 array. The
+        columnar array can be accessed like the 2D array, i.e. indexing of
+        :attr:`_data` works the same in both cases. If None (default), use
+        :attr:`pyaerocom.const.UNGRIDDED_COLUMNAR_STORAGE`.
 
     """
 
     #: version of class (for caching)
-    __version__ = "0.21"
+    __version__ = "0.24"
 
     #: default number of rows that are dynamically added if total number of
     #: data rows is reached.
@@ -133,22 +141,29 @@ class UngriddedData:
     def _ROWNO(self):
         return self._data.shape[0]
 
-    def __init__(self, num_points=None, add_cols=None):
+    def __init__(self, num_points=None, add_cols=None, columnar=None):
 
         if num_points is None:
             num_points = self._CHUNKSIZE
+        if columnar is None:
+            columnar = const.UNGRIDDED_COLUMNAR_STORAGE
 
         self._chunksize = num_points
         self._index = self._init_index(add_cols)
 
         # keep private, this is not supposed to be used by the user
-        self._data = np.full([num_points, self._COLNO], np.nan)
+        if columnar:
+            self._data = ColumnarArray(num_points, self._index)
+        else:
+            self._data = np.full([num_points, self._COLNO], np.nan)
 
         self.metadata = {}
         # single value data revision is deprecated
         self.data_revision = {}
         self.meta_idx = {}
         self.var_idx = {}
+        self._meta_table = None
+        self._station_index = None
 
         self._idx = -1
 
@@ -217,6 +232,7 @@ class UngriddedData:
                 meta["var_info"] = {}
                 for v in meta["variables"]:
                     meta["var_info"][v] = {}
+                self._reset_meta_cache()
 
             var_idx = self.meta_idx[idx]
             for var, indices in var_idx.items():
@@ -395,6 +411,55 @@ class UngriddedData:
     def index(self):
         return self._index
 
+    @property
+    def meta_table(self):
+        """Columnar table of metadata (:class:`MetaTable`)
+
+        The table is created on first access and is recreated whenever
+        :attr:`metadata` is replaced or metadata blocks are added or removed.
+
+        Note
+        ----
+        Methods of this class that modify metadata blocks in place reset the
+        table. If individual metadata blocks are modified in place otherwise,
+        the table needs to be reset via :func:`_reset_meta_cache`.
+        """
+        table = self._meta_table
+        if table is None or not table.is_valid(self.metadata):
+            table = MetaTable(self.metadata)
+            self._meta_table = table
+        return table
+
+    @property
+    def station_index(self):
+        """Mapping of station names to metadata indices (:class:`StationIndex`)
+
+        The index is created on first access, updated when data is appended
+        or merged (cf. :func:`merge`) and recreated whenever :attr:`metadata`
+        is replaced or metadata blocks are added or removed otherwise.
+
+        Note
+        ----
+        Methods of this class that modify metadata blocks in place reset the
+        index. If station names of individual metadata blocks are modified in
+        place otherwise, the index needs to be reset via
+        :func:`_reset_meta_cache`.
+        """
+        index = self._station_index
+        if index is None or not index.is_valid(self.metadata):
+            index = StationIndex(self.metadata)
+            self._station_index = index
+        return index
+
+    def _reset_meta_cache(self):
+        """Discard :attr:`meta_table` and :attr:`station_index`
+
+        Needs to be called whenever metadata blocks are modified in place,
+        since this cannot be detected by the table and the index.
+        """
+        self._meta_table = None
+        self._station_index = None
+
     @property
     def first_meta_idx(self):
         # First available metadata index
@@ -435,6 +500,24 @@ class UngriddedData:
     def _COLNO(self):
         return len(self._index)
 
+    @property
+    def is_columnar(self):
+        """Boolean specifying whether data is stored in columnar format"""
+        return isinstance(self._data, ColumnarArray)
+
+    def _get_column_raw(self, col):
+        """Get one column of the data array in its storage data type
+
+        Note
+        ----
+        In columnar mode, missing values in integer columns (e.g. variable
+        index) are not decoded as NaN, so use this only for equality
+        comparisons with valid values.
+        """
+        if self.is_columnar:
+            return self._data.column(col)
+        return self._data[:, col]
+
     @property
     def has_flag_data(self):
         """Boolean specifying whether this object contains flag data"""
@@ -456,13 +539,15 @@ class UngriddedData:
         """
         from copy import deepcopy
 
-        new = UngriddedData()
-        new._data = np.copy(self._data)
+        new = UngriddedData(columnar=self.is_columnar)
+        new._data = self._data.copy()
         new.metadata = deepcopy(self.metadata)
         new.data_revision = self.data_revision
         new.meta_idx = deepcopy(self.meta_idx)
         new.var_idx = deepcopy(self.var_idx)
         new.filter_hist = deepcopy(self.filter_hist)
+        if self._station_index is not None and self._station_index.is_valid(self.metadata):
+            new._station_index = StationIndex(new.metadata)
         return new
 
     @property
@@ -636,8 +721,12 @@ class UngriddedData:
         """
         if size is None or size < self._chunksize:
             size = self._chunksize
-        chunk = np.full([size, self._COLNO], np.nan)
-        self._data = np.append(self._data, chunk, axis=0)
+        if self.is_columnar:
+            chunk = ColumnarArray(size, self._index)
+            self._data = ColumnarArray.concatenate([self._data, chunk])
+        else:
+            chunk = np.full([size, self._COLNO], np.nan)
+            self._data = np.append(self._data, chunk, axis=0)
         logger.info(f"adding chunk, new array size ({self._data.shape})")
 
     def _find_station_indices_wildcards(self, station_str):
@@ -659,10 +748,7 @@ class UngriddedData:
         StationNotFoundError
             if no such station exists in this data object
         """
-        idx = []
-        for i, meta in self.metadata.items():
-            if fnmatch.fnmatch(meta["station_name"], station_str):
-                idx.append(i)
+        idx = self.station_index.find_wildcards(station_str)
         if len(idx) == 0:
             raise StationNotFoundError(
                 f"No station available in UngriddedData that matches pattern {station_str}"
@@ -688,10 +774,7 @@ class UngriddedData:
         StationNotFoundError
             if no such station exists in this data object
         """
-        idx = []
-        for i, meta in self.metadata.items():
-            if meta["station_name"] == station_str:
-                idx.append(i)
+        idx = self.station_index.find(station_str)
         if len(idx) == 0:
             raise StationNotFoundError(
                 f"No station available in UngriddedData that matches name {station_str}"
@@ -746,6 +829,8 @@ class UngriddedData:
                 meta["country_code"] = info[i]["country_code"]
                 meta_idx_updated.append(idx)
                 countries.append(country)
+        if len(meta_idx_updated) > 0:
+            self._reset_meta_cache()
         return (meta_idx_updated, countries)
 
     @property
@@ -870,17 +955,7 @@ class UngriddedData:
             else single instance of StationData. All variable time series are
             inserted as pandas Series
         """
-        if isinstance(vars_to_convert, str):
-            vars_to_convert = [vars_to_convert]
-        elif vars_to_convert is None:
-            vars_to_convert = self.contains_vars
-            if len(vars_to_convert) == 0:
-                raise DataCoverageError("UngriddedData object does not contain any variables")
-        if start is None and stop is None:
-            start = pd.Timestamp("1970")
-            stop = pd.Timestamp("2200")
-        else:
-            start, stop = start_stop(start, stop)
+        vars_to_convert, start, stop = self._check_station_data_input(vars_to_convert, start, stop)
 
         if isinstance(meta_idx, str):
             # user asks explicitely for station name, find all meta indices
@@ -890,10 +965,6 @@ class UngriddedData:
             meta_idx = [meta_idx]
 
         stats = []
-        # ToDo: check consistency, consider using methods in helpers.py
-        # check also Hans' issue on the topic
-        start, stop = np.datetime64(start), np.datetime64(stop)
-
         for idx in meta_idx:
             try:
                 stat = self._metablock_to_stationdata(
@@ -902,6 +973,61 @@ class UngriddedData:
                 stats.append(stat)
             except (VarNotAvailableError, DataCoverageError) as e:
                 logger.info(f"Skipping meta index {idx}. Reason: {repr(e)}")
+        return self._process_station_data(
+            stats,
+            meta_idx,
+            vars_to_convert,
+            freq,
+            merge_if_multi,
+            merge_pref_attr,
+            merge_sort_by_largest,
+            insert_nans,
+            resample_how,
+            min_num_obs,
+        )
+
+    def _check_station_data_input(self, vars_to_convert, start, stop):
+        """Check variables and time range for conversion to StationData
+
+        Returns
+        -------
+        tuple
+            list of variables and start / stop as numpy.datetime64
+        """
+        if isinstance(vars_to_convert, str):
+            vars_to_convert = [vars_to_convert]
+        elif vars_to_convert is None:
+            vars_to_convert = self.contains_vars
+            if len(vars_to_convert) == 0:
+                raise DataCoverageError("UngriddedData object does not contain any variables")
+        if start is None and stop is None:
+            start = pd.Timestamp("1970")
+            stop = pd.Timestamp("2200")
+        else:
+            start, stop = start_stop(start, stop)
+        # ToDo: check consistency, consider using methods in helpers.py
+        # check also Hans' issue on the topic
+        return vars_to_convert, np.datetime64(start), np.datetime64(stop)
+
+    def _process_station_data(
+        self,
+        stats,
+        meta_idx,
+        vars_to_convert,
+        freq=None,
+        merge_if_multi=True,
+        merge_pref_attr=None,
+        merge_sort_by_largest=True,
+        insert_nans=False,
+        resample_how=None,
+        min_num_obs=None,
+    ):
+        """Merge and resample StationData objects of one station (helper method)
+
+        See :func:`to_station_data` for input parameters, `stats` is the list
+        of :class:`StationData` objects that were created for the metadata
+        indices `meta_idx`.
+        """
         if merge_if_multi and len(stats) > 1:
             if len(vars_to_convert) > 1:
                 raise NotImplementedError(
@@ -989,6 +1115,155 @@ class UngriddedData:
 
         See :func:`to_station_data` for input parameters
         """
+        sd, meta, vars_avail = self._init_stationdata_from_meta(
+            meta_idx, vars_to_convert, add_meta_keys
+        )
+        # init helper boolean that is set to True if valid data can be found
+        # for at least one of the input variables
+        FOUND_ONE = False
+        for var in vars_avail:
+
+            # get indices of this variable
+            var_idx = self.meta_idx[meta_idx][var]
+
+            # vector of timestamps corresponding to this variable
+            dtime = self._data[var_idx, self._TIMEINDEX].astype("datetime64[s]")
+
+            # get subset
+            subset = self._data[var_idx]
+
+            # make sure to extract only valid timestamps
+            if start is None:
+                start = dtime.min()
+            if stop is None:
+                stop = dtime.max()
+
+            # create access mask for valid time stamps
+            tmask = np.logical_and(dtime >= start, dtime <= stop)
+
+            # make sure there is some valid data
+            if tmask.sum() == 0:
+                logger.info(
+                    f"Ignoring station {sd['station_name']}, var {var} ({sd['data_id']}): "
+                    f"no data available in specified time interval {start} - {stop}"
+                )
+                continue
+
+            dtime = dtime[tmask]
+            subset = subset[tmask]
+
+            if self._add_var_to_stationdata(
+                sd,
+                meta,
+                var,
+                dtime,
+                subset[:, self._DATAINDEX],
+                subset[:, self._DATAERRINDEX],
+                subset[:, self._DATAFLAGINDEX],
+                subset[:, self._DATAHEIGHTINDEX],
+            ):
+                FOUND_ONE = True
+        if not FOUND_ONE:
+            raise DataCoverageError(
+                f"Could not retrieve any valid data for station {sd['station_name']} "
+                f"and input variables {vars_to_convert}"
+            )
+        return sd
+
+    def _metablocks_to_stationdata(
+        self, meta_indices, vars_to_convert, start, stop, add_meta_keys=None
+    ):
+        """Convert multiple metadata indices to StationData (helper method)
+
+        Bulk version of :func:`_metablock_to_stationdata`: the data of all
+        input metadata blocks and variables is extracted from the data
+        array at once and cropped in time using a single mask.
+
+        Parameters
+        ----------
+        meta_indices : list
+            metadata indices to be converted
+        vars_to_convert : list
+            variables to be converted
+        start : numpy.datetime64
+            start time
+        stop : numpy.datetime64
+            stop time
+        add_meta_keys : list, optional
+            additional metadata keys to be assigned
+
+        Returns
+        -------
+        dict
+            :class:`StationData` objects of all metadata indices that contain
+            valid data (keys are metadata indices).
+        """
+        stats = {}
+        blocks = []
+        for idx in meta_indices:
+            try:
+                stats[idx] = self._init_stationdata_from_meta(idx, vars_to_convert, add_meta_keys)
+            except VarNotAvailableError as e:
+                logger.info(f"Skipping meta index {idx}. Reason: {repr(e)}")
+                continue
+            for var in stats[idx][2]:
+                blocks.append((idx, var, self.meta_idx[idx][var]))
+        if len(blocks) == 0:
+            return {}
+
+        sizes = np.asarray([len(indices) for *_, indices in blocks], dtype=int)
+        indices = np.concatenate([indices for *_, indices in blocks]).astype(int, copy=False)
+        subset = self._data.take(indices, axis=0)
+        dtime = subset[:, self._TIMEINDEX].astype("datetime64[s]")
+        tmask = np.logical_and(dtime >= start, dtime <= stop)
+
+        cols = [
+            subset[:, col]
+            for col in (
+                self._DATAINDEX,
+                self._DATAERRINDEX,
+                self._DATAFLAGINDEX,
+                self._DATAHEIGHTINDEX,
+            )
+        ]
+        found = set()
+        stops = np.cumsum(sizes)
+        for (idx, var, _), i0, i1 in zip(blocks, stops - sizes, stops):
+            sd, meta, _ = stats[idx]
+            mask = tmask[i0:i1]
+            if not mask.any():
+                logger.info(
+                    f"Ignoring station {sd['station_name']}, var {var} ({sd['data_id']}): "
+                    f"no data available in specified time interval {start} - {stop}"
+                )
+                continue
+            if mask.all():
+                block = [dtime[i0:i1]] + [col[i0:i1] for col in cols]
+            else:
+                block = [dtime[i0:i1][mask]] + [col[i0:i1][mask] for col in cols]
+            if self._add_var_to_stationdata(sd, meta, var, *block):
+                found.add(idx)
+
+        result = {}
+        for idx, (sd, _, _) in stats.items():
+            if idx in found:
+                result[idx] = sd
+            else:
+                logger.info(
+                    f"Skipping meta index {idx}. Reason: Could not retrieve any valid data "
+                    f"for station {sd['station_name']} and input variables {vars_to_convert}"
+                )
+        return result
+
+    def _init_stationdata_from_meta(self, meta_idx, vars_to_convert, add_meta_keys=None):
+        """Create StationData object from metadata block (helper method)
+
+        Returns
+        -------
+        tuple
+            :class:`StationData` object (without data), metadata block and
+            list of variables that are to be converted
+        """
         if add_meta_keys is None:
             add_meta_keys = []
         elif isinstance(add_meta_keys, str):
@@ -1047,86 +1322,52 @@ class UngriddedData:
             raise VarNotAvailableError(
                 "None of the input variables matches, or station does not contain data."
             )
-        # init helper boolean that is set to True if valid data can be found
-        # for at least one of the input variables
-        FOUND_ONE = False
-        for var in vars_avail:
+        return sd, meta, vars_avail
 
-            # get indices of this variable
-            var_idx = self.meta_idx[meta_idx][var]
+    def _add_var_to_stationdata(self, sd, meta, var, dtime, vals, vals_err, flagged, altitude):
+        """Assign time series data of one variable to StationData (helper method)
 
-            # vector of timestamps corresponding to this variable
-            dtime = self._data[var_idx, self._TIMEINDEX].astype("datetime64[s]")
-
-            # get subset
-            subset = self._data[var_idx]
-
-            # make sure to extract only valid timestamps
-            if start is None:
-                start = dtime.min()
-            if stop is None:
-                stop = dtime.max()
-
-            # create access mask for valid time stamps
-            tmask = np.logical_and(dtime >= start, dtime <= stop)
-
-            # make sure there is some valid data
-            if tmask.sum() == 0:
-                logger.info(
-                    f"Ignoring station {sd['station_name']}, var {var} ({sd['data_id']}): "
-                    f"no data available in specified time interval {start} - {stop}"
-                )
-                continue
-
-            dtime = dtime[tmask]
-            subset = subset[tmask]
-
-            vals = subset[:, self._DATAINDEX]
-            if np.all(np.isnan(vals)):
-                logger.warning(
-                    f"Ignoring station {sd['station_name']}, var {var} ({sd['data_id']}): "
-                    f"All values are NaN"
-                )
-                continue
-            vals_err = subset[:, self._DATAERRINDEX]
-            flagged = subset[:, self._DATAFLAGINDEX]
-            altitude = subset[:, self._DATAHEIGHTINDEX]
-
-            data = pd.Series(vals, dtime)
-            if not data.index.is_monotonic:
-                data = data.sort_index()
-            if any(~np.isnan(vals_err)):
-                sd.data_err[var] = vals_err
-            if any(~np.isnan(flagged)):
-                sd.data_flagged[var] = flagged
-
-            sd["dtime"] = data.index.values
-            sd[var] = data
-            sd["var_info"][var] = {}
-            FOUND_ONE = True
-            # check if there is information about altitude (then relevant 3D
-            # variables and parameters are included too)
-            if "var_info" in meta:
-                vi = meta["var_info"]
-            else:
-                vi = {}
-            if not np.isnan(altitude).all():
-                if "altitude" in vi:
-                    sd.var_info["altitude"] = vi["altitude"]
-                sd.altitude = altitude
-            if var in vi:
-                sd.var_info[var].update(vi[var])
-
-            if len(data.index) == len(data.index.unique()):
-                sd.var_info[var]["overlap"] = False
-            else:
-                sd.var_info[var]["overlap"] = True
-        if not FOUND_ONE:
-            raise DataCoverageError(
-                f"Could not retrieve any valid data for station {sd['station_name']} "
-                f"and input variables {vars_to_convert}"
+        Returns
+        -------
+        bool
+            True if data was assigned, False if all values are NaN
+        """
+        if np.all(np.isnan(vals)):
+            logger.warning(
+                f"Ignoring station {sd['station_name']}, var {var} ({sd['data_id']}): "
+                f"All values are NaN"
             )
-        return sd
+            return False
+
+        data = pd.Series(vals, dtime)
+        if not data.index.is_monotonic:
+            data = data.sort_index()
+        if any(~np.isnan(vals_err)):
+            sd.data_err[var] = vals_err
+        if any(~np.isnan(flagged)):
+            sd.data_flagged[var] = flagged
+
+        sd["dtime"] = data.index.values
+        sd[var] = data
+        sd["var_info"][var] = {}
+        # check if there is information about altitude (then relevant 3D
+        # variables and parameters are included too)
+        if "var_info" in meta:
+            vi = meta["var_info"]
+        else:
+            vi = {}
+        if not np.isnan(altitude).all():
+            if "altitude" in vi:
+                sd.var_info["altitude"] = vi["altitude"]
+            sd.altitude = altitude
+        if var in vi:
+            sd.var_info[var].update(vi[var])
+
+        if len(data.index) == len(data.index.unique()):
+            sd.var_info[var]["overlap"] = False
+        else:
+            sd.var_info[var]["overlap"] = True
+        return True
 
     def _generate_station_index(self, by_station_name=True, ignore_index=None):
         """Generates index to loop over station names or metadata block indices"""
@@ -1159,7 +1400,7 @@ class UngriddedData:
                 _iter.append(stat_name)
         return _iter
 
-    def to_station_data_all(
+    def iter_station_data(
         self,
         vars_to_convert=None,
         start=None,
@@ -1167,12 +1408,14 @@ class UngriddedData:
         freq=None,
         by_station_name=True,
         ignore_index=None,
+        chunksize=None,
         **kwargs,
     ):
-        """Convert all data to :class:`StationData` objects
+        """Iterate over chunks of :class:`StationData` objects
 
-        Creates one instance of :class:`StationData` for each metadata block in
-        this object.
+        Lazy variant of :func:`to_station_data_all`, that converts
+        ``chunksize`` stations at a time, so that only the station data of
+        one chunk needs to be kept in memory.
 
         Parameters
         ----------
@@ -1191,36 +1434,91 @@ class UngriddedData:
         by_station_name : bool
             if True, then iter over unique_station_name (and merge multiple
             matches if applicable), else, iter over metadata index
+        ignore_index
+            station names (or metadata indices if `by_station_name` is False)
+            that are supposed to be ignored
+        chunksize : int, optional
+            number of stations (or metadata blocks if `by_station_name` is
+            False) per chunk. If None, all stations are converted in one
+            chunk.
         **kwargs
             additional keyword args passed to :func:`to_station_data` (e.g.
             `merge_if_multi, merge_pref_attr, merge_sort_by_largest,
             insert_nans`)
 
-        Returns
-        -------
+        Yields
+        ------
         dict
-            4-element dictionary containing following key / value pairs:
-
-                - stats: list of :class:`StationData` objects
-                - station_name: list of corresponding station names
-                - latitude: list of latitude coordinates
-                - longitude: list of longitude coordinates
-
+            output for the stations in each chunk, same structure as the
+            output of :func:`to_station_data_all`
         """
-        out_data = {"stats": [], "station_name": [], "latitude": [], "failed": [], "longitude": []}
+        if chunksize is not None and chunksize < 1:
+            raise ValueError(f"Invalid input for chunksize: {chunksize}, need int > 0 or None")
 
         _iter = self._generate_station_index(by_station_name, ignore_index)
-        for idx in _iter:
+        try:
+            vars_to_convert, start, stop = self._check_station_data_input(
+                vars_to_convert, start, stop
+            )
+        except DataCoverageError as e:
+            out_data = self._init_station_data_output()
+            for idx in _iter:
+                logger.warning(f"Failed to convert to StationData Error: {repr(e)}")
+                out_data["failed"].append([idx, repr(e)])
+            yield out_data
+            return
+
+        # metadata indices for each entry in _iter
+        if by_station_name:
+            station_index = self.station_index
+            groups = [(idx, station_index[idx]) for idx in _iter]
+        else:
+            groups = [(idx, [idx]) for idx in _iter]
+
+        add_meta_keys = kwargs.pop("add_meta_keys", None)
+        if chunksize is None:
+            chunksize = max(len(groups), 1)
+        for i0 in range(0, max(len(groups), 1), chunksize):
+            yield self._convert_station_groups(
+                groups[i0 : i0 + chunksize],
+                vars_to_convert,
+                start,
+                stop,
+                freq,
+                add_meta_keys,
+                **kwargs,
+            )
+
+    @staticmethod
+    def _init_station_data_output():
+        return {"stats": [], "station_name": [], "latitude": [], "failed": [], "longitude": []}
+
+    def _convert_station_groups(
+        self, groups, vars_to_convert, start, stop, freq, add_meta_keys, **kwargs
+    ):
+        """Convert groups of metadata blocks into :class:`StationData` objects
+
+        Helper for :func:`iter_station_data`, ``groups`` is a list of
+        (station index, list of metadata indices) tuples.
+        """
+        out_data = self._init_station_data_output()
+        stats_all = self._metablocks_to_stationdata(
+            [meta_idx for _, group in groups for meta_idx in group],
+            vars_to_convert,
+            start,
+            stop,
+            add_meta_keys,
+        )
+        for idx, meta_indices in groups:
 
             try:
-                data = self.to_station_data(
-                    idx,
+                stats = [stats_all.pop(i) for i in meta_indices if i in stats_all]
+                data = self._process_station_data(
+                    stats,
+                    meta_indices,
                     vars_to_convert,
-                    start,
-                    stop,
                     freq,
                     merge_if_multi=True,
-                    allow_wildcards_station_name=False,
                     **kwargs,
                 )
 
@@ -1240,6 +1538,70 @@ class UngriddedData:
                 out_data["failed"].append([idx, repr(e)])
         return out_data
 
+    def to_station_data_all(
+        self,
+        vars_to_convert=None,
+        start=None,
+        stop=None,
+        freq=None,
+        by_station_name=True,
+        ignore_index=None,
+        **kwargs,
+    ):
+        """Convert all data to :class:`StationData` objects
+
+        Creates one instance of :class:`StationData` for each metadata block in
+        this object.
+
+        Note
+        ----
+        The data of all stations is extracted at once (cf.
+        :func:`_metablocks_to_stationdata`), the resulting station data
+        objects are identical to calling :func:`to_station_data` for each
+        station. Use :func:`iter_station_data` to convert the stations
+        in chunks.
+
+        Parameters
+        ----------
+        vars_to_convert : :obj:`list` or :obj:`str`, optional
+            variables that are supposed to be converted. If None, use all
+            variables that are available for this station
+        start
+            start time, optional (if not None, input must be convertible into
+            pandas.Timestamp)
+        stop
+            stop time, optional (if not None, input must be convertible into
+            pandas.Timestamp)
+        freq : str
+            pandas frequency string (e.g. 'D' for daily, 'M' for month end)
+            or valid pyaerocom ts_type (e.g. 'hourly', 'monthly').
+        by_station_name : bool
+            if True, then iter over unique_station_name (and merge multiple
+            matches if applicable), else, iter over metadata index
+        **kwargs
+            additional keyword args passed to :func:`to_station_data` (e.g.
+            `merge_if_multi, merge_pref_attr, merge_sort_by_largest,
+            insert_nans`)
+
+        Returns
+        -------
+        dict
+            4-element dictionary containing following key / value pairs:
+
+                - stats: list of :class:`StationData` objects
+                - station_name: list of corresponding station names
+                - latitude: list of latitude coordinates
+                - longitude: list of longitude coordinates
+
+        """
+        out_data = self._init_station_data_output()
+        for chunk in self.iter_station_data(
+            vars_to_convert, start, stop, freq, by_station_name, ignore_index, **kwargs
+        ):
+            for key, val in chunk.items():
+                out_data[key].extend(val)
+        return out_data
+
     # TODO: check more general cases (i.e. no need to convert to StationData
     # if no time conversion is required)
     def get_variable_data(self, variables, start=None, stop=None, ts_type=None, **kwargs):
@@ -1447,6 +1809,7 @@ class UngriddedData:
                     new = current * fac
                     obj._data[meta_idx, obj._DATAINDEX] = new
                     obj.metadata[i]["var_info"][var_name]["units"] = to_unit
+                    obj._reset_meta_cache()
 
         return obj
 
@@ -1585,7 +1948,7 @@ class UngriddedData:
             high = const.VARS[var_name].maximum
             logger.info(f"Setting {var_name} outlier upper lim: {high:.2f}")
         var_idx = new.var_idx[var_name]
-        var_mask = new._data[:, new._VARINDEX] == var_idx
+        var_mask = new._get_column_raw(new._VARINDEX) == var_idx
 
         all_data = new._data[:, new._DATAINDEX]
         invalid_mask = np.logical_or(all_data < low, all_data > high)
@@ -1689,19 +2052,19 @@ class UngriddedData:
             negate = [negate]
         elif not isinstance(negate, list):
             raise ValueError(f"Invalid input for negate {negate}, need list or str or None")
-        meta_matches = []
+        table = self.meta_table
+        mask = table.find_matches(negate, *filters)
+        meta_matches = [table.meta_idx[i] for i in np.flatnonzero(mask)]
         totnum = 0
-        for meta_idx, meta in self.metadata.items():
-            if self._check_filter_match(meta, negate, *filters):
-                meta_matches.append(meta_idx)
-                for var in meta["var_info"]:
-                    try:
-                        totnum += len(self.meta_idx[meta_idx][var])
-                    except KeyError:
-                        logger.warning(
-                            f"Ignoring variable {var} in meta block {meta_idx} "
-                            f"since no data could be found"
-                        )
+        for meta_idx in meta_matches:
+            for var in self.metadata[meta_idx]["var_info"]:
+                try:
+                    totnum += len(self.meta_idx[meta_idx][var])
+                except KeyError:
+                    logger.warning(
+                        f"Ignoring variable {var} in meta block {meta_idx} "
+                        f"since no data could be found"
+                    )
 
         return (meta_matches, totnum)
 
@@ -1933,35 +2296,34 @@ class UngriddedData:
         return new
 
     def _new_from_meta_blocks(self, meta_indices, totnum_new):
-        # make a new empty object with the right size (totnum_new)
-
-        new = UngriddedData(num_points=totnum_new)
-
-        meta_idx_new = 0.0
-        data_idx_new = 0
-
-        # loop over old meta_idx and extract data and create new meta_idx in
-        # output data object
-        for meta_idx in meta_indices:
+        # make a new empty object, the data is assigned below
+        new = UngriddedData(num_points=0, columnar=self.is_columnar)
+        new._chunksize = totnum_new
+        new._station_index = station_index = StationIndex(new.metadata)
+
+        # collect data indices of all metadata blocks and variables ...
+        blocks = []
+        for meta_idx_new, meta_idx in enumerate(meta_indices):
+            meta_idx_new = float(meta_idx_new)
             meta = self.metadata[meta_idx]
             new.metadata[meta_idx_new] = meta
             new.meta_idx[meta_idx_new] = {}
+            station_index.add(meta_idx_new, meta)
             for var in meta["var_info"]:
-                indices = self.meta_idx[meta_idx][var]
-                totnum = len(indices)
-
-                stop = data_idx_new + totnum
-
-                new._data[data_idx_new:stop, :] = self._data[indices, :]
-                new.meta_idx[meta_idx_new][var] = np.arange(data_idx_new, stop)
+                blocks.append((meta_idx_new, var, self.meta_idx[meta_idx][var]))
                 new.var_idx[var] = self.var_idx[var]
-                data_idx_new += totnum
 
-            meta_idx_new += 1
-
-        if meta_idx_new == 0 or data_idx_new == 0:
+        sizes = np.asarray([len(indices) for *_, indices in blocks], dtype=int)
+        if len(new.metadata) == 0 or sizes.sum() == 0:
             raise DataExtractionError("Filtering results in empty data object")
-        new._data = new._data[:data_idx_new]
+
+        # ... and extract all corresponding rows at once
+        indices = np.concatenate([indices for *_, indices in blocks]).astype(int, copy=False)
+        new._data = self._data.take(indices, axis=0)
+
+        stops = np.cumsum(sizes)
+        for (meta_idx_new, var, _), start, stop in zip(blocks, stops - sizes, stops):
+            new.meta_idx[meta_idx_new][var] = np.arange(start, stop)
 
         # write history of filtering applied
         new.filter_hist.update(self.filter_hist)
@@ -2065,10 +2427,6 @@ class UngriddedData:
             logger.info("Data object is already single variable. Returning copy")
             return self.copy()
 
-        var_idx = self.var_idx[var_name]
-
-        totnum = np.sum(self._data[:, self._VARINDEX] == var_idx)
-
         colnum, rownum = self.shape
 
         if rownum != len(self._init_index()):
@@ -2077,13 +2435,14 @@ class UngriddedData:
                 "additional columns other than default columns"
             )
 
-        subset = UngriddedData(totnum)
+        subset = UngriddedData(num_points=0, columnar=self.is_columnar)
 
         subset.var_idx[var_name] = 0
         subset._index = self.index
 
         meta_idx = -1
         arr_idx = 0
+        blocks = []
 
         for midx, didx in self.meta_idx.items():
             if var_name in didx and len(didx[var_name]) > 0:
@@ -2104,13 +2463,20 @@ class UngriddedData:
                 start = arr_idx
                 stop = arr_idx + num_add
                 subset.meta_idx[meta_idx][var_name] = np.arange(start, stop)
-
-                subset._data[start:stop] = self._data[idx]
-                subset._data[start:stop, subset._METADATAKEYINDEX] = meta_idx
-                subset._data[start:stop, subset._VARINDEX] = 0
+                blocks.append(idx)
 
                 arr_idx += num_add
 
+        # make sure add_chunk works on the subset (cf. _new_from_meta_blocks)
+        subset._chunksize = arr_idx or subset._CHUNKSIZE
+        if len(blocks) > 0:
+            # extract all data rows of this variable at once
+            indices = np.concatenate(blocks).astype(int, copy=False)
+            sizes = [len(idx) for idx in blocks]
+            subset._data = self._data.take(indices, axis=0)
+            subset._data[:, subset._METADATAKEYINDEX] = np.repeat(np.arange(len(blocks)), sizes)
+            subset._data[:, subset._VARINDEX] = 0
+
         if check_index:
             subset._check_index()
         subset.filter_hist.update(self.filter_hist)
@@ -2146,7 +2512,7 @@ class UngriddedData:
         """
         if isinstance(var_names, str):
             return self.extract_var(var_names)
-        data = UngriddedData()
+        data = UngriddedData(columnar=self.is_columnar)
 
         for var in var_names:
             data.append(self.extract_var(var, check_index=False))
@@ -2241,7 +2607,7 @@ class UngriddedData:
             ignore_keys = []
         sh = self.shape
         lst_meta_idx = self._find_common_meta(ignore_keys)
-        new = UngriddedData(num_points=self.shape[0])
+        new = UngriddedData(num_points=self.shape[0], columnar=self.is_columnar)
         didx = 0
         for i, idx_lst in enumerate(lst_meta_idx):
             _meta_check = {}
@@ -2320,10 +2686,17 @@ class UngriddedData:
             meta_offset = max(obj.metadata) + 1
             data_offset = obj.shape[0]
 
+            # keep station index in sync, if it is already in use
+            station_index = obj._station_index
+            if station_index is not None and not station_index.is_valid(obj.metadata):
+                station_index = None
+
             # add this offset to indices of meta dictionary in input data object
             for meta_idx_other, meta_other in other.metadata.items():
                 meta_idx = meta_offset + meta_idx_other
                 obj.metadata[meta_idx] = meta_other
+                if station_index is not None:
+                    station_index.add(meta_idx, meta_other)
                 _idx_map = {}
                 for var_name, indices in other.meta_idx[meta_idx_other].items():
                     _idx_map[var_name] = np.asarray(indices) + data_offset
@@ -2343,7 +2716,10 @@ class UngriddedData:
                         obj.var_idx[var] = new_idx
                     else:
                         obj.var_idx[var] = idx
-            obj._data = np.vstack([obj._data, other._data])
+            if obj.is_columnar:
+                obj._data = ColumnarArray.concatenate([obj._data, other._data])
+            else:
+                obj._data = np.vstack([obj._data, other._data])
             obj.data_revision.update(other.data_revision)
         obj.filter_hist.update(other.filter_hist)
         obj._check_index()
@@ -2419,7 +2795,7 @@ class UngriddedData:
             )
         cidx = self.var_idx[var_name]
         self.var_idx[var_name] = new_idx
-        var_indices = np.where(self._data[:, self._VARINDEX] == cidx)
+        var_indices = np.where(self._get_column_raw(self._VARINDEX) == cidx)
         self._data[var_indices, self._VARINDEX] = new_idx
 
     def append(self, other):
@@ -2468,7 +2844,7 @@ class UngriddedData:
         if not var_name in self.var_idx:
             raise AttributeError(f"Variable {var_name} not available in data")
         idx = self.var_idx[var_name]
-        mask = np.where(self._data[:, self._VARINDEX] == idx)[0]
+        mask = np.where(self._get_column_raw(self._VARINDEX) == idx)[0]
         return self._data[mask, self._DATAINDEX]
 
     def num_obs_var_valid(self, var_name):
@@ -2829,9 +3205,9 @@ class UngriddedData:
 
         Note
         ----
-        So far, only storage as pickled object via
-        `CacheHandlerUngridded` is supported, so input file_name must end
-        with .pkl
+        So far, only storage via `CacheHandlerUngridded` is supported (i.e.
+        pickled object and data arrays stored in separate .npy files), so
+        input file_name must end with .pkl
 
         Parameters
         ----------
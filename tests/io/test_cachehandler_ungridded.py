@@ -1,10 +1,13 @@
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
 import pytest
 
-from pyaerocom import UngriddedData
+from pyaerocom import UngriddedData, ungriddeddata
 from pyaerocom.io import ReadAeronetSunV3
 from pyaerocom.io.cachehandler_ungridded import CacheHandlerUngridded
+from tests.fixtures.stations import FAKE_STATION_DATA
 
 
 @pytest.fixture(scope="module")
@@ -29,6 +32,47 @@ def test_reload_custom(
     assert cache_handler.loaded_data[path.name].shape == aeronetsunv3lev2_subset.shape
 
 
+@pytest.mark.parametrize("columnar", [False, True])
+def test_reload_memmap(
+    cache_handler: CacheHandlerUngridded, tmp_path: Path, monkeypatch, columnar: bool
+):
+    monkeypatch.setattr(ungriddeddata.const, "UNGRIDDED_COLUMNAR_STORAGE", columnar)
+    data = UngriddedData.from_station_data(FAKE_STATION_DATA["station_data1"])
+    assert data.is_columnar == columnar
+    for _ in range(2):  # overwriting removes data arrays of previous version
+        cache_handler.write(data, var_or_file_name="memmap.pkl", cache_dir=tmp_path)
+    array_files = list(tmp_path.glob("memmap.*.npy"))
+    assert len(array_files) > 0
+    assert len({path.name.split(".")[1] for path in array_files}) == 1
+
+    assert cache_handler.check_and_load("memmap.pkl", cache_dir=tmp_path)
+    reloaded = cache_handler.loaded_data["memmap.pkl"]
+    np.testing.assert_array_equal(np.asarray(reloaded._data), np.asarray(data._data))
+    assert reloaded.unique_station_names == data.unique_station_names
+
+    # data arrays are memory-mapped copy-on-write
+    reloaded._data[:, reloaded._DATAINDEX] = 42
+    assert cache_handler.check_and_load("memmap.pkl", cache_dir=tmp_path)
+    np.testing.assert_array_equal(
+        np.asarray(cache_handler.loaded_data["memmap.pkl"]._data), np.asarray(data._data)
+    )
+
+    cache_handler._remove_cache_file(str(tmp_path / "memmap.pkl"))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_delete_all_cache_files(tmp_path: Path):
+    cache_handler = CacheHandlerUngridded(cache_dir=str(tmp_path))
+    data = UngriddedData.from_station_data(FAKE_STATION_DATA["station_data1"])
+    cache_handler.write(data, var_or_file_name="memmap.pkl", cache_dir=tmp_path)
+    # data array of incompletely written cache file
+    np.save(tmp_path / "orphan.0123456789ab.data.npy", np.zeros(3))
+    assert len(list(tmp_path.glob("*.npy"))) > 1
+
+    cache_handler.delete_all_cache_files()
+    assert list(tmp_path.iterdir()) == []
+
+
 @pytest.mark.dependency
 def test_reload(
     cache_handler: CacheHandlerUngridded,
@@ -46,3 +90,33 @@ def test_reload(
     reloaded = cache_handler.loaded_data["od550aer"]
     assert isinstance(reloaded, UngriddedData)
     assert reloaded.shape == subset.shape
+
+
+@pytest.mark.parametrize(
+    "constraints,same_as",
+    [
+        (None, None),
+        ({}, None),
+        (
+            dict(station_name=["Oslo", "Bergen"], first_file=0),
+            dict(first_file=0, station_name=("Oslo", "Bergen")),
+        ),
+        (dict(start=np.datetime64("2010-01-01")), dict(start=pd.Timestamp("2010-01-01"))),
+    ],
+)
+def test_constraints_hash(constraints, same_as):
+    handler = CacheHandlerUngridded(read_constraints=constraints)
+    assert (
+        handler.constraints_hash
+        == CacheHandlerUngridded(read_constraints=same_as).constraints_hash
+    )
+    if constraints:
+        assert handler.constraints_hash is not None
+        assert handler.cache_meta_info()["read_constraints"] is not None
+        other = CacheHandlerUngridded(read_constraints=dict(constraints, last_file=10))
+        assert other.constraints_hash != handler.constraints_hash
+
+
+def test_constraints_hash_invalid():
+    with pytest.raises(ValueError):
+        CacheHandlerUngridded(read_constraints=dict(func=lambda x: x))
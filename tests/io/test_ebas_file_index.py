@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import os
+import sqlite3
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from pyaerocom.io.ebas_file_index import EbasFileIndex, EbasSQLRequest
+from pyaerocom.io.helpers import _check_ebas_db_local_vs_remote
 from tests.fixtures.ebas import EBAS_FILEDIR
 
 
@@ -91,6 +95,34 @@ def test_EbasSQLRequest_make_query_str(kwargs: dict, output: str):
     assert req.make_query_str(**kwargs) == output
 
 
+@pytest.mark.parametrize(
+    "kwargs,output,params",
+    [
+        (
+            {"station_names": ["bla", "blub"], "datalevel": 2},
+            (
+                "select distinct filename from variable join station on "
+                "station.station_code=variable.station_code where "
+                "station_name in (?,?) and datalevel=?;"
+            ),
+            ("bla", "blub", 2),
+        ),
+        (
+            {"start_date": "2010-01-21", "altitude_range": [10, 21]},
+            (
+                "select distinct filename from variable join station on "
+                "station.station_code=variable.station_code where "
+                "station_altitude>? and station_altitude<? and last_start > ?;"
+            ),
+            (10, 21, "2010-01-21"),
+        ),
+    ],
+)
+def test_EbasSQLRequest_make_query(kwargs: dict, output: str, params: tuple):
+    req = EbasSQLRequest()
+    assert req.make_query(**kwargs) == (output, params)
+
+
 def test_EbasSQLRequest___str__():
     assert isinstance(str(EbasSQLRequest()), str)
 
@@ -188,3 +220,78 @@ table_comulns = dict(
 @pytest.mark.parametrize("table,column_names", table_comulns.items())
 def test_EbasFileIndex_get_column_names(ebas: EbasFileIndex, table: str, column_names: list[str]):
     assert ebas.get_table_columns(table) == column_names
+
+
+def test_EbasFileIndex_create_indexes(tmp_path: Path):
+    database = tmp_path / "ebas_file_index.sqlite3"
+    with sqlite3.connect(database) as con:
+        con.execute("create table station (station_code text, station_name text)")
+        con.execute(
+            "create table variable (station_code text, comp_name text, matrix text, "
+            "statistics text, filename text)"
+        )
+        con.execute("create table characteristic (var_id integer, ct_type text)")
+        con.execute("insert into station values ('NO0002R', 'Birkenes II')")
+    con.close()
+
+    ebas = EbasFileIndex(str(database))
+    ebas.create_indexes()
+    indexes = ebas.execute_request("select name from sqlite_master where type='index'")
+    assert len(indexes) == len(EbasFileIndex.INDEXES)
+    # read-only connection is shared between instances
+    assert ebas.con is EbasFileIndex(str(database)).con
+    assert ebas.ALL_STATION_NAMES == ["Birkenes II"]
+
+
+def test_EbasFileIndex_numpy_constraints(tmp_path: Path):
+    database = tmp_path / "ebas_file_index.sqlite3"
+    with sqlite3.connect(database) as con:
+        con.execute(
+            "create table station (station_code text, station_name text, "
+            "station_altitude real, station_longitude real, station_latitude real)"
+        )
+        con.execute(
+            "create table variable (var_id integer, station_code text, filename text, "
+            "datalevel integer)"
+        )
+        con.execute("create table characteristic (var_id integer, ct_type text)")
+        con.execute("insert into station values ('NO0002R', 'Birkenes II', 219, 8.25, 58.39)")
+        con.execute("insert into variable values (1, 'NO0002R', 'file.nas', 2)")
+    con.close()
+
+    ebas = EbasFileIndex(str(database))
+    req = EbasSQLRequest(
+        datalevel=np.int64(2),
+        altitude_range=np.array([100, 300]),
+        lat_range=(np.float32(50), np.float64(60)),
+    )
+    assert all(type(param) in (int, float) for param in req.make_query()[1])
+    assert ebas.get_file_names(req) == ["file.nas"]
+
+
+def test_check_ebas_db_local_vs_remote_indexes(tmp_path: Path):
+    remote = tmp_path / "remote.sqlite3"
+    local = tmp_path / "local.sqlite3"
+    with sqlite3.connect(remote) as con:
+        con.execute("create table station (station_code text, station_name text)")
+        con.execute(
+            "create table variable (station_code text, comp_name text, matrix text, "
+            "statistics text, filename text)"
+        )
+        con.execute("create table characteristic (var_id integer, ct_type text)")
+    con.close()
+
+    loc = _check_ebas_db_local_vs_remote(str(remote), str(local), create_indexes=True)
+    assert loc == str(local)
+    assert os.path.getmtime(local) == os.path.getmtime(remote)
+    assert list(tmp_path.glob("*.tmp")) == []
+    indexes = EbasFileIndex(loc).execute_request(
+        "select name from sqlite_master where type='index'"
+    )
+    assert len(indexes) == len(EbasFileIndex.INDEXES)
+
+    # up to date local copy is not modified
+    stat = os.stat(local)
+    _check_ebas_db_local_vs_remote(str(remote), str(local), create_indexes=True)
+    assert os.stat(local).st_mtime_ns == stat.st_mtime_ns
+    assert os.stat(local).st_ino == stat.st_ino
@@ -0,0 +1,45 @@
+import os
+import pickle
+
+import pytest
+
+from pyaerocom.io.ebas_header_cache import EbasHeaderCache
+from pyaerocom.io.ebas_nasa_ames import EbasColDef, EbasNasaAmesFile
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return EbasHeaderCache(str(tmp_path / "header_cache.sqlite3"))
+
+
+@pytest.fixture
+def nasa_ames_file(tmp_path):
+    path = tmp_path / "file.nas"
+    path.write_text("bla")
+    return str(path)
+
+
+def test_get_modified(cache: EbasHeaderCache, nasa_ames_file: str):
+    cache.put(nasa_ames_file, {})
+    assert cache.get(nasa_ames_file) == {}
+    stat = os.stat(nasa_ames_file)
+    os.utime(nasa_ames_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert cache.get(nasa_ames_file) is None
+
+
+def test_header_state():
+    file = EbasNasaAmesFile()
+    file.update(num_head_lines=20, station_code="NO0042G")
+    file._var_defs = [EbasColDef(name="starttime", is_var=False, is_flag=False, unit="days")]
+    file._data_header = ["starttime"]
+    file._data_offset = 1234
+    state = pickle.loads(pickle.dumps(file.get_header_state()))
+
+    other = EbasNasaAmesFile()
+    other.set_header_state(state)
+    assert other.num_head_lines == 20
+    assert other.meta == {"station_code": "NO0042G"}
+    assert isinstance(other.var_defs[0], EbasColDef)
+    assert other.var_defs[0].unit == "days"
+    assert other.data_header == ["starttime"]
+    assert other._data_offset == 1234
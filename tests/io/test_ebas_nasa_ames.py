@@ -34,6 +34,14 @@ def test_EbasFlagCol_decoded(raw_data, decoded):
     assert (dc == decoded).all()
 
 
+def test_EbasFlagCol_invalid_lookup():
+    fc = EbasFlagCol(np.asarray([0.0]))
+    lookup = fc.invalid_lookup
+    assert lookup.shape == (1000,)
+    for code, valid in fc.FLAG_INFO["valid"].items():
+        assert lookup[code] == (not valid)
+
+
 def test_NasaAmesHeader_NUM_FIXLINES(head):
     assert head._NUM_FIXLINES == 13
 
@@ -150,3 +158,22 @@ def test_EbasColDef_get_wavelength_nm_error(filedata):
     with pytest.raises(KeyError) as e:
         filedata.var_defs[0].get_wavelength_nm()
     assert str(e.value) == "'Column variable starttime does not contain wavelength information'"
+
+
+@pytest.mark.parametrize(
+    "block,shape,first_row",
+    [
+        ("0.0 0.5 1.25 0.0\n0.5 1.0 2.5 0.1\n", (2, 4), [0, 0.5, 1.25, 0]),
+        ("0.0 0.5 1.25 0.0\n0.5 1.0 x 0.1\n", (1, 4), [0, 0.5, 1.25, 0]),
+        ("0.0 0.5 1.25\n0.5 1.0 2.5 0.1\n0.6 1.1 2.5 0.1\n", (2, 4), [0.5, 1, 2.5, 0.1]),
+        ("0.0 0.5 1.25\n0.5 1.0 2.5 0.1 0.2\n0.6 1.1 2.5 0.1\n", (1, 4), [0.6, 1.1, 2.5, 0.1]),
+        ("", (0, 4), None),
+    ],
+)
+def test_EbasNasaAmesFile__read_data_block(block: str, shape: tuple, first_row):
+    file = EbasNasaAmesFile()
+    file._data_header = ["starttime", "endtime", "value", "flag"]
+    data = file._read_data_block(block)
+    assert data.shape == shape
+    if first_row is not None:
+        assert data[0].tolist() == first_row
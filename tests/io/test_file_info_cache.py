@@ -0,0 +1,14 @@
+import pytest
+
+from pyaerocom.io.file_info_cache import FileInfoCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return FileInfoCache(str(tmp_path / "file_info.sqlite3"))
+
+
+def test_get_fingerprint_changed(cache: FileInfoCache):
+    cache.put("bla", "1_2", {"year": 2010})
+    assert cache.get("bla", "1_2") == {"year": 2010}
+    assert cache.get("bla", "1_3") is None
@@ -0,0 +1,32 @@
+import gzip
+
+import pytest
+
+from pyaerocom.io.helpers import read_text_lines
+
+TEXT = "code,unit\r\nÖ1,µg/m3\n"
+
+
+@pytest.mark.parametrize("gzipped", [False, True])
+@pytest.mark.parametrize(
+    "file_encoding,encodings",
+    [
+        ("utf-8", (None, "UTF-16")),
+        ("utf-16", ("UTF-8", "UTF-16")),
+        ("iso-8859-1", ("UTF-8", "ISO-8859-1")),
+    ],
+)
+def test_read_text_lines(tmp_path, gzipped, file_encoding, encodings):
+    path = tmp_path / ("file.csv.gz" if gzipped else "file.csv")
+    opener = gzip.open if gzipped else open
+    with opener(path, "wb") as f:
+        f.write(TEXT.encode(file_encoding))
+    assert read_text_lines(path, encodings) == ["code,unit\n", "Ö1,µg/m3\n"]
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_read_text_lines_error(tmp_path):
+    path = tmp_path / "file.csv"
+    path.write_bytes(TEXT.encode("utf-16"))
+    with pytest.raises(UnicodeDecodeError):
+        read_text_lines(path, ("UTF-8",))
@@ -7,10 +7,12 @@ from typing import Type
 import numpy as np
 import pytest
 from iris import load
+from iris.coords import DimCoord
 from iris.cube import Cube, CubeList
 from iris.exceptions import TranslationError
 
 from pyaerocom.exceptions import (
+    DataExtractionError,
     FileConventionError,
     NetcdfError,
     TemporalResolutionError,
@@ -242,6 +244,48 @@ def test_load_cubes_custom(files, num_loaded):
     assert all(len(res) == num_loaded for res in result)
 
 
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_load_cubes_custom_parallel(use_processes: bool):
+    files = [TM5_FILE1, EMEP_FILE, TM5_FILE1]
+    cubes, loaded_files = iris_io.load_cubes_custom(
+        files, num_workers=2, use_processes=use_processes
+    )
+    assert loaded_files == [TM5_FILE1, TM5_FILE1]
+    assert len(cubes) == 2
+    assert all(isinstance(cube, Cube) for cube in cubes)
+
+
+def test_load_cubes_custom_parallel_old_iris(monkeypatch, caplog):
+    monkeypatch.setattr(iris_io, "_IRIS_THREAD_SAFE", False)
+    cubes, loaded_files = iris_io.load_cubes_custom(
+        [TM5_FILE1, TM5_FILE1], num_workers=2, use_processes=False
+    )
+    assert "using a process pool instead" in caplog.text
+    assert loaded_files == [TM5_FILE1, TM5_FILE1]
+
+
+def test_crop_cube():
+    cube = make_dummy_cube_3D_daily(daynum=10)
+    cube.data = cube.lazy_data()
+    cropped = iris_io.crop_cube(cube, lon_range=(-4, 4), lat_range=(1, 9))
+    assert cropped.shape == (10, 2, 2)
+    assert cropped.has_lazy_data()
+
+
+def test_crop_cube_levels():
+    cube = make_dummy_cube_3D_daily(daynum=10)
+    with pytest.raises(DataExtractionError):
+        iris_io.crop_cube(cube, levels=0)
+
+    levels = [1000.0, 900.0, 800.0]
+    cube = Cube(np.stack([cube.data * i for i in range(3)], axis=1), units="1")
+    cube.add_dim_coord(DimCoord(levels, var_name="lev", units="hPa"), 1)
+    assert iris_io.crop_cube(cube, levels=slice(0, 2)).shape == (10, 2, 12, 4)
+    surface = iris_io.crop_cube(cube, levels=0)
+    assert surface.shape == (10, 12, 4)
+    assert surface.coord("lev").points == [1000.0]
+
+
 def test_check_dim_coord_names_cube():
     iris_io.check_dim_coord_names_cube(aod_cube_only_longname_dims)
 
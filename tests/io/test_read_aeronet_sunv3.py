@@ -61,3 +61,37 @@ def test_get_od550lt1ang(reader):
     test_data = reader.read_file(file)
     test_data = np.where(test_data["ang4487aer"] < 1.0, test_data["od550aer"], np.nan)
     assert np.nanmean(data["od550lt1ang"]) == pytest.approx(np.nanmean(test_data), rel=1e-3)
+
+
+def test_read_file_data_block(tmp_path, caplog):
+    header = [
+        "AERONET Version 3;",
+        "Berlin",
+        "Version 3: AOD Level 2.0",
+        "The following data are automatically cloud cleared",
+        "Contact: PI=Some One; PI Email=some.one@example.com",
+        "Daily Averages,UNITS can be found at,,, https://aeronet.gsfc.nasa.gov",
+        "AERONET_Site,Date(dd:mm:yyyy),Time(hh:mm:ss),Day_of_Year,AOD_500nm,AOD_440nm,"
+        "440-870_Angstrom_Exponent,AERONET_Instrument_Number,Site_Latitude(Degrees),Site_Longitude(Degrees),"
+        "Site_Elevation(m),Data_Quality_Level",
+    ]
+    rows = [
+        "Berlin_FUB,01:02:2005,12:00:00,32,0.2,0.25,1.1,1234,52.4577,13.31,87.0,lev20",
+        "Berlin_FUB,02:02:2005,12:30:15,33,-999.,0.3,1.2,1234,52.4577,13.31,87.0,lev20",
+        "Berlin_FUB,03:02:2005,12:00:00,34,0.3",
+        "Berlin_FUB,04:02:2005,00:00:01,35,0.4,0.45,1.3,1234,52.4577,13.31,87.0,lev20",
+    ]
+    file = tmp_path / "Berlin_FUB.lev20"
+    file.write_text("\n".join(header + rows) + "\n")
+
+    data = ReadAeronetSunV3().read_file(str(file), vars_to_retrieve=["od500aer", "od440aer"])
+    assert "Skipping 1 of 4 data lines" in caplog.text
+    assert data.dtime.tolist() == [
+        np.datetime64("2005-02-01T12:00:00"),
+        np.datetime64("2005-02-02T12:30:15"),
+        np.datetime64("2005-02-04T00:00:01"),
+    ]
+    assert data.latitude.tolist() == [52.4577] * 3
+    assert data.station_name.tolist() == ["Berlin_FUB"] * 3
+    np.testing.assert_array_equal(data["od500aer"], [0.2, np.nan, 0.4])
+    np.testing.assert_array_equal(data["od440aer"], [0.25, 0.3, 0.45])
@@ -1,6 +1,7 @@
 import pytest
 
 from pyaerocom.io import ReadUngridded
+from pyaerocom.io.read_eea_aqerep_base import ReadEEAAQEREPBase
 from pyaerocom.stationdata import StationData
 from pyaerocom.ungriddeddata import UngriddedData
 
@@ -54,3 +55,27 @@ def test_read(reader):
             except:
                 print(f"failed test var {var_name}")
                 pass
+
+
+def test_read_multiple_vars(reader):
+    lowlevel_reader = reader.get_lowlevel_reader(DATA_ID)
+    single = lowlevel_reader.read(vars_to_retrieve=["concpm10"])
+    data = lowlevel_reader.read(vars_to_retrieve=["concpm10", "vmro3"])
+    assert isinstance(data, UngriddedData)
+    assert data.var_idx["concpm10"] == 0
+    is_pm10 = data._data[:, data._VARINDEX] == 0
+    assert is_pm10.sum() == len(single._data)
+
+
+def test__assign_vars_to_files():
+    # only works on file names, no need to initialise reader (data access)
+    lowlevel_reader = ReadEEAAQEREPBase.__new__(ReadEEAAQEREPBase)
+    files = [
+        "AT/AT_5_1_2019_timeseries.csv",
+        "AT/AT_7_1_2019_timeseries.csv",
+        "AT/AT_8_1_2019_timeseries.csv",
+    ]
+    file_masks = {var: lowlevel_reader.FILE_MASKS[var] for var in ["concpm10", "conco3", "vmro3"]}
+    files_out, file_kwargs = lowlevel_reader._assign_vars_to_files(files, file_masks)
+    assert files_out == files[:2]
+    assert file_kwargs == [dict(var_name=["concpm10"]), dict(var_name=["conco3", "vmro3"])]
@@ -8,6 +8,7 @@ import pytest
 
 from pyaerocom import GriddedData
 from pyaerocom.exceptions import VarNotAvailableError
+from pyaerocom.io.file_info_cache import FileInfoCache
 from pyaerocom.io.readgridded import ReadGridded
 from tests.conftest import TEST_RTOL, lustre_unavail
 from tests.fixtures.tm5 import TM5_DATA_PATH
@@ -174,6 +175,32 @@ def test_ReadGridded_years_avail(tmp_path: Path, years, expected):
     assert sorted(reader.years_avail) == expected
 
 
+def test_ReadGridded_file_info_cache(tmp_path: Path, monkeypatch):
+    cache = FileInfoCache(str(tmp_path / "file_info.sqlite3"))
+    monkeypatch.setattr(ReadGridded, "file_info_cache", cache)
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    for year in [2003, 2005]:
+        path = data_dir / f"aerocom3_TM5-met2010_AP3-CTRL2019_od550aer_Column_{year}_daily.nc"
+        path.write_text("")
+
+    reader = ReadGridded(data_dir=str(data_dir))
+
+    def evaluate_fileinfo(self, files):
+        raise AssertionError("file info should be loaded from cache")
+
+    with monkeypatch.context() as m:
+        m.setattr(ReadGridded, "_evaluate_fileinfo", evaluate_fileinfo)
+        cached = ReadGridded(data_dir=str(data_dir))
+    pd.testing.assert_frame_equal(cached.file_info, reader.file_info)
+    assert cached.data_id == reader.data_id == "TM5-met2010_AP3-CTRL2019"
+
+    # cache is invalidated if files are added to the directory
+    path = data_dir / "aerocom3_TM5-met2010_AP3-CTRL2019_od550aer_Column_2007_daily.nc"
+    path.write_text("")
+    assert sorted(ReadGridded(data_dir=str(data_dir)).years_avail) == [2003, 2005, 2007]
+
+
 def test_ReadGridded_get_var_info_from_files(reader_tm5: ReadGridded):
     info = reader_tm5.get_var_info_from_files()
     assert isinstance(info, dict)
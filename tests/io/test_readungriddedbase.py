@@ -80,3 +80,28 @@ def test_DummyReader_attrs_error(dummy_reader, key, exception, error: str):
     with pytest.raises(exception) as e:
         getattr(dummy_reader, key)
     assert str(e.value) == error
+
+
+class FileReader(DummyReader):
+    def read_file(self, filename, factor=1, offset=0):
+        if filename == "corrupt":
+            raise ValueError(filename)
+        return int(filename) * factor + offset
+
+
+@pytest.mark.parametrize("num_workers", [1, 3])
+def test_iter_read_files(num_workers):
+    reader = FileReader()
+    reader.num_workers = num_workers
+    files = ["1", "2", "corrupt", "4"]
+    file_kwargs = [dict(offset=i) for i in range(len(files))]
+    results = list(reader.iter_read_files(files, file_kwargs, factor=10))
+    assert [fn for fn, _ in results] == files
+    assert [result.get() for fn, result in results if fn != "corrupt"] == [10, 21, 43]
+    with pytest.raises(ValueError, match="corrupt"):
+        results[2][1].get()
+
+
+def test_iter_read_files_invalid_file_kwargs():
+    with pytest.raises(ValueError):
+        list(FileReader().iter_read_files(["1", "2"], [{}]))
@@ -0,0 +1,57 @@
+import os
+import pickle
+
+import pandas as pd
+import pytest
+
+from pyaerocom.io.sqlite_cache import SqliteCache
+
+
+class Cache(SqliteCache):
+    CHECK_COLUMNS = (("size", "integer"), ("fingerprint", "text"))
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return Cache(str(tmp_path / "cache.sqlite3"))
+
+
+def test_get_missing(cache: Cache):
+    assert cache.get("bla", (1, "a")) is None
+
+
+def test_put_get(cache: Cache):
+    value = {"data": pd.DataFrame({"var_name": ["od550aer"], "year": [2010]})}
+    cache.put("bla", value, (1, "a"))
+    pd.testing.assert_frame_equal(cache.get("bla", (1, "a"))["data"], value["data"])
+    assert cache.get("bla", (2, "a")) is None
+    assert cache.get("bla", (1, "b")) is None
+
+    # reconnects after pickling (e.g. in worker processes)
+    cache = pickle.loads(pickle.dumps(cache))
+    assert cache.get("bla", (1, "a")) is not None
+
+
+def test_get_version_changed(cache: Cache, monkeypatch):
+    cache.put("bla", {}, (1, "a"))
+    monkeypatch.setattr(Cache, "__version__", "2")
+    assert cache.get("bla", (1, "a")) is None
+
+
+def test_con_per_process(cache: Cache, monkeypatch):
+    con = cache.con
+    assert cache.con is con
+    # e.g. forked worker process
+    monkeypatch.setattr(os, "getpid", lambda: -1)
+    assert cache.con is not con
+    cache.close()
+    monkeypatch.undo()
+    assert cache.con is con
+
+
+def test_get_error(tmp_path, caplog):
+    cache = Cache(str(tmp_path))  # directory cannot be opened as database
+    assert cache.get("bla", (1, "a")) is None
+    cache.put("bla", {}, (1, "a"))
+    assert "Failed to access Cache" in caplog.text
+    assert "Failed to update Cache" in caplog.text
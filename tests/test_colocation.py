@@ -7,6 +7,7 @@ from cf_units import Unit
 from pyaerocom import GriddedData, const, helpers
 from pyaerocom.colocateddata import ColocatedData
 from pyaerocom.colocation import (
+    _check_batch_colocation,
     _colocate_site_data_helper,
     _colocate_site_data_helper_timecol,
     _regrid_gridded,
@@ -16,6 +17,7 @@ from pyaerocom.colocation import (
 from pyaerocom.config import ALL_REGION_NAME
 from pyaerocom.exceptions import UnresolvableTimeDefinitionError
 from pyaerocom.io import ReadMscwCtm
+from pyaerocom.tstype import TsType
 from tests.conftest import TEST_RTOL, need_iris_32
 from tests.fixtures.stations import create_fake_station_data
 
@@ -206,6 +208,56 @@ def test_colocate_gridded_ungridded(
     assert np.nanmean(coldata.data.data[1]) == pytest.approx(modmean, rel=TEST_RTOL)
 
 
+@pytest.mark.parametrize(
+    "ts_type,resample_how,colocate_time,use_climatology_ref,result",
+    [
+        ("monthly", None, False, False, True),
+        ("daily", "median", False, False, True),
+        ("monthly", {"monthly": {"daily": "max"}}, False, False, True),
+        ("monthly", "sum", False, False, False),
+        ("monthly", {"monthly": "mean"}, False, False, False),
+        ("3daily", None, False, False, False),
+        ("monthly", None, True, False, False),
+        ("monthly", None, False, True, False),
+    ],
+)
+def test__check_batch_colocation(
+    ts_type, resample_how, colocate_time, use_climatology_ref, result
+):
+    val = _check_batch_colocation(
+        TsType(ts_type), resample_how, colocate_time, use_climatology_ref
+    )
+    assert val == result
+
+
+@pytest.mark.parametrize(
+    "addargs",
+    [
+        dict(ts_type="monthly"),
+        dict(ts_type="monthly", min_num_obs=const.OBS_MIN_NUM_RESAMPLE),
+        dict(ts_type="yearly", resample_how="median"),
+        dict(filter_name=f"{ALL_REGION_NAME}-noMOUNTAINS", harmonise_units=False),
+    ],
+)
+def test_colocate_gridded_ungridded_batch(data_tm5, aeronetsunv3lev2_subset, addargs):
+    batch = colocate_gridded_ungridded(data_tm5, aeronetsunv3lev2_subset, **addargs)
+    loop = colocate_gridded_ungridded(
+        data_tm5, aeronetsunv3lev2_subset, batch_colocate=False, **addargs
+    )
+    assert batch.shape == loop.shape
+    np.testing.assert_array_equal(batch.data.data, loop.data.data)
+
+
+@pytest.mark.parametrize("batch_colocate", [True, False])
+def test_colocate_gridded_ungridded_chunksize(data_tm5, aeronetsunv3lev2_subset, batch_colocate):
+    kwargs = dict(ts_type="monthly", batch_colocate=batch_colocate)
+    full = colocate_gridded_ungridded(data_tm5, aeronetsunv3lev2_subset, **kwargs)
+    chunked = colocate_gridded_ungridded(data_tm5, aeronetsunv3lev2_subset, chunksize=3, **kwargs)
+    assert chunked.shape == full.shape
+    assert list(chunked.data.station_name.values) == list(full.data.station_name.values)
+    np.testing.assert_array_equal(chunked.data.data, full.data.data)
+
+
 def test_colocate_gridded_ungridded_nonglobal(aeronetsunv3lev2_subset):
     times = [1, 2]
     time_unit = Unit("days since 2010-1-1 0:0:0")
@@ -53,9 +53,11 @@ default_setup = {
     "harmonise_units": False,
     "regrid_res_deg": None,
     "colocate_time": False,
+    "station_chunksize": None,
     "reanalyse_existing": True,
     "raise_exceptions": False,
     "keep_data": True,
+    "num_workers": 1,
     "add_meta": {},
 }
 
@@ -286,6 +288,27 @@ def test_Colocator_run_gridded_ungridded(
     assert np.nanmean(coldata.data[1].values) == pytest.approx(mean_mod, abs=0.01)
 
 
+def test_Colocator_run_parallel(tm5_aero_stp, tmp_path: Path):
+    stp = ColocationSetup(**tm5_aero_stp)
+    stp.update(
+        model_add_vars={"od550aer": ["abs550aer"]},
+        basedir_coldata=str(tmp_path),
+        save_coldata=True,
+    )
+    col = Colocator(**stp)
+    result = col.run()
+
+    col_parallel = Colocator(**stp)
+    result_parallel = col_parallel.run(num_workers=2)
+
+    assert len(col_parallel.files_written) == 2
+    assert sorted(col_parallel.files_written) == sorted(col.files_written)
+    for mvar, ovar in (("od550aer", "od550aer"), ("abs550aer", "od550aer")):
+        coldata = result_parallel[mvar][ovar]
+        assert isinstance(coldata, ColocatedData)
+        np.testing.assert_array_equal(coldata.data.values, result[mvar][ovar].data.values)
+
+
 @pytest.mark.parametrize(
     "update,error",
     [
@@ -126,6 +126,63 @@ def test_GriddedData_resample_time(data_tm5: GriddedData):
     assert_allclose(yearly.mean(), 0.11865, rtol=TEST_RTOL)
 
 
+@pytest.fixture(scope="module")
+def data_hourly() -> GriddedData:
+    time = iris.coords.DimCoord(
+        np.arange(24 * 70), standard_name="time", units="hours since 2010-01-01 00:00:00"
+    )
+    lat = iris.coords.DimCoord([-10.0, 0.0, 10.0], standard_name="latitude", units="degrees")
+    lon = iris.coords.DimCoord([0.0, 20.0], standard_name="longitude", units="degrees")
+    arr = np.random.default_rng(42).random((24 * 70, 3, 2)).astype("float32")
+    arr = np.ma.masked_greater(arr, 0.9)
+    arr[30:50] = np.ma.masked
+    arr[:, 0, 0] = np.nan
+    cube = Cube(
+        arr, var_name="od550aer", units="1", dim_coords_and_dims=[(time, 0), (lat, 1), (lon, 2)]
+    )
+    return GriddedData(cube, ts_type="hourly", check_unit=False, convert_unit_on_init=False)
+
+
+@pytest.mark.parametrize(
+    "to_ts_type,how,min_num_obs",
+    [
+        ("daily", "mean", None),
+        ("daily", "max", None),
+        ("monthly", "mean", dict(monthly=dict(daily=25), daily=dict(hourly=18))),
+        ("monthly", "sum", 500),
+    ],
+)
+def test_GriddedData__resample_time_numpy(
+    data_hourly: GriddedData, to_ts_type: str, how: str, min_num_obs
+):
+    data = data_hourly._resample_time_numpy(to_ts_type, how, min_num_obs)
+    expected = data_hourly._resample_time_xarray(to_ts_type, how, min_num_obs)
+    assert data.ts_type == expected.ts_type == to_ts_type
+    assert data.shape == expected.shape
+    np.testing.assert_array_equal(data.time_stamps(), expected.time_stamps())
+    assert_allclose(
+        data.cube.data.filled(np.nan), expected.cube.data.filled(np.nan), rtol=1e-5, equal_nan=True
+    )
+
+
+def test_GriddedData__resample_time_numpy_error(data_hourly: GriddedData):
+    with pytest.raises(NotImplementedError):
+        data_hourly._resample_time_numpy("weekly", "mean", None)
+    weekly = data_hourly.resample_time("weekly")
+    assert weekly.ts_type == "weekly"
+
+
+def test_GriddedData_resample_time_lazy(data_hourly: GriddedData):
+    data = data_hourly.copy()
+    data.cube.data = data.cube.lazy_data().rechunk((24 * 7, 3, 2))
+    with pytest.raises(NotImplementedError):
+        data._resample_time_numpy("daily", "mean", None)
+    daily = data.resample_time("daily")
+    assert daily.ts_type == "daily"
+    assert daily.cube.has_lazy_data()
+    assert data.cube.has_lazy_data()
+
+
 def test_GriddedData_interpolate(data_tm5: GriddedData):
     data = data_tm5.interpolate(latitude=TESTLATS, longitude=TESTLONS)
 
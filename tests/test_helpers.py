@@ -130,6 +130,47 @@ def test_resample_timeseries(fake_hourly_ts, freq, how, min_num_obs, num, avg):
     assert np.nanmean(s1) == pytest.approx(avg, abs=1e-2, nan_ok=True)
 
 
+@pytest.mark.parametrize(
+    "freq,how,min_num_obs",
+    [
+        ("hourly", "mean", None),
+        ("daily", "mean", None),
+        ("daily", "sum", None),
+        ("daily", "max", 20),
+        ("daily", "min", 23),
+        ("monthly", "mean", 100),
+        ("yearly", "sum", None),
+    ],
+)
+def test_resample_time_ndarray(fake_hourly_ts, freq, how, min_num_obs):
+    ts = fake_hourly_ts.copy()
+    ts[30:60] = np.nan
+    arr = xr.DataArray(ts.values, dims="time", coords=dict(time=ts.index))
+    expected = helpers.resample_time_dataarray(arr, freq=freq, how=how, min_num_obs=min_num_obs)
+    vals, times = helpers.resample_time_ndarray(
+        ts.values, ts.index.values, freq=freq, how=how, min_num_obs=min_num_obs
+    )
+    np.testing.assert_allclose(vals, expected.data, equal_nan=True)
+    np.testing.assert_array_equal(times, expected.time.data)
+
+
+def test_resample_time_ndarray_masked():
+    time = pd.date_range("2018-01-01", "2018-01-05", freq="h", inclusive="left")
+    data = np.ma.masked_array(np.ones((len(time), 2)), dtype="float32")
+    data[:12, 0] = np.ma.masked
+    data[30:, 1] = np.nan
+    vals, _ = helpers.resample_time_ndarray(data, time.values, "daily", "sum", min_num_obs=12)
+    assert vals.dtype == np.float32
+    np.testing.assert_array_equal(vals, [[12, 24], [24, np.nan], [24, np.nan], [24, np.nan]])
+
+
+@pytest.mark.parametrize("freq,how", [("weekly", "mean"), ("3daily", "mean"), ("daily", "median")])
+def test_resample_time_ndarray_error(fake_hourly_ts, freq, how):
+    assert not helpers.can_resample_time_ndarray(freq, how)
+    with pytest.raises(NotImplementedError):
+        helpers.resample_time_ndarray(fake_hourly_ts.values, fake_hourly_ts.index, freq, how)
+
+
 def test_same_meta_dict():
     d1 = dict(
         station_name="bla", station_id="blub", latitude=33, longitude=15, altitude=400, PI="pi1"
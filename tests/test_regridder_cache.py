@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import iris
+import numpy as np
+import pytest
+
+from pyaerocom import GriddedData, const, regridder_cache
+from pyaerocom.helpers import make_dummy_cube_latlon
+from pyaerocom.regridder_cache import get_regridder
+
+
+@pytest.fixture
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(regridder_cache, "_REGRIDDERS", regridder_cache.OrderedDict())
+    monkeypatch.setattr(const, "REGRID_CACHE_TO_DISK", False)
+
+
+def test_get_regridder(empty_cache, monkeypatch):
+    src = make_dummy_cube_latlon(lat_res_deg=2, lon_res_deg=2)
+    tgt = make_dummy_cube_latlon(lat_res_deg=5, lon_res_deg=5)
+    scheme = iris.analysis.AreaWeighted()
+    regridder = get_regridder(scheme, src, tgt)
+    assert get_regridder(iris.analysis.AreaWeighted(), src.copy(), tgt.copy()) is regridder
+    assert get_regridder(iris.analysis.AreaWeighted(mdtol=0.5), src, tgt) is not regridder
+    assert get_regridder(scheme, tgt, src) is not regridder
+
+    monkeypatch.setattr(regridder_cache, "MAX_CACHED_REGRIDDERS", 2)
+    get_regridder(iris.analysis.Linear(), src, tgt)
+    assert len(regridder_cache._REGRIDDERS) == 2
+    assert get_regridder(scheme, src, tgt) is not regridder
+
+
+def test_get_regridder_not_cacheable(empty_cache):
+    class Scheme:
+        def regridder(self, src, tgt):
+            return object()
+
+    src = make_dummy_cube_latlon(lat_res_deg=2, lon_res_deg=2)
+    tgt = make_dummy_cube_latlon(lat_res_deg=5, lon_res_deg=5)
+    assert get_regridder(Scheme(), src, tgt) is not get_regridder(Scheme(), src, tgt)
+    assert len(regridder_cache._REGRIDDERS) == 0
+
+
+def test_get_regridder_disk(empty_cache, monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(const, "REGRID_CACHE_TO_DISK", True)
+    monkeypatch.setattr(const, "_caching_active", True)
+    monkeypatch.setattr(const, "_cache_basedir", str(tmp_path))
+    src = make_dummy_cube_latlon(lat_res_deg=2, lon_res_deg=2)
+    tgt = make_dummy_cube_latlon(lat_res_deg=5, lon_res_deg=5)
+    regridder = get_regridder(iris.analysis.AreaWeighted(), src, tgt)
+    assert len(list(tmp_path.glob(f"*/{regridder_cache.CACHE_SUBDIR}/*.pkl"))) == 1
+
+    def regridder_fail(*args, **kwargs):
+        raise AssertionError("regridder should be loaded from disk")
+
+    regridder_cache._REGRIDDERS.clear()
+    monkeypatch.setattr(iris.analysis.AreaWeighted, "regridder", regridder_fail)
+    cached = get_regridder(iris.analysis.AreaWeighted(), src, tgt)
+    assert cached is not regridder
+    assert isinstance(cached, type(regridder))
+
+
+def test_GriddedData_regrid_cached(empty_cache):
+    data = GriddedData(make_dummy_cube_latlon(lat_res_deg=2, lon_res_deg=2))
+    data.grid.data = np.random.default_rng(42).random(data.shape)
+    first = data.regrid(lat_res_deg=10, lon_res_deg=10)
+    second = data.regrid(lat_res_deg=10, lon_res_deg=10)
+    assert len(regridder_cache._REGRIDDERS) == 1
+
+    tgt = make_dummy_cube_latlon(lat_res_deg=10, lon_res_deg=10)
+    expected = data.grid.regrid(tgt, iris.analysis.AreaWeighted())
+    np.testing.assert_allclose(first.grid.data, expected.data)
+    np.testing.assert_allclose(second.grid.data, expected.data)
@@ -0,0 +1,102 @@
+import dask.array as da
+import numpy as np
+import pytest
+import xarray as xr
+
+from pyaerocom import station_sampler
+from pyaerocom.exceptions import DataCoverageError
+from pyaerocom.helpers import extract_latlon_dataarray
+from pyaerocom.station_sampler import BilinearStationSampler, StationSampler, get_station_sampler
+
+
+@pytest.fixture(scope="module")
+def fake_arr():
+    lat = np.arange(89.5, -90, -1.0)
+    lon = np.arange(-179.5, 180, 1.0)
+    data = np.random.default_rng(42).random((3, len(lat), len(lon)))
+    return xr.DataArray(
+        data, dims=("time", "lat", "lon"), coords=dict(time=np.arange(3), lat=lat, lon=lon)
+    )
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_StationSampler(fake_arr, lazy: bool):
+    rng = np.random.default_rng(0)
+    lat = rng.uniform(-95, 95, 200)
+    lon = rng.uniform(-185, 185, 200)
+    lat[:3] = [0, 0.5, -89.5]
+
+    expected = extract_latlon_dataarray(fake_arr, lat, lon, method="nearest")
+    sampler = StationSampler(fake_arr.lat.data, fake_arr.lon.data, lat, lon)
+    data = fake_arr.data
+    if lazy:
+        data = da.from_array(data, chunks=(1, 45, 90))
+    assert len(sampler) == expected.shape[-1]
+    assert np.array_equal(sampler.sample(data), expected.data)
+    assert np.array_equal(sampler.latitude, expected.lat.data)
+    assert np.array_equal(sampler.longitude, expected.lon.data)
+
+
+def test_StationSampler_error(fake_arr):
+    with pytest.raises(DataCoverageError):
+        StationSampler(fake_arr.lat.data, fake_arr.lon.data, [95], [0])
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_BilinearStationSampler(fake_arr, lazy: bool):
+    # field that is linear in latitude and longitude is reproduced exactly
+    grid_lat, grid_lon = fake_arr.lat.data, fake_arr.lon.data
+    data = np.broadcast_to(2 * grid_lat[:, None] + 0.5 * grid_lon[None, :], (2, 180, 360))
+    if lazy:
+        data = da.from_array(data, chunks=(1, 45, 90))
+    lat = [0.0, 10.3, -89.5, 89.5, 95]
+    lon = [0.0, -20.1, 179.5, -179.5, 0]
+    sampler = BilinearStationSampler(grid_lat, grid_lon, lat, lon)
+    assert len(sampler) == 4
+    expected = 2 * np.asarray(lat[:4]) + 0.5 * np.asarray(lon[:4])
+    np.testing.assert_allclose(sampler.sample(data), [expected] * 2)
+    np.testing.assert_allclose(sampler.weights.sum(axis=0), 1)
+
+
+def test_BilinearStationSampler_circular(fake_arr):
+    grid_lat, grid_lon = fake_arr.lat.data, fake_arr.lon.data
+    with pytest.raises(DataCoverageError):
+        BilinearStationSampler(grid_lat, grid_lon, [0], [179.8])
+    sampler = BilinearStationSampler(grid_lat, grid_lon, [0, 0], [179.8, -180], lon_circular=True)
+    data = fake_arr.data
+    # longitude 179.8 is between 179.5 (weight 0.7) and -179.5 (weight 0.3)
+    first = 0.7 * data[:, 89:91, -1].mean(axis=1) + 0.3 * data[:, 89:91, 0].mean(axis=1)
+    second = data[:, 89:91, [-1, 0]].mean(axis=(1, 2))
+    np.testing.assert_allclose(sampler.sample(data), np.stack([first, second], axis=1))
+
+
+def test_BilinearStationSampler_invalid(fake_arr):
+    grid_lat, grid_lon = fake_arr.lat.data, fake_arr.lon.data
+    data = np.ma.masked_array(fake_arr.data.copy())
+    data[:, 90, 180] = np.ma.masked
+    data[:, 80, 100] = np.nan
+    # stations on and next to invalid grid points
+    lat = [-0.5, 0.5, 0, 9.5, 10]
+    lon = [0.5, 1.5, 1, -80.5, -79.5]
+    result = BilinearStationSampler(grid_lat, grid_lon, lat, lon).sample(data)
+    assert isinstance(result, np.ma.MaskedArray)
+    np.testing.assert_equal(result.mask, [[True, False, True, False, False]] * 3)
+    np.testing.assert_allclose(result[:, 1], data.data[:, 89, 181])
+    np.testing.assert_allclose(result[:, 3], data.data[:, 80, 99])
+    assert np.isnan(result[:, 4].data).all()
+
+
+def test_get_station_sampler(fake_arr, monkeypatch):
+    monkeypatch.setattr(station_sampler, "_SAMPLERS", station_sampler.OrderedDict())
+    monkeypatch.setattr(station_sampler, "MAX_CACHED_SAMPLERS", 2)
+    args = (fake_arr.lat.data, fake_arr.lon.data)
+    sampler = get_station_sampler(*args, [10, 20], [30, 40])
+    assert get_station_sampler(*args, np.array([10.0, 20.0]), (30, 40)) is sampler
+    assert get_station_sampler(*args, [10, 20], [30, 41]) is not sampler
+    get_station_sampler(*args, [10], [30])
+    get_station_sampler(*args, [10, 20], [30, 40])
+    assert len(station_sampler._SAMPLERS) == 2
+    linear = get_station_sampler(*args, [10, 20], [30, 40], scheme="linear")
+    assert isinstance(linear, BilinearStationSampler)
+    with pytest.raises(ValueError):
+        get_station_sampler(*args, [10, 20], [30, 40], scheme="cubic")
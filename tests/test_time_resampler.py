@@ -47,13 +47,14 @@ def test_TimeResampler_invalid_input_data(data):
     tr = TimeResampler()
     with pytest.raises(ValueError) as e:
         tr.input_data = data
-    assert str(e.value) == "Invalid input: need Series or DataArray"
+    assert str(e.value) == "Invalid input: need Series, DataFrame or DataArray"
 
 
 @pytest.mark.parametrize(
     "data,resampler_function",
     [
         pytest.param(pd.Series(dtype=np.float64), resample_timeseries, id="pd.Series"),
+        pytest.param(pd.DataFrame(dtype=np.float64), resample_timeseries, id="pd.DataFrame"),
         pytest.param(xr.DataArray(), resample_time_dataarray, id="xr.DataArray"),
     ],
 )
@@ -143,6 +144,30 @@ def test_TimeResampler__gen_index(kwargs, index):
     assert tr._gen_idx(**kwargs) == index
 
 
+@pytest.mark.parametrize(
+    "kwargs,steps,lup",
+    [
+        (dict(to_ts_type="daily", from_ts_type="hourly"), [("D", None, "mean")], True),
+        (dict(to_ts_type="daily", from_ts_type="daily", how="sum"), [("D", None, "mean")], True),
+        (dict(to_ts_type="monthly", how="max"), [("MS", None, "max")], True),
+        (
+            dict(
+                to_ts_type="monthly",
+                from_ts_type="hourly",
+                how=dict(daily=dict(hourly="sum")),
+                min_num_obs=min_num_obs_default,
+            ),
+            [("D", 6, "sum"), ("MS", 7, "mean")],
+            False,
+        ),
+    ],
+)
+def test_TimeResampler_gen_resample_steps(kwargs, steps, lup):
+    tr = TimeResampler()
+    assert tr.gen_resample_steps(**kwargs) == steps
+    assert tr.last_units_preserved == lup
+
+
 @pytest.mark.parametrize(
     "kwargs,output_len,output_numnotnan,lup",
     [
@@ -248,3 +273,15 @@ def test_TimeResampler_resample(fakedata_hourly, kwargs, output_len, output_numn
     notnan = ~np.isnan(ts)
     assert notnan.sum() == output_numnotnan
     assert tr.last_units_preserved == lup
+
+
+@pytest.mark.parametrize("how", ["mean", "max"])
+def test_TimeResampler_resample_dataframe(fakedata_hourly, how):
+    columns = [fakedata_hourly, fakedata_hourly[30:200]]
+    kwargs = dict(
+        to_ts_type="daily", from_ts_type="hourly", how=how, min_num_obs=min_num_obs_custom
+    )
+    df = TimeResampler(pd.concat(columns, axis=1)).resample(**kwargs)
+    for i, ts in enumerate(columns):
+        expected = TimeResampler(ts).resample(**kwargs).reindex(df.index)
+        np.testing.assert_array_equal(df[i].values, expected.values)
@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from pyaerocom import UngriddedData
+from pyaerocom.ungridded_columnar import FILL_VALUES, ColumnarArray
+
+
+@pytest.fixture
+def index():
+    return UngriddedData()._init_index()
+
+
+@pytest.fixture
+def dense(index):
+    arr = np.full((5, len(index)), np.nan)
+    arr[:, index["meta"]] = [0, 0, 1, 1, np.nan]
+    arr[:, index["time"]] = np.arange(5) * 3600 + 1e9
+    arr[:, index["varidx"]] = [0, 1, 0, 1, 1]
+    arr[:, index["data"]] = [0.5, np.nan, 1.5, 2.5, 3.5]
+    arr[:, index["dataflag"]] = [0, 1, 0, np.nan, 1]
+    return arr
+
+
+def test_ColumnarArray___init__(index):
+    arr = ColumnarArray(10, index)
+    assert arr.shape == (10, len(index))
+    assert len(arr) == 10
+    assert arr.nbytes == 0
+    assert np.isnan(arr[:, index["meta"]]).all()
+    assert arr.dtypes[index["meta"]] == np.int32
+    assert arr.dtypes[index["time"]] == np.int64
+    assert arr.dtypes[index["data"]] == np.float32
+    assert arr.dtypes[index["dataflag"]] == np.uint8
+
+
+def test_ColumnarArray_from_array(index, dense):
+    arr = ColumnarArray.from_array(dense, index)
+    np.testing.assert_array_equal(np.asarray(arr), dense)
+    # only columns that contain data are allocated
+    assert arr.nbytes == 5 * (4 + 8 + 4 + 4 + 1)
+    assert arr.column(index["meta"])[-1] == FILL_VALUES[np.dtype(np.int32)]
+
+
+def test_ColumnarArray_from_array_error(index):
+    with pytest.raises(ValueError):
+        ColumnarArray.from_array(np.ones((5, 2)), index)
+
+
+def test_ColumnarArray_getitem(index, dense):
+    arr = ColumnarArray.from_array(dense, index)
+    np.testing.assert_array_equal(arr[1:3, index["data"]], dense[1:3, index["data"]])
+    np.testing.assert_array_equal(arr[[0, 4], index["meta"]], dense[[0, 4], index["meta"]])
+    np.testing.assert_array_equal(arr[3], dense[3])
+    sub = arr[arr[:, index["varidx"]] == 1]
+    assert isinstance(sub, ColumnarArray)
+    np.testing.assert_array_equal(np.asarray(sub), dense[dense[:, index["varidx"]] == 1])
+
+
+def test_ColumnarArray_setitem(index, dense):
+    arr = ColumnarArray(5, index)
+    arr[:] = dense
+    arr[2:4, index["data"]] = np.nan
+    dense[2:4, index["data"]] = np.nan
+    arr[0, index["meta"]] = np.nan
+    dense[0, index["meta"]] = np.nan
+    arr[:, index["trash"]] = 1.1
+    dense[:, index["trash"]] = 1.1
+    np.testing.assert_allclose(np.asarray(arr), dense, rtol=1e-6)
+
+    # assigning NaN to a full column frees it
+    arr[:, index["trash"]] = np.nan
+    assert arr.dtypes[index["trash"]] == np.float32
+    assert arr.column(index["trash"]).shape == (5,)
+    assert arr._columns[index["trash"]] is None
+
+
+def test_ColumnarArray_setitem_datetime64(index):
+    arr = ColumnarArray(2, index)
+    dtime = np.asarray(["2010-01-01", "NaT"], dtype="datetime64[s]")
+    arr[:, index["time"]] = dtime
+    assert arr[0, index["time"]] == dtime[0].astype(np.int64)
+    assert np.isnan(arr[1, index["time"]])
+
+
+def test_ColumnarArray_concatenate(index, dense):
+    arr = ColumnarArray.from_array(dense, index)
+    new = ColumnarArray.concatenate([arr, dense, ColumnarArray(3, index)])
+    assert new.shape == (13, len(index))
+    np.testing.assert_array_equal(np.asarray(new)[:10], np.vstack([dense, dense]))
+    assert np.isnan(np.asarray(new)[10:]).all()
+
+
+def test_ColumnarArray_take(index, dense):
+    arr = ColumnarArray.from_array(dense, index)
+    sub = arr.take([4, 0, 2], axis=0)
+    assert isinstance(sub, ColumnarArray)
+    np.testing.assert_array_equal(np.asarray(sub), dense.take([4, 0, 2], axis=0))
+    with pytest.raises(ValueError):
+        arr.take([0], axis=1)
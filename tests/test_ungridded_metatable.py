@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from pyaerocom import UngriddedData
+from pyaerocom.ungridded_metatable import MetaTable, StationIndex
+
+
+@pytest.fixture
+def metadata():
+    meta = {
+        0.0: dict(
+            station_name="Oslo", country="Norway", altitude=94, data_level=2, tags=["a", "b"]
+        ),
+        1.0: dict(station_name="Ostrava", country="Czechia", altitude=260, data_level=2),
+        2.0: dict(station_name="Paris", country="France", altitude=np.nan),
+        3.0: dict(station_name="Bergen", country=None, altitude=12, data_level=1),
+        4.0: dict(station_name="Tromsø", country="Norway", altitude=100, tags="a"),
+    }
+    for block in meta.values():
+        block["var_info"] = {}
+    return meta
+
+
+def test_MetaTable_column(metadata):
+    table = MetaTable(metadata)
+    col = table.column("data_level")
+    assert col.has_key.tolist() == [True, True, False, True, False]
+    assert col.is_num.tolist() == [True, True, False, True, False]
+    col = table.column("country")
+    assert col.is_str.tolist() == [True, True, True, False, True]
+    assert col.isin_str(["Norway"]).tolist() == [True, False, False, False, True]
+    assert col.match_wildcards(["*r*"]).tolist() == [True, False, True, False, True]
+    assert table.column("country") is col
+
+
+def test_MetaTable_is_valid(metadata):
+    table = MetaTable(metadata)
+    assert table.is_valid(metadata)
+    assert not table.is_valid(dict(metadata))
+    metadata[5.0] = dict(station_name="Rome")
+    assert not table.is_valid(metadata)
+
+
+@pytest.mark.parametrize(
+    "filters,negate,matches",
+    [
+        (dict(station_name="Os*"), None, [0.0, 1.0]),
+        (dict(station_name="Os*"), "station_name", [2.0, 3.0, 4.0]),
+        (dict(station_name=["Paris", "B*"]), None, [2.0, 3.0]),
+        (dict(country="Norway"), "country", [1.0, 2.0, 3.0]),
+        (dict(altitude=[0, 100]), None, [0.0, 3.0, 4.0]),
+        (dict(altitude=[0, 100]), "altitude", [1.0, 2.0]),
+        (dict(data_level=2, country="*a*"), None, [0.0, 1.0]),
+        (dict(tags=["a", "b"]), None, [0.0, 4.0]),
+        (dict(tags=["b"]), "tags", [0.0, 4.0]),
+    ],
+)
+def test_MetaTable_find_matches(metadata, filters, negate, matches):
+    data = UngriddedData(num_points=1)
+    data.metadata = metadata
+    data.meta_idx = {idx: {} for idx in metadata}
+    flts = data._init_meta_filters(**filters)
+    mask = MetaTable(metadata).find_matches([] if negate is None else [negate], *flts)
+    assert [idx for idx, ok in zip(metadata, mask) if ok] == matches
+    assert data._find_meta_matches(negate, *flts)[0] == matches
+
+
+def test_StationIndex(metadata):
+    index = StationIndex(metadata)
+    assert index.is_valid(metadata)
+    assert index.find("Oslo") == [0.0]
+    assert index.find("Rome") == []
+    assert index.find_wildcards("O*") == [0.0, 1.0]
+    assert index.find_wildcards("Bergen") == [3.0]
+
+    metadata[5.0] = dict(station_name="Oslo")
+    assert not index.is_valid(metadata)
+    index.add(5.0, metadata[5.0])
+    assert index.is_valid(metadata)
+    assert index.find("Oslo") == [0.0, 5.0]
@@ -239,3 +239,151 @@ def test_from_single_station_data():
     data0 = stat.ec550aer
     data1 = d.all_datapoints_var("ec550aer")
     assert data0 == pytest.approx(data1, abs=1e-20)
+
+
+def test_init_columnar():
+    d = UngriddedData(num_points=2, add_cols=["bla"], columnar=True)
+    assert d.is_columnar
+    assert d.shape == (2, 13)
+
+
+@pytest.mark.parametrize("columnar", [True, False])
+def test_from_station_data_columnar(monkeypatch, columnar):
+    monkeypatch.setattr(ungriddeddata.const, "UNGRIDDED_COLUMNAR_STORAGE", columnar)
+    stat = FAKE_STATION_DATA["station_data1"]
+    d = ungriddeddata.UngriddedData.from_station_data(stat)
+    assert d.is_columnar == columnar
+    data1 = d.all_datapoints_var("ec550aer")
+    assert stat.ec550aer == pytest.approx(data1, rel=1e-6)
+
+    stat1 = d.to_station_data(0, "ec550aer")
+    assert stat1.ec550aer.values == pytest.approx(stat.ec550aer, rel=1e-6)
+
+    subset = d.extract_var("od550aer")
+    assert subset.is_columnar == columnar
+    assert subset.copy().is_columnar == columnar
+
+
+def test_meta_table():
+    stats = [FAKE_STATION_DATA["station_data1"], FAKE_STATION_DATA["station_data1"]]
+    d = UngriddedData.from_station_data(stats)
+    table = d.meta_table
+    assert d.meta_table is table
+    assert len(table) == 2
+
+    d.metadata[1.0]["station_name"] = "other"
+    d._reset_meta_cache()
+    subset = d.filter_by_meta(station_name="oth*")
+    assert len(subset.metadata) == 1
+    assert subset.meta_table is not table
+
+
+def test_meta_cache_check_set_country(monkeypatch):
+    stats = [FAKE_STATION_DATA["station_data1"], FAKE_STATION_DATA["station_data1"]]
+    d = UngriddedData.from_station_data(stats)
+    for meta in d.metadata.values():
+        meta["country"] = None
+    table, index = d.meta_table, d.station_index
+
+    info = dict(country="Norway", country_code="NO")
+    monkeypatch.setattr(
+        "pyaerocom.ungriddeddata.get_country_info_coords", lambda coords: [info] * len(coords)
+    )
+    d.check_set_country()
+    assert d.meta_table is not table
+    assert d.station_index is not index
+    assert len(d.filter_by_meta(country="Norway").metadata) == 2
+
+
+def test_station_index():
+    stats = [FAKE_STATION_DATA["station_data1"].copy(), FAKE_STATION_DATA["station_data2"].copy()]
+    stats[1].station_name = "other station"
+    d = UngriddedData.from_station_data(stats)
+    index = d.station_index
+    assert d.station_index is index
+    assert d.find_station_meta_indices("other*") == [1.0]
+
+    d.append(UngriddedData.from_station_data(stats[1]))
+    assert d.station_index is index
+    assert d.find_station_meta_indices("other station", allow_wildcards=False) == [1.0, 2.0]
+
+    subset = d.filter_by_meta(station_name="other*")
+    assert dict(subset.station_index) == {"other station": [0.0, 1.0]}
+
+
+def test_filter_by_meta_data_blocks():
+    stats = [FAKE_STATION_DATA["station_data1"], FAKE_STATION_DATA["station_data2"]]
+    d = UngriddedData.from_station_data(stats)
+    subset = d.filter_by_meta(data_level=3)
+    subset._check_index()
+    assert list(subset.metadata) == [0.0]
+    for var, idx in subset.meta_idx[0.0].items():
+        np.testing.assert_array_equal(
+            subset._data[idx, subset._DATAINDEX], d._data[d.meta_idx[1.0][var], d._DATAINDEX]
+        )
+
+    conco3 = d.extract_var("conco3")
+    assert conco3.shape == (277, 12)
+    assert np.unique(conco3._data[:, conco3._METADATAKEYINDEX]).tolist() == [0]
+    np.testing.assert_array_equal(conco3.all_datapoints_var("conco3"), np.arange(277))
+    conco3.add_chunk()
+    assert conco3.shape == (554, 12)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(vars_to_convert="ec550aer"),
+        dict(vars_to_convert=["ec550aer", "od550aer"], by_station_name=False),
+        dict(vars_to_convert="ec550aer", start=2007, stop=2008, freq="monthly"),
+        dict(vars_to_convert="conco3", start=2001),
+    ],
+)
+def test_to_station_data_all(kwargs):
+    stats = [FAKE_STATION_DATA["station_data1"], FAKE_STATION_DATA["station_data2"].copy()]
+    stats[1].station_name = "other station"
+    d = UngriddedData.from_station_data(stats)
+    result = d.to_station_data_all(**kwargs)
+
+    by_station_name = kwargs.pop("by_station_name", True)
+    keys = d.unique_station_names if by_station_name else list(d.metadata)
+    expected = []
+    for key in keys:
+        try:
+            expected.append(d.to_station_data(key, **kwargs))
+        except DataCoverageError:
+            pass
+    assert len(result["stats"]) == len(expected)
+    for stat, stat_exp in zip(result["stats"], expected):
+        assert stat.station_name == stat_exp.station_name
+        for var in stat_exp.var_info:
+            if var in stat_exp:
+                assert stat[var].equals(stat_exp[var])
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, 3])
+def test_iter_station_data(chunksize):
+    stats = [
+        FAKE_STATION_DATA["station_data1"],
+        FAKE_STATION_DATA["station_data2"].copy(),
+        FAKE_STATION_DATA["station_data1"].copy(),
+    ]
+    stats[1].station_name = "other station"
+    stats[2].station_name = "third station"
+    d = UngriddedData.from_station_data(stats)
+    chunks = list(d.iter_station_data("ec550aer", chunksize=chunksize))
+    assert len(chunks) == int(np.ceil(3 / chunksize))
+    assert all(len(chunk["stats"]) <= chunksize for chunk in chunks)
+
+    expected = d.to_station_data_all("ec550aer")
+    names = [name for chunk in chunks for name in chunk["station_name"]]
+    assert names == expected["station_name"]
+    result = [stat for chunk in chunks for stat in chunk["stats"]]
+    for stat, stat_exp in zip(result, expected["stats"]):
+        assert stat["ec550aer"].equals(stat_exp["ec550aer"])
+
+
+def test_iter_station_data_invalid_chunksize():
+    d = UngriddedData.from_station_data(FAKE_STATION_DATA["station_data1"])
+    with pytest.raises(ValueError):
+        next(d.iter_station_data(chunksize=0))